@@ -10,6 +10,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 
 from app.database import engine
 from app.models import Pobuda
+from app.stats_rollup import apply_rollup, collect_rollup, new_rollup_deltas
 
 SAMPLE_RESPONSES = [
     "Hvala za vašo pobudo. Obravnavamo problem in bomo poskusili najti rešitev. V primeru dodatnih vprašanj vas prosimo, da nas kontaktirate.",
@@ -57,16 +58,20 @@ def adjust_statuses():
         
         
         updated_count = 0
+        deltas = new_rollup_deltas()
         for pobuda in pobude_to_respond:
+            collect_rollup(deltas, pobuda, -1)
             pobuda.status = "odgovorjeno"
             pobuda.response = random.choice(SAMPLE_RESPONSES)
             
             days_ago = random.randint(1, 30)
             pobuda.responded_at = datetime.utcnow() - timedelta(days=days_ago)
+            collect_rollup(deltas, pobuda)
             session.add(pobuda)
             updated_count += 1
         
         
+        apply_rollup(session, deltas)
         session.commit()
         
         print(f"✅ Successfully updated {updated_count} pobudes to 'odgovorjeno'")
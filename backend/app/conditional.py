@@ -0,0 +1,108 @@
+"""
+Conditional GET for JSON endpoints.
+
+Every insert, update and delete on pobuda bumps a row in change_version
+through triggers, so the API, the importers, the background workers and any
+other process all advance it without cooperating; code that rewrites the
+statistics rollup on its own bumps its version with bump_version().
+pobuda.updated_at moves with every ORM or Core update of a row. Endpoints
+derive ETags from these and answer a matching If-None-Match with 304 after
+reading one indexed row, before running their real query.
+
+Validation is by ETag only. HTTP dates have one-second precision, so
+Last-Modified is not sent and If-Modified-Since is ignored: two changes
+within a second would otherwise leave a client with a stale copy.
+"""
+
+import hashlib
+from typing import Optional
+from fastapi import Request, Response
+from sqlalchemy import bindparam, text
+
+VERSION_TABLE = "change_version"
+# Tables whose writes bump their version through triggers
+TRACKED_TABLES = ("pobuda",)
+# Versions bumped with bump_version() by the code that rewrites them
+STATS_VERSION = "pobuda_stats_daily"
+VERSIONS = TRACKED_TABLES + (STATS_VERSION,)
+# Clients may keep responses but must revalidate them on every use
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+_CREATE_VERSION_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL
+)
+"""
+
+def _triggers(table: str):
+    bump = (
+        f"UPDATE {VERSION_TABLE} SET version = version + 1, updated_at = CURRENT_TIMESTAMP "
+        f"WHERE name = '{table}';"
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {VERSION_TABLE}_{table}_{suffix} AFTER {event} ON {table} BEGIN {bump} END"
+        for suffix, event in (("ai", "INSERT"), ("ad", "DELETE"), ("au", "UPDATE"))
+    ]
+
+def create_change_tracking(engine):
+    """Create the version table and triggers; bumps every version so cached responses revalidate after a restart"""
+    with engine.begin() as connection:
+        connection.execute(text(_CREATE_VERSION_TABLE))
+        for name in VERSIONS:
+            connection.execute(
+                text(f"INSERT OR IGNORE INTO {VERSION_TABLE}(name, version, updated_at) VALUES (:name, 0, CURRENT_TIMESTAMP)"),
+                {"name": name},
+            )
+        for table in TRACKED_TABLES:
+            for trigger in _triggers(table):
+                connection.execute(text(trigger))
+        connection.execute(text(
+            f"UPDATE {VERSION_TABLE} SET version = version + 1, updated_at = CURRENT_TIMESTAMP"
+        ))
+
+def drop_change_tracking(engine):
+    """Drop the triggers for bulk loads; create_change_tracking() restores them and bumps the versions"""
+    with engine.begin() as connection:
+        for table in TRACKED_TABLES:
+            for suffix in ("ai", "ad", "au"):
+                connection.execute(text(f"DROP TRIGGER IF EXISTS {VERSION_TABLE}_{table}_{suffix}"))
+
+def bump_version(session, name: str):
+    """Advance a version in the caller's transaction; the caller commits"""
+    session.connection().execute(
+        text(f"UPDATE {VERSION_TABLE} SET version = version + 1, updated_at = CURRENT_TIMESTAMP WHERE name = :name"),
+        {"name": name},
+    )
+
+def table_version(session, *names: str) -> int:
+    """
+    Combined version of the named tables (default pobuda). Versions only
+    grow, so their sum changes whenever any of them does.
+    """
+    return session.connection().execute(
+        text(f"SELECT COALESCE(SUM(version), 0) FROM {VERSION_TABLE} WHERE name IN :names")
+        .bindparams(bindparam("names", expanding=True)),
+        {"names": list(names or TRACKED_TABLES)},
+    ).scalar_one()
+
+def make_etag(*parts) -> str:
+    """Strong ETag for a response determined by parts"""
+    return '"' + hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:24] + '"'
+
+def check_not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Put the validators on response and return a 304 response when the
+    client's copy is current, else None
+    """
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if "*" in tags or etag in tags:
+        return Response(status_code=304, headers=headers)
+    return None
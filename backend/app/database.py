@@ -1,11 +1,20 @@
 from sqlmodel import create_engine, SQLModel, Session
+from sqlalchemy import inspect, text
 
 DATABASE_URL = "sqlite:///pobude.db"
 engine = create_engine(DATABASE_URL, echo=True)
 
+# Indexes replaced by newer ones in models.py, dropped from existing databases
+RETIRED_INDEXES = ("ix_pobuda_status_urgency_created_at",)
+
 def reset_database():
+    from . import models
+    from .search import drop_search_index
+    from .spatial import drop_spatial_index
+    drop_search_index(engine)
+    drop_spatial_index(engine)
     SQLModel.metadata.drop_all(engine)
-    SQLModel.metadata.create_all(engine)
+    create_tables()
 
 def get_session():
     with Session(engine) as session:
@@ -14,5 +23,34 @@ def get_session():
 def create_tables():
     """Create all tables with current schema"""
     
-    from .models import Pobuda
-    SQLModel.metadata.create_all(engine) 
\ No newline at end of file
+    from .models import Hotspot, ImportCheckpoint, ImportManifest, Pobuda, PobudaStatsDaily, UploadBlob
+    from .conditional import create_change_tracking
+    from .search import create_search_index
+    from .spatial import create_spatial_index
+    SQLModel.metadata.create_all(engine)
+    add_missing_columns()
+    # create_all skips indexes added to tables that already exist
+    for index in Pobuda.__table__.indexes:
+        index.create(engine, checkfirst=True)
+    with engine.begin() as connection:
+        for name in RETIRED_INDEXES:
+            connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    create_search_index(engine)
+    create_spatial_index(engine)
+    create_change_tracking(engine)
+
+def add_missing_columns():
+    """Add nullable columns introduced after a table was first created"""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(engine.dialect)
+                    if column.computed is not None:
+                        # SQLite can only add VIRTUAL generated columns
+                        column_type += f" GENERATED ALWAYS AS ({column.computed.sqltext}) VIRTUAL"
+                    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
@@ -0,0 +1,196 @@
+"""
+Image metadata removal and background image derivatives.
+
+strip_metadata() drops EXIF and XMP (GPS, device, timestamps) from an upload
+before it is hashed and stored, so the original served under /uploads does
+not leak where a photo was taken. Images without metadata are stored byte
+for byte; the rest are re-encoded with the EXIF orientation applied.
+
+Every stored upload gets resized copies for list cards and detail views in
+WebP (and AVIF where Pillow supports it). They are re-encoded from pixels
+with the EXIF orientation applied, so they carry no EXIF metadata (GPS,
+device, timestamps). A small thread pool does the work after the upload's
+request has returned; Pillow releases the GIL while decoding, resizing and
+encoding, so threads are enough. Results are stored in upload_blob.variants
+and copied to pobuda.image_variants, where the API exposes them next to
+image_path. A failed run is counted in upload_blob.failed_attempts and
+retried with exponential backoff, also across restarts; only after the last
+attempt is the image recorded as having no derivatives.
+
+Pillow is optional for reading existing data: without it the worker stays
+off and image_variants stays empty, and new uploads are refused because
+their metadata cannot be removed.
+"""
+
+import os
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import update
+from sqlmodel import Session, select
+from .database import engine
+from .models import Pobuda, UploadBlob
+from .storage import incoming_file, storage
+
+try:
+    from PIL import ExifTags, Image, ImageOps, features
+except ImportError:
+    Image = None
+
+# Longest edge in pixels per derivative size
+DERIVATIVE_SIZES = {"thumb": 320, "medium": 1280}
+DERIVATIVE_QUALITY = {"webp": 80, "avif": 60}
+DERIVATIVE_WORKERS = 2
+DERIVATIVE_MAX_ATTEMPTS = 5
+# Delay before the first retry, doubled for every further one
+DERIVATIVE_RETRY_SECONDS = 30
+# Image.info entries that carry EXIF or XMP metadata
+METADATA_KEYS = ("exif", "xmp", "XML:com.adobe.xmp")
+
+def metadata_supported() -> bool:
+    return Image is not None
+
+def strip_metadata(path: str) -> bool:
+    """Rewrite the image at path without EXIF/XMP metadata; True when it was rewritten"""
+    with Image.open(path) as original:
+        if not any(original.info.get(name) for name in METADATA_KEYS) and not original.getexif():
+            return False
+        image_format = original.format
+        animated = getattr(original, "is_animated", False)
+        options = {"icc_profile": original.info.get("icc_profile")}
+        image = original
+        if animated:
+            # Orientation is left alone; exif_transpose() would flatten the frames
+            options.update(save_all=True, duration=original.info.get("duration"), loop=original.info.get("loop", 0))
+        elif original.getexif().get(ExifTags.Base.Orientation, 1) != 1:
+            image = ImageOps.exif_transpose(original)
+        if image_format == "JPEG":
+            # Reuse the source quantization tables unless rotating produced a new image
+            options["quality"] = "keep" if image is original else 95
+        elif image_format == "WEBP":
+            options["lossless"] = original.info.get("lossless", False)
+            options["quality"] = 90
+        image.load()
+        f, temp_path = incoming_file()
+        try:
+            with f:
+                image.save(f, image_format, **{k: v for k, v in options.items() if v is not None})
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    os.replace(temp_path, path)
+    return True
+
+def derivative_formats():
+    if Image is None:
+        return []
+    return ["webp"] + (["avif"] if features.check("avif") else [])
+
+def derivative_key(key: str, size: str, image_format: str) -> str:
+    return f"{os.path.splitext(key)[0]}_{size}.{image_format}"
+
+def delete_derivatives(key: str):
+    for size in DERIVATIVE_SIZES:
+        for image_format in DERIVATIVE_QUALITY:
+            storage.delete(derivative_key(key, size, image_format))
+
+def render_derivatives(key: str):
+    """Write every derivative of a stored image and return their URLs by size and format"""
+    variants = {}
+    with storage.open(key) as source, Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        for size, edge in DERIVATIVE_SIZES.items():
+            resized = image.copy()
+            resized.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+            for image_format in derivative_formats():
+                f, temp_path = incoming_file()
+                try:
+                    with f:
+                        resized.save(f, image_format.upper(), quality=DERIVATIVE_QUALITY[image_format])
+                    storage.put(derivative_key(key, size, image_format), temp_path)
+                except BaseException:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    raise
+                variants.setdefault(size, {})[image_format] = storage.url(derivative_key(key, size, image_format))
+    return variants
+
+class DerivativeWorker:
+    """Thread pool producing derivatives for uploads queued with submit()"""
+
+    def __init__(self, workers: int = DERIVATIVE_WORKERS):
+        self.workers = workers
+        self._executor = None
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the pool and queue every upload that still lacks derivatives"""
+        if Image is None:
+            print("⚠️  Pillow is not installed; image derivatives are disabled")
+            return
+        if self._executor:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="derivatives")
+        with Session(engine) as session:
+            keys = session.exec(select(UploadBlob.key).where(UploadBlob.variants.is_(None))).all()
+        for key in keys:
+            self.submit(key)
+
+    def stop(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def submit(self, key: str):
+        if self._executor is None:
+            return
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        self._executor.submit(self._process, key)
+
+    def _retry_later(self, key: str, attempts: int):
+        timer = threading.Timer(DERIVATIVE_RETRY_SECONDS * 2 ** (attempts - 1), self.submit, (key,))
+        timer.daemon = True
+        timer.start()
+
+    def _process(self, key: str):
+        try:
+            try:
+                variants = render_derivatives(key)
+            except Exception as e:
+                print(f"Error creating derivatives for {key}: {str(e)}")
+                variants = None
+            with Session(engine) as session:
+                blob = session.get(UploadBlob, key)
+                if blob is None:
+                    delete_derivatives(key)
+                    return
+                if variants is None:
+                    blob.failed_attempts = (blob.failed_attempts or 0) + 1
+                    if blob.failed_attempts < DERIVATIVE_MAX_ATTEMPTS:
+                        # Left NULL, so a restart before the retry picks it up again
+                        session.add(blob)
+                        session.commit()
+                        self._retry_later(key, blob.failed_attempts)
+                        return
+                    # Recorded as processed, so an undecodable image is not retried forever
+                    variants = {}
+                blob.variants = variants
+                session.add(blob)
+                session.execute(
+                    update(Pobuda).where(Pobuda.image_path == storage.url(key)).values(image_variants=variants or None)
+                )
+                session.commit()
+        except Exception as e:
+            print(f"Error storing derivatives for {key}: {str(e)}")
+            traceback.print_exc()
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+derivative_worker = DerivativeWorker()
@@ -0,0 +1,155 @@
+"""
+District polygons and point-in-polygon membership.
+
+Boundaries are the Voronoi cells of the district centres in app.geodata,
+clipped to LJUBLJANA_BOUNDS, so they agree with the reverse geocoder.
+Membership is a generic vectorised ray-casting test: official boundary rings
+can replace the built districts without touching the callers.
+Pobuda.district_id holds the 1-based index into get_districts() and is
+filled once per row.
+
+The polygons are built once per process. After app.geodata changes,
+reload_districts() rebuilds them and reassigns every stored district, so
+rows and statistics never mix two sets of boundaries.
+"""
+
+import importlib
+import threading
+from typing import Optional
+import numpy as np
+from sqlalchemy import update
+from sqlmodel import Session, select
+from . import geodata
+from .models import Pobuda
+from .spatial import LJUBLJANA_BOUNDS, project_m
+
+DISTRICT_BACKFILL_BATCH = 5000
+
+def _clip(polygon, normal, offset):
+    """Sutherland-Hodgman clip of a polygon to the half-plane normal . p <= offset"""
+    clipped = []
+    for index, current in enumerate(polygon):
+        previous = polygon[index - 1]
+        current_inside = normal @ current <= offset
+        previous_inside = normal @ previous <= offset
+        if current_inside != previous_inside:
+            t = (offset - normal @ previous) / (normal @ (current - previous))
+            clipped.append(previous + t * (current - previous))
+        if current_inside:
+            clipped.append(current)
+    return clipped
+
+def _voronoi_rings(latitudes, longitudes):
+    """Voronoi cells of the centres inside the city bounds, as closed [lng, lat] rings"""
+    centres = project_m(latitudes, longitudes)
+    corners = project_m(
+        [LJUBLJANA_BOUNDS["min_lat"], LJUBLJANA_BOUNDS["max_lat"]],
+        [LJUBLJANA_BOUNDS["min_lng"], LJUBLJANA_BOUNDS["max_lng"]],
+    )
+    (min_x, min_y), (max_x, max_y) = corners
+    # project_m is a pure scaling, so the same factors map meters back to degrees
+    scale = corners[1] / np.array([LJUBLJANA_BOUNDS["max_lng"], LJUBLJANA_BOUNDS["max_lat"]])
+    rings = []
+    for i, centre in enumerate(centres):
+        polygon = [np.array(point) for point in ((min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y))]
+        for j, other in enumerate(centres):
+            if i != j and polygon:
+                polygon = _clip(polygon, other - centre, (other @ other - centre @ centre) / 2)
+        ring = [[round(float(x), 6), round(float(y), 6)] for x, y in (np.array(polygon) / scale)]
+        rings.append(ring + ring[:1])
+    return rings
+
+def build_districts(entries):
+    """District dicts (id, name, ring) for (name, latitude, longitude) centres"""
+    return [
+        {"id": index + 1, "name": name, "ring": ring}
+        for index, (name, ring) in enumerate(zip(
+            [name for name, _, _ in entries],
+            _voronoi_rings(
+                [latitude for _, latitude, _ in entries],
+                [longitude for _, _, longitude in entries],
+            ),
+        ))
+    ]
+
+# Replaced as a whole by reload_districts(), never mutated, so readers can
+# keep a reference without locking
+_districts = build_districts(geodata.LJUBLJANA_DISTRICTS)
+_districts_version = 0
+_reload_lock = threading.Lock()
+
+def get_districts():
+    return _districts
+
+def districts_version() -> int:
+    """Bumped by every reload that changed the districts; part of derived cache keys"""
+    return _districts_version
+
+def points_in_ring(latitudes, longitudes, ring):
+    """Even-odd ray casting of many points against one closed [lng, lat] ring"""
+    inside = np.zeros(len(latitudes), dtype=bool)
+    for (x1, y1), (x2, y2) in zip(ring[:-1], ring[1:]):
+        crosses = (y1 > latitudes) != (y2 > latitudes)
+        if not crosses.any():
+            continue
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_at = x1 + (latitudes - y1) * (x2 - x1) / (y2 - y1)
+        inside ^= crosses & (longitudes < x_at)
+    return inside
+
+def district_ids(latitudes, longitudes):
+    """District id for each point, or None outside every district"""
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    ids = np.zeros(len(latitudes), dtype=np.int64)
+    for district in get_districts():
+        ring = np.array(district["ring"])
+        candidate = (
+            (ids == 0)
+            & (longitudes >= ring[:, 0].min()) & (longitudes <= ring[:, 0].max())
+            & (latitudes >= ring[:, 1].min()) & (latitudes <= ring[:, 1].max())
+        )
+        if candidate.any():
+            hit = points_in_ring(latitudes[candidate], longitudes[candidate], district["ring"])
+            ids[np.flatnonzero(candidate)[hit]] = district["id"]
+    return [int(i) or None for i in ids]
+
+def district_id(latitude: float, longitude: float) -> Optional[int]:
+    return district_ids([latitude], [longitude])[0]
+
+def backfill_district_ids(session: Session):
+    """Assign districts to rows that have none yet; rows outside the city stay NULL"""
+    last_id = 0
+    while True:
+        rows = session.exec(
+            select(Pobuda.id, Pobuda.latitude, Pobuda.longitude)
+            .where(Pobuda.district_id.is_(None), Pobuda.id > last_id)
+            .order_by(Pobuda.id)
+            .limit(DISTRICT_BACKFILL_BATCH)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        ids = district_ids([row[1] for row in rows], [row[2] for row in rows])
+        changes = [{"id": row[0], "district_id": value} for row, value in zip(rows, ids) if value is not None]
+        if changes:
+            session.execute(update(Pobuda), changes)
+    session.commit()
+
+def reload_districts(session: Session) -> bool:
+    """
+    Re-read app.geodata and, when the districts changed, swap in the new
+    polygons and reassign every stored district; commits. True when anything
+    changed.
+    """
+    global _districts, _districts_version
+    with _reload_lock:
+        importlib.reload(geodata)
+        districts = build_districts(geodata.LJUBLJANA_DISTRICTS)
+        if districts == _districts:
+            return False
+        _districts = districts
+        _districts_version += 1
+        session.execute(update(Pobuda).values(district_id=None))
+        backfill_district_ids(session)
+    return True
@@ -0,0 +1,127 @@
+"""
+Offline reverse geocoder.
+
+Snaps coordinates to the nearest street centroid and district centre from
+app.geodata; no network calls. Nearest-neighbour lookups go through a grid
+over the city bounds where every cell stores only the sites that can be
+nearest to some point inside it, so a batch of points is resolved with a
+few array operations against a handful of candidates each.
+"""
+
+from typing import List, Optional, Tuple
+import numpy as np
+from .geodata import LJUBLJANA_DISTRICTS, LJUBLJANA_STREET_CENTROIDS
+from .spatial import LJUBLJANA_BOUNDS, in_ljubljana, project_m
+
+# Points farther than this from every known street centroid are labelled with
+# their district instead; the centroid set is sparse, so farther snaps would
+# name streets the point is not on
+GEOCODER_MAX_STREET_DISTANCE_M = 250.0
+GEOCODER_GRID_CELLS = 32
+GEOCODER_BATCH_SIZE = 50000
+
+# Placeholders sent by the form and the source data instead of an address
+GENERIC_LOCATIONS = {"", "ljubljana", "izbrana lokacija na zemljevidu"}
+DEFAULT_LOCATION = "Ljubljana"
+
+def is_generic_location(location: Optional[str]) -> bool:
+    return location is None or location.strip().lower() in GENERIC_LOCATIONS
+
+class NearestSiteIndex:
+    """Exact nearest-site lookup for points, pruned by a uniform grid of candidate lists"""
+
+    def __init__(self, latitudes, longitudes, cells: int = GEOCODER_GRID_CELLS):
+        self.sites = project_m(latitudes, longitudes)
+        self.cells = cells
+        corners = project_m(
+            [LJUBLJANA_BOUNDS["min_lat"], LJUBLJANA_BOUNDS["max_lat"]],
+            [LJUBLJANA_BOUNDS["min_lng"], LJUBLJANA_BOUNDS["max_lng"]],
+        )
+        self.origin = corners[0]
+        self.cell_size = (corners[1] - corners[0]) / cells
+
+        # For every cell, a site is a candidate unless some other site is
+        # nearer to every point of the cell (its min distance exceeds the
+        # smallest max distance over all sites)
+        ix, iy = np.meshgrid(np.arange(cells), np.arange(cells), indexing="ij")
+        low = self.origin + np.stack((ix.ravel(), iy.ravel()), axis=1) * self.cell_size
+        high = low + self.cell_size
+        sx = self.sites[None, :, 0]
+        sy = self.sites[None, :, 1]
+        near_x = np.maximum(np.maximum(low[:, None, 0] - sx, sx - high[:, None, 0]), 0)
+        near_y = np.maximum(np.maximum(low[:, None, 1] - sy, sy - high[:, None, 1]), 0)
+        far_x = np.maximum(np.abs(sx - low[:, None, 0]), np.abs(sx - high[:, None, 0]))
+        far_y = np.maximum(np.abs(sy - low[:, None, 1]), np.abs(sy - high[:, None, 1]))
+        min_d2 = near_x ** 2 + near_y ** 2
+        bound = (far_x ** 2 + far_y ** 2).min(axis=1, keepdims=True)
+        candidate = min_d2 <= bound
+
+        # Candidate lists padded with -1 to a rectangular (cells * cells, width) array
+        width = max(int(candidate.sum(axis=1).max()), 1)
+        order = np.argsort(~candidate, axis=1, kind="stable")[:, :width]
+        self.candidates = np.where(np.take_along_axis(candidate, order, axis=1), order, -1)
+
+    def query(self, latitudes, longitudes):
+        """Return (site index, distance in meters) for each point"""
+        points = project_m(latitudes, longitudes)
+        cell = np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+        inside = ((cell >= 0) & (cell < self.cells)).all(axis=1)
+        nearest = np.empty(len(points), dtype=np.int64)
+        distance = np.empty(len(points), dtype=np.float64)
+
+        if inside.any():
+            rows = self.candidates[cell[inside, 0] * self.cells + cell[inside, 1]]
+            sites = self.sites[np.maximum(rows, 0)]
+            d2 = ((sites - points[inside, None, :]) ** 2).sum(axis=2)
+            d2[rows < 0] = np.inf
+            best = d2.argmin(axis=1)
+            nearest[inside] = rows[np.arange(len(rows)), best]
+            distance[inside] = np.sqrt(d2[np.arange(len(rows)), best])
+
+        outside = ~inside
+        if outside.any():
+            d2 = ((self.sites[None, :, :] - points[outside, None, :]) ** 2).sum(axis=2)
+            best = d2.argmin(axis=1)
+            nearest[outside] = best
+            distance[outside] = np.sqrt(d2[np.arange(len(best)), best])
+        return nearest, distance
+
+class ReverseGeocoder:
+    def __init__(self, streets=LJUBLJANA_STREET_CENTROIDS, districts=LJUBLJANA_DISTRICTS):
+        self.street_names = list(streets)
+        self.district_names = [name for name, _, _ in districts]
+        street_coordinates = np.array(list(streets.values()), dtype=np.float64)
+        self.streets = NearestSiteIndex(street_coordinates[:, 0], street_coordinates[:, 1])
+        self.districts = NearestSiteIndex(
+            [latitude for _, latitude, _ in districts],
+            [longitude for _, _, longitude in districts],
+        )
+
+    def lookup(self, latitudes, longitudes) -> List[Tuple[Optional[str], Optional[str]]]:
+        """(street, district) for each point, processed in fixed-size batches; both None outside the city"""
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        results = []
+        for start in range(0, len(latitudes), GEOCODER_BATCH_SIZE):
+            lat = latitudes[start:start + GEOCODER_BATCH_SIZE]
+            lng = longitudes[start:start + GEOCODER_BATCH_SIZE]
+            street, street_distance = self.streets.query(lat, lng)
+            district, _ = self.districts.query(lat, lng)
+            inside = in_ljubljana(lat, lng)
+            results.extend(
+                (
+                    self.street_names[s] if ok and d <= GEOCODER_MAX_STREET_DISTANCE_M else None,
+                    self.district_names[c] if ok else None
+                )
+                for s, d, c, ok in zip(street.tolist(), street_distance.tolist(), district.tolist(), inside.tolist())
+            )
+        return results
+
+    def locations(self, latitudes, longitudes) -> List[str]:
+        """Location labels for pobude: the snapped street, else the district, else DEFAULT_LOCATION"""
+        return [street or district or DEFAULT_LOCATION for street, district in self.lookup(latitudes, longitudes)]
+
+    def location(self, latitude: float, longitude: float) -> str:
+        return self.locations([latitude], [longitude])[0]
+
+geocoder = ReverseGeocoder()
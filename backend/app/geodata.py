@@ -0,0 +1,1702 @@
+"""
+Local geographic reference data for Ljubljana.
+
+LJUBLJANA_STREETS is the street register used for autocomplete.
+LJUBLJANA_STREET_CENTROIDS gives approximate (latitude, longitude) centroids
+for a subset of those streets; it is what the offline reverse geocoder snaps
+to, so extending it directly improves location quality. LJUBLJANA_DISTRICTS
+lists the city districts (četrtne skupnosti) with approximate centres.
+"""
+
+LJUBLJANA_STREETS = [
+    "Abramova Ulica",
+    "Adamičeva Ulica",
+    "Adamič-Lundrovo Nabrežje",
+    "Agrokombinatska Cesta",
+    "Ajdovščina",
+    "Aleševa Ulica",
+    "Alešovčeva Ulica",
+    "Aličeva Ulica",
+    "Aljaževa Ulica",
+    "Ambrožev Trg",
+    "Ameriška Ulica",
+    "Andreaševa Ulica",
+    "Andrićeva Ulica",
+    "Anžurjeva Ulica",
+    "Apihova Ulica",
+    "Archinetova Ulica",
+    "Argentinska Ulica",
+    "Arharjeva Cesta",
+    "Arkova Ulica",
+    "Arničeva Ulica",
+    "Artačeva Ulica",
+    "Aškerčeva Cesta",
+    "Avčinova Ulica",
+    "Avgustinčičeva Ulica",
+    "Avsečeva Ulica",
+    "Avstrijska Ulica",
+    "Avšičeva Cesta",
+    "Ažbetova Ulica",
+    "Ažmanova Ulica",
+    "Babičeva Ulica",
+    "Badjurova Ulica",
+    "Bajtova Ulica",
+    "Balinarska Pot",
+    "Baragova Ulica",
+    "Barjanska Cesta",
+    "Barvarska Steza",
+    "Bavdkova Ulica",
+    "Baznikova Ulica",
+    "Bazoviška Ulica",
+    "Beblerjev Trg",
+    "Beethovnova Ulica",
+    "Belačeva Ulica",
+    "Beljaška Ulica",
+    "Belokranjska Ulica",
+    "Beograjska Ulica",
+    "Berčičeva Ulica",
+    "Berčonova Pot",
+    "Berdajsova Ulica",
+    "Bergantova Ulica",
+    "Bernekerjeva Ulica",
+    "Bernikova Ulica",
+    "Besnica",
+    "Betettova Cesta",
+    "Bevkova Cesta",
+    "Bezenškova Ulica",
+    "Bežigrad",
+    "Bičevje",
+    "Bilečanska Ulica",
+    "Bistriška Ulica",
+    "Bitenčeva Ulica",
+    "Bizjakova Ulica",
+    "Bizjanova Ulica",
+    "Bizoviška Cesta",
+    "Blasnikova Ulica",
+    "Blasov Breg",
+    "Blažičeva Ulica",
+    "Bleiweisova Cesta",
+    "Bobenčkova Ulica",
+    "Bobrova Ulica",
+    "Bogišićeva Ulica",
+    "Bognarjeva Pot",
+    "Bohinjčeva Ulica",
+    "Bohoričeva Ulica",
+    "Bokalova Ulica",
+    "Boletova Ulica",
+    "Bolgarska Ulica",
+    "Borovniška Ulica",
+    "Borsetova Ulica",
+    "Borštnikov Trg",
+    "Borutova Ulica",
+    "Božičeva Ulica",
+    "Brajnikova Ulica",
+    "Brankova Ulica",
+    "Bratinova Ulica",
+    "Bratislavska Cesta",
+    "Bratov Čebuljev Ulica",
+    "Bratov Jakopičev Ulica",
+    "Bratov Kunovarjev Ulica",
+    "Bratovševa Ploščad",
+    "Bravničarjeva Ulica",
+    "Brdnikova Ulica",
+    "Breg",
+    "Bregarjeva Ulica",
+    "Brejčeva Ulica",
+    "Brezje Pri Lipoglavu",
+    "Breznikova Ulica",
+    "Brglezov Štradon",
+    "Brilejeva Ulica",
+    "Brnčičeva Ulica",
+    "Brodarjev Trg",
+    "Brodska Cesta",
+    "Burnikova Ulica",
+    "Cankarjev Vrh",
+    "Cankarjeva Cesta",
+    "Cankarjevo Nabrežje",
+    "Carja Dušana Ulica",
+    "Celarčeva Ulica",
+    "Celestinova Ulica",
+    "Celjska Ulica",
+    "Celovška Cesta",
+    "Cerkniška Ulica",
+    "Cerkova Ulica",
+    "Cerutova Ulica",
+    "Cesta 13. Julija",
+    "Cesta 24. Junija",
+    "Cesta 25 Talcev",
+    "Cesta 27. Aprila",
+    "Cesta 30. Avgusta",
+    "Cesta Andreja Bitenca",
+    "Cesta Ceneta Štuparja",
+    "Cesta Cirila Kosmača",
+    "Cesta Dolomitskega Odreda",
+    "Cesta Dveh Cesarjev",
+    "Cesta Ii. Grupe Odredov",
+    "Cesta Ljubljanske Brigade",
+    "Cesta Na Bokalce",
+    "Cesta Na Brdo",
+    "Cesta Na Brinovec",
+    "Cesta Na Brod",
+    "Cesta Na Ježah",
+    "Cesta Na Ključ",
+    "Cesta Na Kope",
+    "Cesta Na Laze",
+    "Cesta Na Loko",
+    "Cesta Na Mesarico",
+    "Cesta Na Obrije",
+    "Cesta Na Ozare",
+    "Cesta Na Poljane",
+    "Cesta Na Prevoje",
+    "Cesta Na Rožnik",
+    "Cesta Na Urh",
+    "Cesta Na Vrhovce",
+    "Cesta Španskih Borcev",
+    "Cesta Urške Zatlerjeve",
+    "Cesta V Dvor",
+    "Cesta V Gameljne",
+    "Cesta V Gorice",
+    "Cesta V Hrastje",
+    "Cesta V Hrib",
+    "Cesta V Kleče",
+    "Cesta V Kostanj",
+    "Cesta V Kresnice",
+    "Cesta V Legarico",
+    "Cesta V Mestni Log",
+    "Cesta V Pečale",
+    "Cesta V Podboršt",
+    "Cesta V Prod",
+    "Cesta V Rožno Dolino",
+    "Cesta V Šmartno",
+    "Cesta V Zajčjo Dobravo",
+    "Cesta V Zeleni Log",
+    "Cesta V Zgornji Log",
+    "Cesta Vstaje",
+    "Chengdujska Cesta",
+    "Cigaletova Ulica",
+    "Cilenškova Ulica",
+    "Cimermanova Ulica",
+    "Cimpermanova Ulica",
+    "Ciril-Metodov Trg",
+    "Cizejeva Ulica",
+    "Clevelandska Ulica",
+    "Colnarjeva Ulica",
+    "Cvetkova Ulica",
+    "Cvetlična Pot",
+    "Čampova Ulica",
+    "Čanžekova Ulica",
+    "Čapova Ulica",
+    "Čargova Ulica",
+    "Čebelarska Ulica",
+    "Čehova Ulica",
+    "Čemažarjeva Ulica",
+    "Čepelnikova Ulica",
+    "Čepovanska Ulica",
+    "Čerinova Ulica",
+    "Černetova Ulica",
+    "Černigojeva Ulica",
+    "Černivčeva Ulica",
+    "Červanova Ulica",
+    "Česnikova Ulica",
+    "Češnjica",
+    "Čevljarska Ulica",
+    "Čižmanova Ulica",
+    "Čopova Ulica",
+    "Črna Pot",
+    "Črna Vas",
+    "Črnuška Cesta",
+    "Črtomirova Ulica",
+    "Čučkova Ulica",
+    "Čufarjeva Ulica",
+    "Dajnkova Ulica",
+    "Dalmatinova Ulica",
+    "Danile Kumarjeve Ulica",
+    "Davčna Ulica",
+    "Dečkova Ulica",
+    "Dečmanova Ulica",
+    "Delakova Ulica",
+    "Delavska Ulica",
+    "Demšarjeva Cesta",
+    "Derčeva Ulica",
+    "Dergančeva Ulica",
+    "Dergomaška Ulica",
+    "Dermotova Ulica",
+    "Detelova Ulica",
+    "Devinska Ulica",
+    "Devova Ulica",
+    "Dimičeva Ulica",
+    "Divjakova Ulica",
+    "Do Proge",
+    "Dobrajčeva Ulica",
+    "Dobrdobska Ulica",
+    "Dobrunjska Cesta",
+    "Dolenjska Cesta",
+    "Dolgi Breg",
+    "Dolgi Most",
+    "Dolgo Brdo",
+    "Dolharjeva Ulica",
+    "Dolina",
+    "Dolinarjeva Ulica",
+    "Dolinškova Ulica",
+    "Dolničarjeva Ulica",
+    "Dolniška Cesta",
+    "Dolomitska Ulica",
+    "Drabosnjakova Ulica",
+    "Draga",
+    "Draveljska Ulica",
+    "Dravska Ulica",
+    "Dražgoška Ulica",
+    "Drenikov Vrh",
+    "Drenikova Ulica",
+    "Društvena Ulica",
+    "Dunajska Cesta",
+    "Dvojna Ulica",
+    "Dvor",
+    "Dvorakova Ulica",
+    "Dvorni Trg",
+    "Džamijska Ulica",
+    "Einspielerjeva Ulica",
+    "Eipprova Ulica",
+    "Ellerjeva Ulica",
+    "Emonska Cesta",
+    "Endliherjeva Ulica",
+    "Erbežnikova Ulica",
+    "Erjavčeva Cesta",
+    "Fabianijeva Ulica",
+    "Fajfarjeva Ulica",
+    "Fani Grumove Ulica",
+    "Ferberjeva Ulica",
+    "Filipičeva Ulica",
+    "Finžgarjeva Ulica",
+    "Flajšmanova Ulica",
+    "Flandrova Ulica",
+    "Forsterjeva Ulica",
+    "Francoska Ulica",
+    "Franketova Ulica",
+    "Frankopanska Ulica",
+    "Frenkova Pot",
+    "Freyerjeva Ulica",
+    "Friškovec",
+    "Funtkova Ulica",
+    "Fužinska Cesta",
+    "Gabrje Pri Jančah",
+    "Gabrov Trg",
+    "Gabrščkova Ulica",
+    "Gača",
+    "Galičeva Ulica",
+    "Galjevica",
+    "Gallusovo Nabrežje",
+    "Gameljska Cesta",
+    "Gasilska Cesta",
+    "Gasparijeva Ulica",
+    "Gašperšičeva Ulica",
+    "Gerbičeva Ulica",
+    "Gestrinova Ulica",
+    "Glavarjeva Ulica",
+    "Gledališka Pasaža",
+    "Gledališka Stolba",
+    "Glinška Ulica",
+    "Glinškova Ploščad",
+    "Globočnikova Ulica",
+    "Glonarjeva Ulica",
+    "Gmajnice",
+    "Gobarska Pot",
+    "Godeževa Ulica",
+    "Gogalova Ulica",
+    "Gola Loka",
+    "Golarjeva Ulica",
+    "Goljarjeva Pot",
+    "Golouhova Ulica",
+    "Gorazdova Ulica",
+    "Goriška Ulica",
+    "Gorjančeva Ulica",
+    "Gorjupova Ulica",
+    "Gorkičeva Ulica",
+    "Gornji Rudnik I",
+    "Gornji Rudnik Ii",
+    "Gornji Rudnik Iii",
+    "Gornji Rudnik Iv",
+    "Gornji Trg",
+    "Goropečnikova Ulica",
+    "Gortanova Ulica",
+    "Gosarjeva Ulica",
+    "Gospodinjska Ulica",
+    "Gosposka Ulica",
+    "Gosposvetska Cesta",
+    "Gotska Ulica",
+    "Govekarjeva Ulica",
+    "Gozdna Pot",
+    "Grablovičeva Ulica",
+    "Gradaška Ulica",
+    "Gradišče",
+    "Gradiškova Ulica",
+    "Gradnikova Ulica",
+    "Grafenauerjeva Ulica",
+    "Grajska Planota",
+    "Grajzerjeva Ulica",
+    "Gramozna Pot",
+    "Grampovčanova Ulica",
+    "Grassellijeva Ulica",
+    "Gregorčičeva Ulica",
+    "Gregorinova Ulica",
+    "Grič",
+    "Grintovška Ulica",
+    "Grobeljca",
+    "Grobeljska Pot",
+    "Groharjeva Cesta",
+    "Grošljeva Ulica",
+    "Groznikova Ulica",
+    "Grška Ulica",
+    "Grško",
+    "Gruberjevo Nabrežje",
+    "Grudnova Ulica",
+    "Grudnovo Nabrežje",
+    "Gubčeva Ulica",
+    "Gunceljska Cesta",
+    "Gundulićeva Ulica",
+    "Gustinčarjeva Ulica",
+    "Gustinčičeva Ulica",
+    "Hacetova Ulica",
+    "Hacquetova Ulica",
+    "Hafnerjeva Ulica",
+    "Hajdrihova Ulica",
+    "Hauptmanca",
+    "Herbersteinova Ulica",
+    "Hladilniška Pot",
+    "Hladnikova Cesta",
+    "Hlebčeva Ulica",
+    "Hodoščkova Ulica",
+    "Hotimirova Ulica",
+    "Hradeckega Cesta",
+    "Hranilniška Ulica",
+    "Hrenova Ulica",
+    "Hribarjevo Nabrežje",
+    "Hribernikova Ulica",
+    "Hribovska Pot",
+    "Hruševska Cesta",
+    "Hrvaška Ulica",
+    "Hrvatski Trg",
+    "Hubadova Ulica",
+    "Hudourniška Pot",
+    "Hudovernikova Ulica",
+    "Idrijska Ulica",
+    "Igriška Ulica",
+    "Ilešičeva Ulica",
+    "Ilirska Ulica",
+    "Ilovški Štradon",
+    "Ingličeva Ulica",
+    "Ipavčeva Ulica",
+    "Italijanska Ulica",
+    "Izletniška Ulica",
+    "Ižanska Cesta",
+    "Jadranska Ulica",
+    "Jakčeva Ulica",
+    "Jakhljeva Ulica",
+    "Jakopičeva Ulica",
+    "Jakšičeva Ulica",
+    "Jalnova Ulica",
+    "Jamnikarjeva Ulica",
+    "Jamova Cesta",
+    "Janče",
+    "Janežičeva Cesta",
+    "Janova Ulica",
+    "Janševa Ulica",
+    "Japljeva Ulica",
+    "Jarčeva Ulica",
+    "Jarnikova Ulica",
+    "Jarše",
+    "Jarška Cesta",
+    "Javor",
+    "Javorjev Drevored",
+    "Javorškova Ulica",
+    "Jazbečeva Pot",
+    "Jelinčičeva Ulica",
+    "Jelovškova Ulica",
+    "Jenkova Ulica",
+    "Jensenova Ulica",
+    "Jerajeva Ulica",
+    "Jerančičeva Ulica",
+    "Jeranova Ulica",
+    "Jesenkova Ulica",
+    "Jesihov Štradon",
+    "Jezerska Ulica",
+    "Ježa",
+    "Ježica",
+    "Ježkova Ulica",
+    "Joškov Štradon",
+    "Jurčeva Ulica",
+    "Jurčičev Trg",
+    "Jurčkova Cesta",
+    "Juričeva Ulica",
+    "Justinova Ulica",
+    "Juvanova Ulica",
+    "K Reaktorju",
+    "Kadilnikova Ulica",
+    "Kajakaška Cesta",
+    "Kajuhova Ulica",
+    "Kalingerjeva Ulica",
+    "Kalinova Ulica",
+    "Kališnikov Trg",
+    "Kaminova Ulica",
+    "Kamniška Ulica",
+    "Kamnogoriška Cesta",
+    "Kamnoseška Ulica",
+    "Kančeva Ulica",
+    "Kanonijeva Cesta",
+    "Kantetova Ulica",
+    "Kapiteljska Ulica",
+    "Kapusova Ulica",
+    "Kardeljeva Ploščad",
+    "Karingerjeva Ulica",
+    "Karlovška Cesta",
+    "Karunova Ulica",
+    "Kastelčeva Ulica",
+    "Kašeljska Cesta",
+    "Katreževa Pot",
+    "Kavadarska Cesta",
+    "Kavčičeva Ulica",
+    "Kavškova Ulica",
+    "Kebetova Ulica",
+    "Kekčeva Ulica",
+    "Kermaunerjeva Ulica",
+    "Kernova Cesta",
+    "Kersnikova Ulica",
+    "Kerševanova Ulica",
+    "Keržičeva Ulica",
+    "Kettejeva Ulica",
+    "Kikljeva Ulica",
+    "Kladezna Ulica",
+    "Klančarjeva Ulica",
+    "Kleče",
+    "Klemenčičeva Ulica",
+    "Klemenova Ulica",
+    "Ključavničarska Ulica",
+    "Klopčičeva Ulica",
+    "Klunova Ulica",
+    "Kmečka Pot",
+    "Knafljev Prehod",
+    "Kneza Koclja Ulica",
+    "Knezov Štradon",
+    "Knezova Ulica",
+    "Knobleharjeva Ulica",
+    "Kobetova Ulica",
+    "Koblarjeva Ulica",
+    "Kocenova Ulica",
+    "Kocjančičeva Ulica",
+    "Kocjanova Ulica",
+    "Kočenska Ulica",
+    "Kodrova Ulica",
+    "Kogejeva Ulica",
+    "Kogojeva Ulica",
+    "Kogovškova Ulica",
+    "Kokaljeva Ulica",
+    "Kolajbova Ulica",
+    "Kolarjeva Ulica",
+    "Kolesarska Pot",
+    "Koleševa Ulica",
+    "Kolezijska Ulica",
+    "Kolinska Ulica",
+    "Kolmanova Ulica",
+    "Kolodvorska Ulica",
+    "Komacova Ulica",
+    "Komanova Ulica",
+    "Komenskega Ulica",
+    "Kongresni Trg",
+    "Kopačeva Cesta",
+    "Kopališka Ulica",
+    "Kopitarjeva Ulica",
+    "Kopna Pot",
+    "Koprska Ulica",
+    "Korenčanova Ulica",
+    "Koreninova Ulica",
+    "Koroška Ulica",
+    "Korotanska Ulica",
+    "Korytkova Ulica",
+    "Kosančeva Ulica",
+    "Koseskega Ulica",
+    "Koseška Cesta",
+    "Kosijeva Ulica",
+    "Kosmačeva Ulica",
+    "Kosova Ulica",
+    "Kosovelova Ulica",
+    "Koščeva Ulica",
+    "Koširjeva Ulica",
+    "Kotnikova Ulica",
+    "Kovačeva Ulica",
+    "Kovačičeva Ulica",
+    "Kovaška Ulica",
+    "Kovinarska Ulica",
+    "Kozarska Cesta",
+    "Kozinova Ulica",
+    "Kozlarjeva Pot",
+    "Koželjeva Ulica",
+    "Krakovska Ulica",
+    "Krakovski Nasip",
+    "Kraljeva Ulica",
+    "Kranerjeva Ulica",
+    "Kranjčeva Ulica",
+    "Kraška Ulica",
+    "Kratka Pot",
+    "Kratka Steza",
+    "Kregarjeva Ulica",
+    "Krekov Trg",
+    "Kreljeva Ulica",
+    "Kremžarjeva Ulica",
+    "Krimska Ulica",
+    "Kristanova Ulica",
+    "Krištofova Ulica",
+    "Kriva Pot",
+    "Krivec",
+    "Križevniška Ulica",
+    "Križna Ulica",
+    "Krmčeva Ulica",
+    "Krmeljeva Ulica",
+    "Krojaška Ulica",
+    "Kropova Ulica",
+    "Krošljeva Ulica",
+    "Krovska Ulica",
+    "Krožna Pot",
+    "Krvinova Ulica",
+    "Kržičeva Ulica",
+    "Kudrova Ulica",
+    "Kumanovska Ulica",
+    "Kumerdejeva Ulica",
+    "Kumrovška Ulica",
+    "Kunaverjeva Ulica",
+    "Kurilniška Ulica",
+    "Kurirska Ulica",
+    "Kušarjeva Ulica",
+    "Kuštrinova Ulica",
+    "Kuzeletova Ulica",
+    "Kuzmičeva Ulica",
+    "Kvedrova Cesta",
+    "Lahova Pot",
+    "Lajovčeva Ulica",
+    "Laknerjeva Ulica",
+    "Lakotence",
+    "Lambergarjeva Ulica",
+    "Lampetova Ulica",
+    "Lamutova Ulica",
+    "Langusova Ulica",
+    "Latinski Trg",
+    "Lavričeva Ulica",
+    "Lavrinova Ulica",
+    "Layerjeva Ulica",
+    "Lazarjeva Ulica",
+    "Ledarska Ulica",
+    "Legatova Ulica",
+    "Lemeževa Ulica",
+    "Lepi Pot",
+    "Lepodvorska Ulica",
+    "Leskoškova Cesta",
+    "Leskovičeva Ulica",
+    "Letališka Cesta",
+    "Levarjeva Ulica",
+    "Levčeva Ulica",
+    "Levičnikova Ulica",
+    "Levstikov Trg",
+    "Levstikova Ulica",
+    "Likozarjeva Ulica",
+    "Linhartov Podhod",
+    "Linhartova Cesta",
+    "Lipahova Ulica",
+    "Lipe",
+    "Litijska Cesta",
+    "Litostrojska Cesta",
+    "Livada",
+    "Livarska Ulica",
+    "Ljubeljska Ulica",
+    "Ločnikarjeva Ulica",
+    "Lončarska Steza",
+    "Lotričeva Ulica",
+    "Lovrenčičeva Ulica",
+    "Lovska Ulica",
+    "Lovšetova Ulica",
+    "Ložarjeva Ulica",
+    "Lubejeva Ulica",
+    "Luize Pesjakove Ulica",
+    "Lunačkova Ulica",
+    "Lužiško-Srbska Ulica",
+    "Mačkov Kot",
+    "Mačkova Ulica",
+    "Madžarska Ulica",
+    "Magajnova Ulica",
+    "Magistrova Ulica",
+    "Maistrova Ulica",
+    "Majaronova Ulica",
+    "Majde Šilčeve Ulica",
+    "Majde Vrhovnikove Ulica",
+    "Majorja Lavriča Ulica",
+    "Makucova Ulica",
+    "Mala Čolnarska Ulica",
+    "Mala Ulica",
+    "Mala Vas",
+    "Malejeva Ulica",
+    "Malenškova Ulica",
+    "Maleševa Ulica",
+    "Malgajeva Ulica",
+    "Mali Lipoglav",
+    "Mali Trg",
+    "Mali Vrh Pri Prežganju",
+    "Malnarjeva Ulica",
+    "Malo Trebeljevo",
+    "Malova Ulica",
+    "Marčenkova Ulica",
+    "Marentičeva Ulica",
+    "Mareška Pot",
+    "Mariborska Ulica",
+    "Marice Kovačeve Ulica",
+    "Marincljeva Ulica",
+    "Marinovševa Cesta",
+    "Marjekova Pot",
+    "Maroltova Ulica",
+    "Martina Krpana Ulica",
+    "Martinčeva Ulica",
+    "Martinova Pot",
+    "Martinova Ulica",
+    "Marušičeva Ulica",
+    "Masarykova Cesta",
+    "Mašera-Spasićeva Ulica",
+    "Matjanova Pot",
+    "Matjaževa Ulica",
+    "Maurerjeva Ulica",
+    "Mazijeva Ulica",
+    "Mazovčeva Pot",
+    "Med Hmeljniki",
+    "Medarska Ulica",
+    "Medenska Cesta",
+    "Medno",
+    "Medvedova Cesta",
+    "Medveščkova Ulica",
+    "Mekinčeva Ulica",
+    "Melikova Ulica",
+    "Menardova Ulica",
+    "Mencingerjeva Ulica",
+    "Merčnikova Ulica",
+    "Merosodna Ulica",
+    "Mesarska Cesta",
+    "Mesesnelova Ulica",
+    "Mestni Trg",
+    "Meškova Ulica",
+    "Metelkova Ulica",
+    "Metliška Ulica",
+    "Miheličeva Cesta",
+    "Mihov Štradon",
+    "Miklavčeva Ulica",
+    "Miklošičeva Cesta",
+    "Mikuževa Ulica",
+    "Milčetova Pot",
+    "Milčinskega Ulica",
+    "Mire Lenardičeve Ulica",
+    "Mirje",
+    "Mirna Pot",
+    "Mislejeva Ulica",
+    "Mivka",
+    "Mizarska Pot",
+    "Mladinska Ulica",
+    "Mlake",
+    "Mlinska Pot",
+    "Močilnikarjeva Ulica",
+    "Močnikova Ulica",
+    "Mokrška Ulica",
+    "Molekova Ulica",
+    "Moskovska Ulica",
+    "Moškričeva Ulica",
+    "Mrharjeva Ulica",
+    "Mrzelova Ulica",
+    "Mucherjeva Ulica",
+    "Murkova Ulica",
+    "Murnikova Ulica",
+    "Murnova Ulica",
+    "Muzejska Ulica",
+    "Na Brežini",
+    "Na Cvetači",
+    "Na Delih",
+    "Na Dolih",
+    "Na Gaju",
+    "Na Gmajni",
+    "Na Griču",
+    "Na Herši",
+    "Na Jami",
+    "Na Klančku",
+    "Na Korošci",
+    "Na Palcah",
+    "Na Peči",
+    "Na Požaru",
+    "Na Produ",
+    "Na Rojah",
+    "Na Stolbi",
+    "Na Straški Vrh",
+    "Na Tezi",
+    "Na Trati",
+    "Na Žalah",
+    "Nade Ovčakove Ulica",
+    "Nadgoriška Cesta",
+    "Nagodetova Ulica",
+    "Nahlikova Ulica",
+    "Nahtigalova Ulica",
+    "Nanoška Ulica",
+    "Nasperska Pot",
+    "Nazorjeva Ulica",
+    "Nedohova Ulica",
+    "Neubergerjeva Ulica",
+    "Njegoševa Cesta",
+    "Nova Ulica",
+    "Novakova Pot",
+    "Novakova Ulica",
+    "Nove Fužine",
+    "Novi Trg",
+    "Novinarska Ulica",
+    "Novo Naselje",
+    "Novo Polje, Cesta I",
+    "Novo Polje, Cesta Ii",
+    "Novo Polje, Cesta Iii",
+    "Novo Polje, Cesta Iv",
+    "Novo Polje, Cesta Ix",
+    "Novo Polje, Cesta V",
+    "Novo Polje, Cesta Vi",
+    "Novo Polje, Cesta Vii",
+    "Novo Polje, Cesta Viii",
+    "Novo Polje, Cesta X",
+    "Novo Polje, Cesta Xi",
+    "Novo Polje, Cesta Xii",
+    "Novo Polje, Cesta Xiii",
+    "Novo Polje, Cesta Xiv",
+    "Novo Polje, Cesta Xix",
+    "Novo Polje, Cesta Xv",
+    "Novo Polje, Cesta Xvi",
+    "Novo Polje, Cesta Xvii",
+    "Novo Polje, Cesta Xviii",
+    "Novo Polje, Cesta Xxi",
+    "Novo Polje, Cesta Xxiii",
+    "Novosadska Ulica",
+    "Nusdorferjeva Ulica",
+    "Ob Daljnovodu",
+    "Ob Dolenjski Železnici",
+    "Ob Farjevcu",
+    "Ob Kamniški Progi",
+    "Ob Ljubljanici",
+    "Ob Mejašu",
+    "Ob Potoku",
+    "Ob Pristanu",
+    "Ob Savi",
+    "Ob Sotočju",
+    "Ob Studencu",
+    "Ob Zdravstvenem Domu",
+    "Ob Zeleni Jami",
+    "Ob Zelenici",
+    "Ob Železnici",
+    "Ob Žici",
+    "Obirska Ulica",
+    "Obrežna Steza",
+    "Obrije",
+    "Obvozna Cesta",
+    "Ocvirkova Ulica",
+    "Ogrinčeva Ulica",
+    "Okiškega Ulica",
+    "Okrogarjeva Ulica",
+    "Omahnova Ulica",
+    "Omejčeva Ulica",
+    "Omersova Ulica",
+    "Opekarska Cesta",
+    "Oražnova Ulica",
+    "Orlova Ulica",
+    "Osenjakova Ulica",
+    "Oslavijska Ulica",
+    "Osojna Pot",
+    "Osterčeva Ulica",
+    "Ovčakova Ulica",
+    "Pahorjeva Ulica",
+    "Palmejeva Ulica",
+    "Pance",
+    "Papirniška Pot",
+    "Papirniški Trg",
+    "Parmova Ulica",
+    "Parmska Cesta",
+    "Partizanska Ulica",
+    "Pasterkova Pot",
+    "Pavlovčeva Ulica",
+    "Pavšičeva Ulica",
+    "Pečarjeva Ulica",
+    "Pečinska Ulica",
+    "Pečnik",
+    "Pečnikova Ulica",
+    "Pegamova Ulica",
+    "Perčeva Ulica",
+    "Peričeva Ulica",
+    "Periška Cesta",
+    "Perkova Ulica",
+    "Peršinova Cesta",
+    "Peruzzijeva Ulica",
+    "Pesarska Cesta",
+    "Pestotnikova Ulica",
+    "Peščena Pot",
+    "Petkova Ulica",
+    "Petkovškovo Nabrežje",
+    "Petrčeva Ulica",
+    "Petričeva Ulica",
+    "Pilonova Ulica",
+    "Pionirska Pot",
+    "Pipanova Pot",
+    "Pirnatova Ulica",
+    "Pivovarniška Ulica",
+    "Planinska Cesta",
+    "Planinškova Ulica",
+    "Plečnikov Podhod",
+    "Plečnikov Trg",
+    "Plemljeva Ulica",
+    "Plešičeva Ulica",
+    "Pleteršnikova Ulica",
+    "Plevančeva Ulica",
+    "Pločanska Ulica",
+    "Pod Akacijami",
+    "Pod Bregom",
+    "Pod Bresti",
+    "Pod Brezami",
+    "Pod Bukvami",
+    "Pod Debnim Vrhom",
+    "Pod Gabri",
+    "Pod Gozdom",
+    "Pod Gričem",
+    "Pod Hrasti",
+    "Pod Hribom",
+    "Pod Hruško",
+    "Pod Jelšami",
+    "Pod Jeseni",
+    "Pod Jezom",
+    "Pod Ježami",
+    "Pod Kamno Gorico",
+    "Pod Klancem",
+    "Pod Kostanji",
+    "Pod Lipami",
+    "Pod Topoli",
+    "Pod Trančo",
+    "Pod Turnom",
+    "Pod Vrbami",
+    "Podgorica",
+    "Podgornikova Ulica",
+    "Podgorska Cesta",
+    "Podgrajska Cesta",
+    "Podhod Ajdovščina",
+    "Podjunska Ulica",
+    "Podlimbarskega Ulica",
+    "Podlipoglav",
+    "Podmilščakova Ulica",
+    "Podmolniška Cesta",
+    "Podrožniška Pot",
+    "Podutiška Cesta",
+    "Podvozna Pot",
+    "Pogačarjev Trg",
+    "Pohlinova Ulica",
+    "Poklukarjeva Ulica",
+    "Pokopališka Ulica",
+    "Polakova Ulica",
+    "Polanškova Ulica",
+    "Poljanska Cesta",
+    "Poljanski Nasip",
+    "Polje",
+    "Polje, Cesta Ii",
+    "Polje, Cesta V",
+    "Polje, Cesta Vi",
+    "Polje, Cesta Viii",
+    "Polje, Cesta X",
+    "Polje, Cesta Xii",
+    "Polje, Cesta Xiv",
+    "Polje, Cesta Xl",
+    "Polje, Cesta Xliv",
+    "Polje, Cesta Xlvi",
+    "Polje, Cesta Xvi",
+    "Polje, Cesta Xviii",
+    "Polje, Cesta Xx",
+    "Polje, Cesta Xxii",
+    "Polje, Cesta Xxiv",
+    "Polje, Cesta Xxvi",
+    "Polje, Cesta Xxviii",
+    "Polje, Cesta Xxx",
+    "Polje, Cesta Xxxii",
+    "Polje, Cesta Xxxiv",
+    "Polje, Cesta Xxxvi",
+    "Polje, Cesta Xxxviii",
+    "Poljedelska Ulica",
+    "Poljska Pot",
+    "Popovičeva Ulica",
+    "Porentova Ulica",
+    "Posavskega Ulica",
+    "Postojnska Ulica",
+    "Pot Čez Gmajno",
+    "Pot Do Šole",
+    "Pot Draga Jakopiča",
+    "Pot Heroja Trtnika",
+    "Pot Ilegalcev",
+    "Pot K Igrišču",
+    "Pot K Izviru",
+    "Pot K Ribniku",
+    "Pot K Savi",
+    "Pot K Sejmišču",
+    "Pot K Skakalnici",
+    "Pot K Studencu",
+    "Pot Na Breje",
+    "Pot Na Drenikov Vrh",
+    "Pot Na Fužine",
+    "Pot Na Golovec",
+    "Pot Na Goro",
+    "Pot Na Gradišče",
+    "Pot Na Grič",
+    "Pot Na Hreše",
+    "Pot Na Labar",
+    "Pot Na Mah",
+    "Pot Na Most",
+    "Pot Na Orle",
+    "Pot Na Rakovo Jelšo",
+    "Pot Na Visoko",
+    "Pot Na Zduše",
+    "Pot Rdečega Križa",
+    "Pot Sodarjev",
+    "Pot V Boršt",
+    "Pot V Čeželj",
+    "Pot V Dolino",
+    "Pot V Goričico",
+    "Pot V Hrastovec",
+    "Pot V Hribec",
+    "Pot V Mejah",
+    "Pot V Mlake",
+    "Pot V Podgorje",
+    "Pot V Smrečje",
+    "Pot V Zeleni Gaj",
+    "Pot Za Brdom",
+    "Pot Za Razori",
+    "Potočnikova Ulica",
+    "Potokarjeva Ulica",
+    "Potrčeva Ulica",
+    "Povšetova Ulica",
+    "Praprotnikova Ulica",
+    "Prašnikarjeva Ulica",
+    "Praznikova Ulica",
+    "Pražakova Ulica",
+    "Prečna Ulica",
+    "Pred Savljami",
+    "Predjamska Cesta",
+    "Pregljeva Ulica",
+    "Preglov Trg",
+    "Prekmurska Ulica",
+    "Prelčeva Ulica",
+    "Preloge",
+    "Prelovčeva Ulica",
+    "Premrlova Ulica",
+    "Preradovićeva Ulica",
+    "Preserska Ulica",
+    "Presetnikova Ulica",
+    "Prešernov Trg",
+    "Prešernova Cesta",
+    "Pretnarjeva Ulica",
+    "Prežganje",
+    "Prežihova Ulica",
+    "Pri Borštu",
+    "Pri Malem Kamnu",
+    "Pri Mostiščarjih",
+    "Pri Velikem Kamnu",
+    "Pribinova Ulica",
+    "Prijateljeva Ulica",
+    "Primorska Ulica",
+    "Primožičeva Ulica",
+    "Prinčičeva Ulica",
+    "Prisojna Ulica",
+    "Prištinska Ulica",
+    "Privoz",
+    "Privškova Ulica",
+    "Proletarska Cesta",
+    "Prule",
+    "Prušnikova Ulica",
+    "Prvomajska Ulica",
+    "Pržanjska Ulica",
+    "Pšatnik",
+    "Pšatska Pot",
+    "Ptujska Ulica",
+    "Pugljeva Ulica",
+    "Puharjeva Ulica",
+    "Puhova Ulica",
+    "Puhtejeva Ulica",
+    "Pustovrhova Ulica",
+    "Puterlejeva Ulica",
+    "Putrihova Ulica",
+    "Raičeva Ulica",
+    "Rakarska Ulica",
+    "Rakovniška Ulica",
+    "Rakuševa Ulica",
+    "Ramovševa Ulica",
+    "Rašica",
+    "Rašiška Ulica",
+    "Ravbarjeva Ulica",
+    "Ravna Pot",
+    "Ravnikova Ulica",
+    "Ravno Brdo",
+    "Razdevškova Ulica",
+    "Reber",
+    "Reboljeva Ulica",
+    "Rečna Ulica",
+    "Redelonghijeva Ulica",
+    "Regentova Cesta",
+    "Repče",
+    "Resljeva Cesta",
+    "Reška Ulica",
+    "Rezijanska Ulica",
+    "Ribičičeva Ulica",
+    "Ribji Trg",
+    "Ribniška Ulica",
+    "Riharjeva Ulica",
+    "Rimska Cesta",
+    "Rjava Cesta",
+    "Robbova Ulica",
+    "Robičeva Ulica",
+    "Rocenska Ulica",
+    "Rodičeva Ulica",
+    "Rojčeva Ulica",
+    "Romavhova Ulica",
+    "Rosna Pot",
+    "Roška Cesta",
+    "Rotarjeva Ulica",
+    "Rovšnikova Ulica",
+    "Rozmanova Ulica",
+    "Rožančeva Cesta",
+    "Rožanska Ulica",
+    "Rožičeva Ulica",
+    "Rožna Dolina, Cesta I",
+    "Rožna Dolina, Cesta Ii",
+    "Rožna Dolina, Cesta Iii",
+    "Rožna Dolina, Cesta Iv",
+    "Rožna Dolina, Cesta Ix",
+    "Rožna Dolina, Cesta V",
+    "Rožna Dolina, Cesta Vi",
+    "Rožna Dolina, Cesta Vii",
+    "Rožna Dolina, Cesta Viii",
+    "Rožna Dolina, Cesta X",
+    "Rožna Dolina, Cesta Xi",
+    "Rožna Dolina, Cesta Xii",
+    "Rožna Dolina, Cesta Xiii",
+    "Rožna Dolina, Cesta Xix",
+    "Rožna Dolina, Cesta Xv",
+    "Rožna Dolina, Cesta Xvii",
+    "Rožna Dolina, Cesta Xxi",
+    "Rožna Ulica",
+    "Rudnik I",
+    "Rudnik Ii",
+    "Rudnik Iii",
+    "Runkova Ulica",
+    "Rusjanov Trg",
+    "Ruska Ulica",
+    "Rutarjeva Ulica",
+    "Sadinja Vas",
+    "Sajovčeva Ulica",
+    "Salendrova Ulica",
+    "Samova Ulica",
+    "Saškova Ulica",
+    "Sattnerjeva Ulica",
+    "Saveljska Cesta",
+    "Savinova Ulica",
+    "Savinškova Ulica",
+    "Savlje",
+    "Savska Cesta",
+    "Scopolijeva Ulica",
+    "Sedejeva Ulica",
+    "Selanov Trg",
+    "Selanova Ulica",
+    "Seliškarjeva Ulica",
+    "Selo Pri Pancah",
+    "Setnikarjeva Ulica",
+    "Seunigova Ulica",
+    "Simončičeva Ulica",
+    "Simonitijeva Ulica",
+    "Siva Pot",
+    "Skapinova Ulica",
+    "Sketova Ulica",
+    "Skopčeva Ulica",
+    "Skopska Ulica",
+    "Skrbinškova Ulica",
+    "Slape",
+    "Slapnikova Ulica",
+    "Slavčja Ulica",
+    "Slodnjakova Ulica",
+    "Slomškova Ulica",
+    "Slovenčeva Ulica",
+    "Slovenska Cesta",
+    "Smerdujeva Ulica",
+    "Smoletova Ulica",
+    "Smrekarjeva Ulica",
+    "Smrtnikova Ulica",
+    "Sneberska Cesta",
+    "Snebersko Nabrežje",
+    "Snežniška Ulica",
+    "Snojeva Ulica",
+    "Sodarska Steza",
+    "Sojerjeva Ulica",
+    "Sončna Pot",
+    "Sostrska Cesta",
+    "Soška Ulica",
+    "Soteska",
+    "Soteška Pot",
+    "Soussenska Ulica",
+    "Sovretova Ulica",
+    "Splitska Ulica",
+    "Spodnje Gameljne",
+    "Spodnji Rudnik I",
+    "Spodnji Rudnik Ii",
+    "Spodnji Rudnik Iii",
+    "Spodnji Rudnik Iv",
+    "Spodnji Rudnik V",
+    "Spomeniška Pot",
+    "Srebrničeva Ulica",
+    "Središka Ulica",
+    "Srednja Pot",
+    "Srednje Gameljne",
+    "Stadionska Ulica",
+    "Stanežiče",
+    "Staničeva Ulica",
+    "Stantetova Ulica",
+    "Stara Ježica",
+    "Stara Slovenska Ulica",
+    "Stare Črnuče",
+    "Staretova Ulica",
+    "Stari Trg",
+    "Stegne",
+    "Steletova Ulica",
+    "Sternadova Ulica",
+    "Sternenova Ulica",
+    "Stiška Ulica",
+    "Stolpniška Ulica",
+    "Stoženska Ulica",
+    "Stožice",
+    "Stranska Pot",
+    "Stražarjeva Ulica",
+    "Streliška Ulica",
+    "Stritarjeva Ulica",
+    "Strmec",
+    "Strmeckijeva Ulica",
+    "Strmi Pot",
+    "Strniševa Cesta",
+    "Strojeva Ulica",
+    "Strossmayerjeva Ulica",
+    "Strugarska Ulica",
+    "Studenec",
+    "Suhadolčanova Ulica",
+    "Sulčja Ulica",
+    "Svetčeva Ulica",
+    "Svetosavska Ulica",
+    "Šarhova Ulica",
+    "Šentjakob",
+    "Šentpavel",
+    "Šentviška Ulica",
+    "Šercerjeva Ulica",
+    "Šerkova Ulica",
+    "Šestova Ulica",
+    "Šibeniška Ulica",
+    "Šifrerjeva Ulica",
+    "Šinkov Štradon",
+    "Šišenska Cesta",
+    "Šivičeva Ulica",
+    "Škerjančeva Ulica",
+    "Škerljeva Ulica",
+    "Škofova Ulica",
+    "Škrabčeva Ulica",
+    "Šlajmerjeva Ulica",
+    "Šlandrova Ulica",
+    "Šlosarjeva Ulica",
+    "Šmarna Gora",
+    "Šmarnogorska Pot",
+    "Šmartinska Cesta",
+    "Šmartno",
+    "Španova Pot",
+    "Španska Ulica",
+    "Športna Ulica",
+    "Štajerska Cesta",
+    "Štebijeva Cesta",
+    "Štefančeva Ulica",
+    "Štefanova Ulica",
+    "Štembalova Ulica",
+    "Štepanjska Cesta",
+    "Štepanjsko Nabrežje",
+    "Štihova Ulica",
+    "Štirnova Ulica",
+    "Štrekljeva Ulica",
+    "Štrukljeva Ulica",
+    "Študentovska Ulica",
+    "Štukljeva Cesta",
+    "Štula",
+    "Štularjeva Ulica",
+    "Šturmova Ulica",
+    "Šubičeva Ulica",
+    "Šumarjeva Ulica",
+    "Švabićeva Ulica",
+    "Švarova Ulica",
+    "Švedska Ulica",
+    "Švegljeva Cesta",
+    "Tabor",
+    "Taborska Cesta",
+    "Tacenska Cesta",
+    "Tavčarjeva Ulica",
+    "Tbilisijska Ulica",
+    "Tehnološki Park",
+    "Tesarska Ulica",
+    "Teslova Ulica",
+    "Tesna Ulica",
+    "Tesovnikova Ulica",
+    "Thumova Ulica",
+    "Tiha Ulica",
+    "Tiranova Ulica",
+    "Tischlerjeva Ulica",
+    "Tisnikarjeva Ulica",
+    "Tivolska Cesta",
+    "Tkalska Ulica",
+    "Tobačna Ulica",
+    "Tolminska Ulica",
+    "Tolstojeva Ulica",
+    "Tomačevo",
+    "Tomačevska Cesta",
+    "Tomažičeva Ulica",
+    "Tomčeva Ulica",
+    "Tometova Ulica",
+    "Tominškova Ulica",
+    "Tomišeljska Ulica",
+    "Tomšičeva Ulica",
+    "Toplarniška Ulica",
+    "Topniška Ulica",
+    "Torkarjeva Ulica",
+    "Toško Čelo",
+    "Tovarniška Ulica",
+    "Tratnikova Ulica",
+    "Travniška Ulica",
+    "Trbeže",
+    "Trdinova Ulica",
+    "Trebinjska Ulica",
+    "Trebušakova Ulica",
+    "Trg 9. Maja",
+    "Trg Francoske Revolucije",
+    "Trg Komandanta Staneta",
+    "Trg Mladih",
+    "Trg Mladinskih Delov. Brigad",
+    "Trg Osvobodilne Fronte",
+    "Trg Prekomorskih Brigad",
+    "Trg Republike",
+    "Triglavska Ulica",
+    "Trinkova Ulica",
+    "Trnovčeva Ulica",
+    "Trnovska Ulica",
+    "Trnovski Pristan",
+    "Trpinčeva Ulica",
+    "Trstenjakova Ulica",
+    "Trtnikova Ulica",
+    "Trubarjeva Cesta",
+    "Tržaška Cesta",
+    "Tržna Ulica",
+    "Tugomerjeva Ulica",
+    "Tuji Grm",
+    "Turjaška Ulica",
+    "Turnerjeva Ulica",
+    "Udvančeva Ulica",
+    "Ukmarjeva Ulica",
+    "Ulica 15. Aprila",
+    "Ulica 15. Maja",
+    "Ulica 24. Avgusta",
+    "Ulica 28. Maja",
+    "Ulica 9. Junija",
+    "Ulica Aktivistov",
+    "Ulica Alme Sodnik",
+    "Ulica Alojza Kajina",
+    "Ulica Ambrožiča Novljana",
+    "Ulica Andreja Kumarja",
+    "Ulica Ane Ziherlove",
+    "Ulica Angelce Ocepkove",
+    "Ulica Angele Ljubičeve",
+    "Ulica Angele Vode",
+    "Ulica Bena Zupančiča",
+    "Ulica Borca Petra",
+    "Ulica Borcev Za Severno Mejo",
+    "Ulica Bratov Babnik",
+    "Ulica Bratov Bezlajev",
+    "Ulica Bratov Blanč",
+    "Ulica Bratov Jančar",
+    "Ulica Bratov Knapič",
+    "Ulica Bratov Komel",
+    "Ulica Bratov Kraljič",
+    "Ulica Bratov Martinec",
+    "Ulica Bratov Miklič",
+    "Ulica Bratov Novak",
+    "Ulica Bratov Rozmanov",
+    "Ulica Bratov Škofov",
+    "Ulica Bratov Tuma",
+    "Ulica Bratov Učakar",
+    "Ulica Bratov Židan",
+    "Ulica Carla Benza",
+    "Ulica Dušana Kraigherja",
+    "Ulica Ekvorna",
+    "Ulica Ernesta Kramerja",
+    "Ulica Ferda Kozaka",
+    "Ulica Franca Mlakarja",
+    "Ulica Franca Nebca",
+    "Ulica Franje Koširjeve",
+    "Ulica Gledališča Btc",
+    "Ulica Goce Delčeva",
+    "Ulica Gradnikove Brigade",
+    "Ulica Gubčeve Brigade",
+    "Ulica Hermana Potočnika",
+    "Ulica Iga Grudna",
+    "Ulica Ivana Roba",
+    "Ulica Ivane Kobilce",
+    "Ulica Ivanke Kožuh",
+    "Ulica Ivice Pirjevčeve",
+    "Ulica Jana Husa",
+    "Ulica Janeza Pavla Ii.",
+    "Ulica Janeza Rožiča",
+    "Ulica Josipine Turnograjske",
+    "Ulica Jožeta Jame",
+    "Ulica Jožeta Japlja",
+    "Ulica Jožeta Mirtiča",
+    "Ulica Jožeta Štruklja",
+    "Ulica Juša Kozaka",
+    "Ulica Konrada Babnika",
+    "Ulica Koroškega Bataljona",
+    "Ulica Lili Novy",
+    "Ulica Lizike Jančarjeve",
+    "Ulica Lojzeta Spacala",
+    "Ulica Lojzke Štebijeve",
+    "Ulica Lovre Klemenčiča",
+    "Ulica Malči Beličeve",
+    "Ulica Manice Komanove",
+    "Ulica Marije Drakslerjeve",
+    "Ulica Marije Hvaličeve",
+    "Ulica Marije Mlinar",
+    "Ulica Marje Boršnikove",
+    "Ulica Marka Šlajmerja",
+    "Ulica Metoda Mikuža",
+    "Ulica Milana Majcna",
+    "Ulica Milke Kerinove",
+    "Ulica Minke Bobnar",
+    "Ulica Mire Miheličeve",
+    "Ulica Mirka Jurce",
+    "Ulica Mirka Tomšiča",
+    "Ulica Miroslava Kokolja",
+    "Ulica Miroslava Turka",
+    "Ulica Miru",
+    "Ulica Molniške Čete",
+    "Ulica Na Grad",
+    "Ulica Nade Čamernikove",
+    "Ulica Nadgoriških Borcev",
+    "Ulica Olge Mohorjeve",
+    "Ulica Padlih Borcev",
+    "Ulica Pariške Komune",
+    "Ulica Pavle Jeromnove",
+    "Ulica Pohorskega Bataljona",
+    "Ulica Polonce Čude",
+    "Ulica Pregnancev",
+    "Ulica Prvoborcev",
+    "Ulica Rezke Dragarjeve",
+    "Ulica Rozke Usenik",
+    "Ulica Rudolfa Janežiča",
+    "Ulica Staneta Severja",
+    "Ulica Stare Pravde",
+    "Ulica Štefke Zbašnikove",
+    "Ulica Talcev",
+    "Ulica Tomšičeve Brigade",
+    "Ulica Tončke Čečeve",
+    "Ulica V Kokovšek",
+    "Ulica Vida Khisla",
+    "Ulica Vide Janežičeve",
+    "Ulica Vide Pregarčeve",
+    "Ulica Vladimirja Trampuža",
+    "Ulica Za Travniki",
+    "Ulica Zore Majcnove",
+    "Ulica Zore Ragancinove",
+    "Ulica Žanke Erjavec",
+    "Ulica Željka Tonija",
+    "Uraničeva Ulica",
+    "Uršičev Štradon",
+    "Usnjarska Ulica",
+    "V Češnjico",
+    "V Dolini",
+    "V Dovjež",
+    "V Karlovce",
+    "V Karlovce",
+    "V Kladeh",
+    "V Murglah",
+    "V Sige",
+    "V Toplice",
+    "V Varde",
+    "V Zalar",
+    "Vagajeva Ulica",
+    "Valjavčeva Ulica",
+    "Valjhunova Ulica",
+    "Valvasorjeva Ulica",
+    "Vandotova Ulica",
+    "Vaška Pot",
+    "Vavpotičeva Ulica",
+    "Večna Pot",
+    "Vegova Ulica",
+    "Velebitska Ulica",
+    "Velika Čolnarska Ulica",
+    "Veliki Lipoglav",
+    "Veliki Štradon",
+    "Veliko Trebeljevo",
+    "Velikovška Ulica",
+    "Velnarjeva Ulica",
+    "Verdnikova Ulica",
+    "Verovškova Ulica",
+    "Veršičeva Ulica",
+    "Veselova Ulica",
+    "Vevška Cesta",
+    "Videmska Ulica",
+    "Vidergarjeva Ulica",
+    "Vidičeva Ulica",
+    "Vidmarjeva Ulica",
+    "Vidovdanska Cesta",
+    "Vilharjev Podhod",
+    "Vilharjeva Cesta",
+    "Vinčarjeva Ulica",
+    "Vinterca",
+    "Vipavska Ulica",
+    "Vipotnikova Ulica",
+    "Viška Cesta",
+    "Višnjevarjeva Ulica",
+    "Vižmarska Pot",
+    "Vnajnarje",
+    "Vodmatska Ulica",
+    "Vodna Steza",
+    "Vodnikov Trg",
+    "Vodnikova Cesta",
+    "Vodnikovo Naselje",
+    "Vodovodna Cesta",
+    "Voduškova Ulica",
+    "Vogelna Ulica",
+    "Vojkova Cesta",
+    "Volaričeva Ulica",
+    "Volarjev Štradon",
+    "Volavlje",
+    "Vošnjakova Ulica",
+    "Vožarski Pot",
+    "Vranja Pot",
+    "Vrazov Trg",
+    "Vrbovec",
+    "Vrbska Ulica",
+    "Vregova Ulica",
+    "Vrhovci, Cesta I",
+    "Vrhovci, Cesta Ii",
+    "Vrhovci, Cesta Iii",
+    "Vrhovci, Cesta Iv",
+    "Vrhovci, Cesta Ix",
+    "Vrhovci, Cesta V",
+    "Vrhovci, Cesta Vi",
+    "Vrhovci, Cesta Viii",
+    "Vrhovci, Cesta X",
+    "Vrhovci, Cesta Xi",
+    "Vrhovci, Cesta Xii",
+    "Vrhovci, Cesta Xiii",
+    "Vrhovci, Cesta Xiv",
+    "Vrhovci, Cesta Xix",
+    "Vrhovci, Cesta Xv",
+    "Vrhovci, Cesta Xvi",
+    "Vrhovci, Cesta Xvii",
+    "Vrhovci, Cesta Xviii",
+    "Vrhovci, Cesta Xx",
+    "Vrhovci, Cesta Xxi",
+    "Vrhovci, Cesta Xxii",
+    "Vrhovci, Cesta Xxvi",
+    "Vrhovci, Cesta Xxviii",
+    "Vrhovci, Cesta Xxx",
+    "Vrhovci, Cesta Xxxii",
+    "Vrhovčeva Ulica",
+    "Vrhovnikova Ulica",
+    "Vrščajeva Ulica",
+    "Vrtača",
+    "Vrtna Ulica",
+    "Vrtnarska Cesta",
+    "Vulčeva Ulica",
+    "Vurnikova Ulica",
+    "Vzajemna Ulica",
+    "Windischerjeva Ulica",
+    "Wolfova Ulica",
+    "Za Čreslom",
+    "Za Garažami",
+    "Za Gasilskim Domom",
+    "Za Gradom",
+    "Za Krajem",
+    "Za Opekarno",
+    "Za Partizanskim Domom",
+    "Za Progo",
+    "Za Vasjo",
+    "Zabretova Ulica",
+    "Zadnikarjeva Ulica",
+    "Zadobrovška Cesta",
+    "Zadružna Ulica",
+    "Zagradišče",
+    "Zagrebška Ulica",
+    "Zajčeva Pot",
+    "Zajčevi Dvori",
+    "Zakotnikova Ulica",
+    "Zakrajškova Ulica",
+    "Zalaznikova Ulica",
+    "Zaletelova Ulica",
+    "Zaloška Cesta",
+    "Zapuška Cesta",
+    "Zarnikova Ulica",
+    "Zasavska Cesta",
+    "Zavetiška Ulica",
+    "Zavoglje",
+    "Završje",
+    "Zbašnikova Ulica",
+    "Zdešarjeva Cesta",
+    "Zdravstvena Pot",
+    "Zelena Pot",
+    "Zelenova Ulica",
+    "Zeljarska Ulica",
+    "Zemljemerska Ulica",
+    "Zevnikova Ulica",
+    "Zgornja Besnica",
+    "Zgornje Gameljne",
+    "Ziherlova Ulica",
+    "Ziljska Ulica",
+    "Zlatek",
+    "Znamenjska Ulica",
+    "Zofke Kvedrove Ulica",
+    "Zoisova Cesta",
+    "Zoletova Ulica",
+    "Zupanova Ulica",
+    "Zvezda",
+    "Zvezdarska Ulica",
+    "Zvezna Ulica",
+    "Zvonarska Ulica",
+    "Žabarjeva Ulica",
+    "Žabja Ulica",
+    "Žabjak",
+    "Žalska Ulica",
+    "Žaucerjeva Ulica",
+    "Žebretova Ulica",
+    "Žeje",
+    "Železna Cesta",
+    "Železnikarjeva Ulica",
+    "Žerjalova Ulica",
+    "Žibertova Ulica",
+    "Židankova Ulica",
+    "Židovska Steza",
+    "Židovska Ulica",
+    "Žigonova Ulica",
+    "Živaličeva Ulica",
+    "Živinozdravska Ulica",
+    "Žolgerjeva Ulica",
+    "Žorgova Ulica",
+    "Župančičeva Ulica"
+]
+
+# Approximate centroids of the streets above, (latitude, longitude)
+LJUBLJANA_STREET_CENTROIDS = {
+    "Slovenska Cesta": (46.0530, 14.5035),
+    "Prešernov Trg": (46.0514, 14.5061),
+    "Mestni Trg": (46.0493, 14.5066),
+    "Stari Trg": (46.0475, 14.5062),
+    "Gornji Trg": (46.0470, 14.5085),
+    "Kongresni Trg": (46.0503, 14.5033),
+    "Ciril-Metodov Trg": (46.0505, 14.5093),
+    "Vodnikov Trg": (46.0510, 14.5098),
+    "Pogačarjev Trg": (46.0513, 14.5085),
+    "Krekov Trg": (46.0500, 14.5105),
+    "Wolfova Ulica": (46.0508, 14.5052),
+    "Čopova Ulica": (46.0523, 14.5042),
+    "Trubarjeva Cesta": (46.0530, 14.5100),
+    "Miklošičeva Cesta": (46.0545, 14.5065),
+    "Resljeva Cesta": (46.0540, 14.5110),
+    "Masarykova Cesta": (46.0580, 14.5110),
+    "Gosposvetska Cesta": (46.0555, 14.5015),
+    "Tivolska Cesta": (46.0575, 14.5030),
+    "Cankarjeva Cesta": (46.0525, 14.5010),
+    "Vegova Ulica": (46.0485, 14.5025),
+    "Aškerčeva Cesta": (46.0470, 14.4990),
+    "Rimska Cesta": (46.0485, 14.4990),
+    "Zoisova Cesta": (46.0460, 14.5010),
+    "Barjanska Cesta": (46.0385, 14.4990),
+    "Karlovška Cesta": (46.0440, 14.5130),
+    "Roška Cesta": (46.0420, 14.5160),
+    "Poljanska Cesta": (46.0500, 14.5200),
+    "Njegoševa Cesta": (46.0555, 14.5210),
+    "Komenskega Ulica": (46.0555, 14.5140),
+    "Kersnikova Ulica": (46.0565, 14.5070),
+    "Dalmatinova Ulica": (46.0555, 14.5095),
+    "Tabor": (46.0555, 14.5175),
+    "Ilirska Ulica": (46.0530, 14.5175),
+    "Pražakova Ulica": (46.0560, 14.5105),
+    "Prešernova Cesta": (46.0515, 14.4990),
+    "Gerbičeva Ulica": (46.0415, 14.4985),
+    "Jamova Cesta": (46.0430, 14.4910),
+    "Tržaška Cesta": (46.0440, 14.4820),
+    "Viška Cesta": (46.0410, 14.4790),
+    "Večna Pot": (46.0520, 14.4690),
+    "Rakovniška Ulica": (46.0350, 14.5190),
+    "Dolenjska Cesta": (46.0330, 14.5210),
+    "Ižanska Cesta": (46.0290, 14.5120),
+    "Galjevica": (46.0335, 14.5250),
+    "Peruzzijeva Ulica": (46.0290, 14.5240),
+    "Litijska Cesta": (46.0470, 14.5520),
+    "Zaloška Cesta": (46.0560, 14.5480),
+    "Pot Na Fužine": (46.0500, 14.5640),
+    "Šmartinska Cesta": (46.0650, 14.5350),
+    "Letališka Cesta": (46.0660, 14.5560),
+    "Leskoškova Cesta": (46.0600, 14.5560),
+    "Chengdujska Cesta": (46.0530, 14.5820),
+    "Bratislavska Cesta": (46.0690, 14.5410),
+    "Jarška Cesta": (46.0740, 14.5420),
+    "Tomačevska Cesta": (46.0800, 14.5250),
+    "Štajerska Cesta": (46.0800, 14.5330),
+    "Dunajska Cesta": (46.0760, 14.5125),
+    "Linhartova Cesta": (46.0670, 14.5140),
+    "Topniška Ulica": (46.0690, 14.5100),
+    "Parmova Ulica": (46.0695, 14.5085),
+    "Vojkova Cesta": (46.0710, 14.5200),
+    "Kajuhova Ulica": (46.0610, 14.5310),
+    "Opekarska Cesta": (46.0370, 14.5030),
+    "Celovška Cesta": (46.0710, 14.4850),
+    "Vodnikova Cesta": (46.0640, 14.4950),
+    "Derčeva Ulica": (46.0665, 14.4875),
+    "Šišenska Cesta": (46.0640, 14.4830),
+    "Drenikova Ulica": (46.0650, 14.4920),
+    "Litostrojska Cesta": (46.0730, 14.4790),
+    "Podutiška Cesta": (46.0690, 14.4600),
+    "Koseška Cesta": (46.0710, 14.4720),
+    "Vodovodna Cesta": (46.0730, 14.5000),
+    "Runkova Ulica": (46.0770, 14.4700),
+    "Povšetova Ulica": (46.0470, 14.5300),
+    "Grablovičeva Ulica": (46.0510, 14.5280),
+    "Kotnikova Ulica": (46.0550, 14.5130),
+    "Jurčkova Cesta": (46.0280, 14.5270),
+    "Cesta Dolomitskega Odreda": (46.0320, 14.4750),
+    "Cesta V Mestni Log": (46.0360, 14.4950),
+    "Tbilisijska Ulica": (46.0380, 14.4740),
+    "Mladinska Ulica": (46.0310, 14.5200),
+    "Rusjanov Trg": (46.0520, 14.5450),
+    "Dolgi Most": (46.0350, 14.4650),
+    "Prušnikova Ulica": (46.0960, 14.4580),
+    "Ob Ljubljanici": (46.0460, 14.5210),
+    "Polje": (46.0640, 14.5950),
+    "Cesta Na Brdo": (46.0450, 14.4700),
+    "Cesta Na Vrhovce": (46.0480, 14.4550),
+    "Cesta V Gameljne": (46.1060, 14.5130),
+    "Trg Republike": (46.0510, 14.5020),
+    "Trg Francoske Revolucije": (46.0478, 14.5035),
+    "Trg Osvobodilne Fronte": (46.0575, 14.5100),
+}
+
+# Četrtne skupnosti with approximate centres, (name, latitude, longitude)
+LJUBLJANA_DISTRICTS = [
+    ("Bežigrad", 46.0720, 14.5150),
+    ("Center", 46.0510, 14.5050),
+    ("Črna vas", 46.0250, 14.4800),
+    ("Dravlje", 46.0790, 14.4700),
+    ("Golovec", 46.0420, 14.5420),
+    ("Jarše", 46.0720, 14.5470),
+    ("Moste", 46.0570, 14.5400),
+    ("Polje", 46.0620, 14.5900),
+    ("Posavje", 46.0880, 14.5200),
+    ("Rožnik", 46.0520, 14.4780),
+    ("Rudnik", 46.0270, 14.5330),
+    ("Sostro", 46.0400, 14.6150),
+    ("Šentvid", 46.0990, 14.4620),
+    ("Šiška", 46.0680, 14.4880),
+    ("Šmarna gora", 46.1220, 14.4720),
+    ("Trnovo", 46.0390, 14.5000),
+    ("Vič", 46.0440, 14.4850),
+]
@@ -0,0 +1,258 @@
+"""
+Hotspot detection: DBSCAN over pending pobude.
+
+Neighbours are found through a uniform grid with cells of HOTSPOT_EPS_M, so
+each point is only compared with the points in its 3x3 block of cells, and
+the whole pass is vectorised with NumPy. Results are stored as Hotspot rows
+plus Pobuda.hotspot_id.
+
+A background HotspotWorker keeps them current. New or answered pobude are
+queued as dirty points and only the hotspots within reach of them are
+recomputed; a full pass runs at startup and periodically to pick up changes
+made outside the API.
+"""
+
+import queue
+import threading
+import traceback
+from collections import Counter
+from datetime import datetime
+import numpy as np
+from sqlalchemy import delete, or_, update
+from sqlmodel import Session, select
+from .database import engine
+from .models import Hotspot, Pobuda
+from .spatial import bbox_condition, haversine_m, pobuda_rtree, project_m, radius_bbox
+
+PENDING_STATUS = "v obravnavi"
+HOTSPOT_EPS_M = 75.0
+HOTSPOT_MIN_SAMPLES = 4
+
+_CELL_KEY_STRIDE = 1 << 32
+
+def _neighbor_pairs(xy, eps):
+    """All ordered pairs (i, j), i != j, closer than eps, via a grid of eps-sized cells"""
+    n = len(xy)
+    cells = np.floor(xy / eps).astype(np.int64)
+    keys = cells[:, 0] * _CELL_KEY_STRIDE + cells[:, 1]
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    pair_i, pair_j = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            target = keys + dx * _CELL_KEY_STRIDE + dy
+            start = np.searchsorted(sorted_keys, target, side="left")
+            counts = np.searchsorted(sorted_keys, target, side="right") - start
+            total = int(counts.sum())
+            if not total:
+                continue
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            pair_i.append(np.repeat(np.arange(n), counts))
+            pair_j.append(order[np.repeat(start, counts) + offsets])
+    if not pair_i:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    i = np.concatenate(pair_i)
+    j = np.concatenate(pair_j)
+    keep = (i != j) & (((xy[i] - xy[j]) ** 2).sum(axis=1) <= eps ** 2)
+    return i[keep], j[keep]
+
+def dbscan(latitudes, longitudes, eps: float = HOTSPOT_EPS_M, min_samples: int = HOTSPOT_MIN_SAMPLES):
+    """
+    Return (labels, core) for the points; labels are -1 for noise.
+
+    Connected components of core points are found by min-label propagation
+    with pointer jumping; border points take the smallest label of their
+    core neighbours.
+    """
+    n = len(latitudes)
+    labels = np.full(n, -1, dtype=np.int64)
+    if n == 0:
+        return labels, np.zeros(0, dtype=bool)
+    i, j = _neighbor_pairs(project_m(latitudes, longitudes), eps)
+    core = np.bincount(i, minlength=n) + 1 >= min_samples
+
+    component = np.arange(n)
+    core_edges = core[i] & core[j]
+    ci, cj = i[core_edges], j[core_edges]
+    while True:
+        updated = component.copy()
+        np.minimum.at(updated, ci, component[cj])
+        updated = updated[updated]
+        if np.array_equal(updated, component):
+            break
+        component = updated
+    labels[core] = component[core]
+
+    border_edges = ~core[i] & core[j]
+    if border_edges.any():
+        border = np.full(n, n, dtype=np.int64)
+        np.minimum.at(border, i[border_edges], component[j[border_edges]])
+        attached = border < n
+        labels[attached] = border[attached]
+    return labels, core
+
+def _pending_near(session, points, radius_m):
+    """Ids of pending pobude within radius_m of any of the points"""
+    ids = set()
+    for latitude, longitude in points:
+        ids.update(session.exec(
+            select(Pobuda.id)
+            .where(Pobuda.status == PENDING_STATUS)
+            .where(Pobuda.id.in_(
+                select(pobuda_rtree.c.id).where(bbox_condition(*radius_bbox(latitude, longitude, radius_m)))
+            ))
+        ).all())
+    return ids
+
+def _load(session, condition):
+    return session.exec(
+        select(Pobuda.id, Pobuda.latitude, Pobuda.longitude, Pobuda.hotspot_id, Pobuda.category, Pobuda.created_at)
+        .where(Pobuda.status == PENDING_STATUS, condition)
+    ).all()
+
+def recompute_hotspots(session: Session, dirty=None):
+    """
+    Recompute hotspots and commit.
+
+    dirty is None for a full pass, otherwise a list of (latitude, longitude,
+    previous hotspot_id) for pobude that were added to or removed from the
+    pending set. Only hotspots with members within 2 * eps of a dirty point
+    are rebuilt: farther points cannot change core status or connectivity.
+    Points within eps of the rebuilt set are loaded as context so core
+    status is computed from complete neighbourhoods.
+    """
+    if dirty is None:
+        rows = _load(session, True)
+        subset = np.ones(len(rows), dtype=bool)
+        replaced = None
+    else:
+        near_ids = _pending_near(session, [(lat, lng) for lat, lng, _ in dirty], 2 * HOTSPOT_EPS_M)
+        replaced = {hotspot_id for _, _, hotspot_id in dirty if hotspot_id is not None}
+        if near_ids:
+            replaced.update(h for h in session.exec(
+                select(Pobuda.hotspot_id).where(Pobuda.id.in_(near_ids), Pobuda.hotspot_id.is_not(None)).distinct()
+            ).all())
+        core_rows = _load(session, or_(Pobuda.id.in_(near_ids), Pobuda.hotspot_id.in_(replaced)))
+        if not core_rows:
+            if replaced:
+                session.execute(delete(Hotspot).where(Hotspot.id.in_(replaced)))
+                session.commit()
+            return
+        subset_ids = {row[0] for row in core_rows}
+        lats = [row[1] for row in core_rows]
+        lngs = [row[2] for row in core_rows]
+        min_lat, min_lng, _, _ = radius_bbox(min(lats), min(lngs), HOTSPOT_EPS_M)
+        _, _, max_lat, max_lng = radius_bbox(max(lats), max(lngs), HOTSPOT_EPS_M)
+        rows = _load(session, Pobuda.id.in_(
+            select(pobuda_rtree.c.id).where(bbox_condition(min_lat, min_lng, max_lat, max_lng))
+        ))
+        rows = list({row[0]: row for row in list(rows) + list(core_rows)}.values())
+        subset = np.fromiter((row[0] in subset_ids for row in rows), dtype=bool, count=len(rows))
+
+    ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    latitudes = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+    longitudes = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+    labels, core = dbscan(latitudes, longitudes)
+
+    # Only clusters anchored by a core point of the recomputed subset are rebuilt
+    anchored = set(labels[subset & core].tolist())
+    labels = np.where(subset & np.isin(labels, list(anchored)), labels, -1)
+
+    if replaced is None:
+        session.execute(delete(Hotspot))
+    elif replaced:
+        session.execute(delete(Hotspot).where(Hotspot.id.in_(replaced)))
+
+    assignments = {int(pobuda_id): None for pobuda_id in ids[subset]}
+    now = datetime.utcnow()
+    for label in anchored:
+        members = np.flatnonzero(labels == label)
+        center_lat = float(latitudes[members].mean())
+        center_lng = float(longitudes[members].mean())
+        created = [rows[m][5] for m in members]
+        hotspot = Hotspot(
+            latitude=center_lat,
+            longitude=center_lng,
+            count=len(members),
+            radius_m=float(haversine_m(center_lat, center_lng, latitudes[members], longitudes[members]).max()),
+            top_category=Counter(rows[m][4] for m in members).most_common(1)[0][0],
+            oldest_created_at=min(created),
+            newest_created_at=max(created),
+            computed_at=now
+        )
+        session.add(hotspot)
+        session.flush()
+        for m in members:
+            assignments[int(ids[m])] = hotspot.id
+
+    changed = [
+        {"id": row[0], "hotspot_id": assignments[row[0]]}
+        for row in rows
+        if row[0] in assignments and row[3] != assignments[row[0]]
+    ]
+    if changed:
+        session.execute(update(Pobuda), changed)
+    session.commit()
+
+class HotspotWorker:
+    """Background thread that applies queued hotspot updates in debounced batches"""
+
+    FULL = object()
+
+    def __init__(self, debounce: float = 1.0, full_interval: float = 900.0, max_dirty: int = 500):
+        self.debounce = debounce
+        self.full_interval = full_interval
+        self.max_dirty = max_dirty
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="hotspot-worker", daemon=True)
+        self._thread.start()
+        self.notify_full()
+
+    def stop(self):
+        self._stop.set()
+        self._queue.put(None)
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def notify(self, latitude: float, longitude: float, hotspot_id=None):
+        self._queue.put((latitude, longitude, hotspot_id))
+
+    def notify_full(self):
+        self._queue.put(self.FULL)
+
+    def _drain(self, first):
+        items = [first]
+        self._stop.wait(self.debounce)
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=self.full_interval)
+            except queue.Empty:
+                first = self.FULL
+            if self._stop.is_set():
+                return
+            items = [item for item in self._drain(first) if item is not None]
+            if not items:
+                continue
+            dirty = None if any(item is self.FULL for item in items) or len(items) > self.max_dirty else items
+            try:
+                with Session(engine) as session:
+                    recompute_hotspots(session, dirty)
+            except Exception as e:
+                print(f"Error recomputing hotspots: {str(e)}")
+                traceback.print_exc()
+
+hotspot_worker = HotspotWorker()
@@ -0,0 +1,524 @@
+"""
+Streaming import of converted pobude files.
+
+This is the one import pipeline shared by /api/import-data, import_data.py
+and run_import.py. Records are parsed incrementally, validated and geocoded
+in batches, and written with Core executemany inserts. Each chunk is
+committed together with its statistics rollup deltas, so memory stays
+bounded by the chunk size and the rollup never drifts from the table.
+
+Parsing fans out to a process pool when there are several files; the
+calling process stays the single writer, so SQLite never sees concurrent
+writes.
+
+Imports are idempotent: every record carries a stable source_key (the
+ArcGIS OBJECTID, or a hash of its identifying fields) and a hash of its
+source content, so re-importing a file inserts new records, updates changed
+ones and leaves the rest alone. Files whose size, mtime or checksum match the
+import manifest are skipped without being parsed.
+
+Records are validated before they reach the database and every chunk is
+committed together with a checkpoint of how far into its file it got, so an
+interrupted import resumes after the last committed chunk. A chunk the
+database still rejects is retried record by record in savepoints, and only
+the offending records are dropped.
+
+Loads into an emptied table suspend the search, spatial and change tracking
+triggers instead of paying for them on every row. The index tables stay in
+place, emptied with the rows, so the API keeps answering throughout; each
+chunk bumps the pobuda version itself, and at the end the indexes are rebuilt
+and their triggers restored in one transaction each.
+"""
+
+import glob
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, List, Optional
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select
+from .conditional import bump_version, create_change_tracking, drop_change_tracking
+from .database import engine
+from .districts import district_ids
+from .geocoder import geocoder, is_generic_location
+from .jsonstream import iter_json_array
+from .manifest import conversion_entry, file_checksum, read_manifest
+from .models import Hotspot, ImportCheckpoint, ImportManifest, Pobuda, PobudaStatsDaily
+from .search import clear_search_index, drop_search_triggers, rebuild_search_index
+from .spatial import clear_spatial_index, drop_spatial_triggers, in_ljubljana, rebuild_spatial_index
+from .stats_rollup import apply_rollup, collect_rollup, new_rollup_deltas
+from .uploads import sync_upload_refcounts
+
+DATA_GLOB = "../data/*_converted.json"
+IMPORT_CHUNK_SIZE = 5000
+DEFAULT_EMAIL = "anonymous@example.com"
+DEFAULT_RESPONSE = "Hvala za vašo pobudo. Obravnavali smo jo."
+STATUS_PENDING = "v obravnavi"
+# Rejected records reported individually per file; the rest are only counted
+MAX_REPORTED_ERRORS = 10
+
+# Fields that identify a record without an OBJECTID
+SOURCE_IDENTITY_FIELDS = ("title", "description", "created_at", "latitude", "longitude")
+
+POBUDA_COLUMNS = [
+    column.name for column in Pobuda.__table__.columns
+    if column.name != "id" and column.computed is None
+]
+# Columns owned by the app rather than the source are kept on update: the
+# status and response are the administrators' (and randomised for demo data)
+APP_COLUMNS = ("status", "response", "responded_at", "urgency", "hotspot_id", "image_variants")
+UPDATE_COLUMNS = [column for column in POBUDA_COLUMNS if column not in APP_COLUMNS]
+
+def find_import_files(pattern: str = DATA_GLOB) -> List[str]:
+    return sorted(glob.glob(pattern))
+
+def _sha1(value) -> str:
+    return hashlib.sha1(json.dumps(value, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+def source_identity(record):
+    """Return (source_key, source_hash) for a converted record"""
+    if record.get("source_id") is not None:
+        source_key = f"objectid:{record['source_id']}"
+    else:
+        source_key = "sha1:" + _sha1([record.get(field) for field in SOURCE_IDENTITY_FIELDS])
+    return source_key, _sha1(record)
+
+def _parse_datetime(value):
+    return datetime.fromisoformat(value) if value else None
+
+def normalize_record(record, unanswered: bool = False):
+    """
+    Build an insert row from one converted record; raises ValueError or
+    KeyError for records that cannot be imported. Location and district are
+    filled in per batch by prepare_batch().
+    """
+    if not isinstance(record, dict):
+        raise ValueError("record is not an object")
+    title = record["title"]
+    description = record["description"]
+    if not title or description is None:
+        raise ValueError("missing title or description")
+
+    row = dict.fromkeys(POBUDA_COLUMNS)
+    row.update(
+        title=title,
+        description=description,
+        location=record.get("location"),
+        latitude=float(record["latitude"]),
+        longitude=float(record["longitude"]),
+        email=record.get("email") or DEFAULT_EMAIL,
+        category=record.get("category") or "other",
+        image_path=record.get("image_path"),
+        status=record.get("status") or STATUS_PENDING,
+        created_at=_parse_datetime(record["created_at"]),
+        responded_at=_parse_datetime(record.get("responded_at")),
+        updated_at=datetime.utcnow(),
+    )
+    row["source_key"], row["source_hash"] = source_identity(record)
+    if row["created_at"] is None:
+        raise ValueError("missing created_at")
+    if unanswered:
+        row["status"] = STATUS_PENDING
+        row["responded_at"] = None
+    elif row["responded_at"]:
+        row["response"] = record.get("response") or DEFAULT_RESPONSE
+    return row
+
+def prepare_batch(records, unanswered_ratio: float = 0.0):
+    """Validate a batch and geocode it in one vectorised pass; returns (rows, errors)"""
+    rows, errors = [], []
+    for record in records:
+        try:
+            rows.append(normalize_record(record, unanswered_ratio > 0 and random.random() < unanswered_ratio))
+        except (KeyError, TypeError, ValueError) as e:
+            errors.append(f"{type(e).__name__}: {e}")
+    if not rows:
+        return rows, errors
+
+    latitudes = [row["latitude"] for row in rows]
+    longitudes = [row["longitude"] for row in rows]
+    inside = in_ljubljana(latitudes, longitudes).tolist()
+    if not all(inside):
+        errors.extend(
+            f"ValueError: coordinates {row['latitude']}, {row['longitude']} outside Ljubljana"
+            for row, ok in zip(rows, inside) if not ok
+        )
+        rows = [row for row, ok in zip(rows, inside) if ok]
+        latitudes = [row["latitude"] for row in rows]
+        longitudes = [row["longitude"] for row in rows]
+
+    locations = geocoder.locations(latitudes, longitudes)
+    districts = district_ids(latitudes, longitudes)
+    for row, location, district in zip(rows, locations, districts):
+        if is_generic_location(row["location"]):
+            row["location"] = location
+        row["district_id"] = district
+    return rows, errors
+
+def upsert_rows(session: Session, rows):
+    """
+    Upsert rows by source_key: insert new records and update those whose
+    source hash changed, with one executemany each, and apply the rollup
+    deltas; the caller commits. Returns (inserted, updated); the remaining
+    rows were unchanged.
+    """
+    if not rows:
+        return 0, 0
+    # A key repeated within the chunk keeps its last record
+    rows = list({row["source_key"]: row for row in rows}.values())
+    existing = {
+        row.source_key: row
+        for row in session.exec(
+            select(
+                Pobuda.id, Pobuda.source_key, Pobuda.source_hash, Pobuda.created_at,
+                Pobuda.category, Pobuda.location, Pobuda.status, Pobuda.responded_at
+            ).where(Pobuda.source_key.in_([row["source_key"] for row in rows]))
+        ).all()
+    }
+
+    deltas = new_rollup_deltas()
+    inserts, updates = [], []
+    for row in rows:
+        current = existing.get(row["source_key"])
+        if current is None:
+            inserts.append(row)
+            collect_rollup(deltas, SimpleNamespace(**row))
+        elif current.source_hash != row["source_hash"]:
+            collect_rollup(deltas, current, -1)
+            updates.append({"id": current.id, **{column: row[column] for column in UPDATE_COLUMNS}})
+            collect_rollup(deltas, SimpleNamespace(**{**row, "status": current.status, "responded_at": current.responded_at}))
+
+    if inserts:
+        session.execute(insert(Pobuda.__table__), inserts)
+    if updates:
+        session.execute(update(Pobuda), updates)
+    apply_rollup(session, deltas)
+    return len(inserts), len(updates)
+
+def write_rows(session: Session, rows):
+    """Upsert a chunk and commit it; returns (inserted, updated, errors)"""
+    inserted, updated = upsert_rows(session, rows)
+    session.commit()
+    return inserted, updated, []
+
+def write_rows_isolated(session: Session, rows):
+    """
+    Fallback for a chunk the database rejected: upsert each row in its own
+    savepoint, drop the failing ones and commit the rest
+    """
+    inserted = updated = 0
+    errors = []
+    for row in rows:
+        try:
+            with session.begin_nested():
+                added, changed = upsert_rows(session, [row])
+        except SQLAlchemyError as e:
+            errors.append(f"{type(e).__name__}: {getattr(e, 'orig', None) or e}")
+            continue
+        inserted += added
+        updated += changed
+    session.commit()
+    return inserted, updated, errors
+
+def _file_fingerprint(path: str):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime
+
+def changed_files(session: Session, paths: List[str]):
+    """
+    Compare files with the import manifest and return {path: (size, mtime,
+    sha256)} for those that need importing. A file is unchanged when its
+    size and mtime match, or when only its mtime moved and the checksum still
+    matches (the manifest mtime is refreshed then). Checksums come from the
+    conversion manifest where it still describes the file.
+    """
+    manifest = {entry.file: entry for entry in session.exec(select(ImportManifest)).all()}
+    changed = {}
+    for path in paths:
+        size, mtime = _file_fingerprint(path)
+        entry = manifest.get(os.path.basename(path))
+        if entry and entry.size == size and entry.mtime == mtime:
+            continue
+        converted = conversion_entry(path)
+        checksum = converted["sha256"] if converted else file_checksum(path)
+        if entry and entry.size == size and entry.sha256 == checksum:
+            entry.mtime = mtime
+            session.add(entry)
+            continue
+        changed[path] = (size, mtime, checksum)
+    session.commit()
+    return changed
+
+# Record counts of files missing from both manifests, keyed by path: (size, mtime, records)
+_record_counts = {}
+
+def count_records(path: str) -> int:
+    """Count the elements of a JSON array file without holding them in memory"""
+    return sum(1 for _ in iter_json_array(path))
+
+def import_file_status(session: Session, paths: List[str]):
+    """
+    Size, record count and import state of each file, revalidated with
+    stat() only. Files imported unchanged take their count from the import
+    manifest, files converted unchanged from the conversion manifest; others
+    are counted once per (size, mtime).
+    """
+    manifest = {entry.file: entry for entry in session.exec(select(ImportManifest)).all()}
+    conversions = {}
+    status = []
+    for path in paths:
+        name = os.path.basename(path)
+        try:
+            size, mtime = _file_fingerprint(path)
+            entry = manifest.get(name)
+            imported = entry is not None and entry.size == size and entry.mtime == mtime
+            directory = os.path.dirname(os.path.abspath(path))
+            if directory not in conversions:
+                conversions[directory] = read_manifest(path)
+            converted = None if imported else conversion_entry(path, conversions[directory])
+            if imported:
+                records = entry.records
+            elif converted:
+                records = converted["records"]
+            else:
+                cached = _record_counts.get(path)
+                if cached is None or cached[:2] != (size, mtime):
+                    cached = _record_counts[path] = (size, mtime, count_records(path))
+                records = cached[2]
+        except Exception as e:
+            status.append({"filename": name, "error": str(e)})
+            continue
+        status.append({
+            "filename": name,
+            "record_count": records,
+            "size": size,
+            "modified_at": datetime.utcfromtimestamp(mtime).isoformat(),
+            "imported": imported,
+            "imported_at": entry.imported_at.isoformat() if imported else None,
+        })
+    return status
+
+def record_import(session: Session, path: str, fingerprint, records: int):
+    size, mtime, checksum = fingerprint
+    session.merge(ImportManifest(
+        file=os.path.basename(path), size=size, mtime=mtime, sha256=checksum, records=records
+    ))
+    checkpoint = session.get(ImportCheckpoint, os.path.basename(path))
+    if checkpoint:
+        session.delete(checkpoint)
+    session.commit()
+
+def resume_offsets(session: Session, fingerprints):
+    """Committed record offsets of interrupted imports whose files have not changed since"""
+    checkpoints = {entry.file: entry for entry in session.exec(select(ImportCheckpoint)).all()}
+    offsets = {}
+    for path, (_, _, checksum) in fingerprints.items():
+        checkpoint = checkpoints.get(os.path.basename(path))
+        if checkpoint and checkpoint.sha256 == checksum:
+            offsets[path] = checkpoint.offset
+    return offsets
+
+def save_checkpoint(session: Session, path: str, checksum: str, offset: int):
+    """Stage the checkpoint so it commits together with the chunk it covers"""
+    session.merge(ImportCheckpoint(
+        file=os.path.basename(path), sha256=checksum, offset=offset, updated_at=datetime.utcnow()
+    ))
+
+def _chunks(iterable, size: int):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def parse_file(path: str, chunk_size: int = IMPORT_CHUNK_SIZE, unanswered_ratio: float = 0.0, skip: int = 0):
+    """
+    Yield (rows, errors) for each chunk of a file, ready for write_rows();
+    the first skip records are read past without being prepared
+    """
+    for records in _chunks(itertools.islice(iter_json_array(path), skip, None), chunk_size):
+        yield prepare_batch(records, unanswered_ratio)
+
+def _parse_into_queue(path, chunk_size, unanswered_ratio, skip, batches):
+    """Process pool worker: push parsed chunks of one file, then an end marker with any error"""
+    try:
+        for rows, errors in parse_file(path, chunk_size, unanswered_ratio, skip):
+            batches.put((path, rows, errors))
+        batches.put((path, None, None))
+    except Exception as e:
+        batches.put((path, None, f"{type(e).__name__}: {e}"))
+
+def _parallel_batches(paths, chunk_size, unanswered_ratio, offsets, workers):
+    """
+    Parse files in a process pool, one file per worker, and yield their
+    chunks as they become ready. The queue is bounded, so workers wait for
+    the single writer instead of buffering whole files.
+    """
+    manager = multiprocessing.Manager()
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        batches = manager.Queue(maxsize=workers * 2)
+        futures = {
+            pool.submit(_parse_into_queue, path, chunk_size, unanswered_ratio, offsets.get(path, 0), batches): path
+            for path in paths
+        }
+        finished = set()
+        while len(finished) < len(paths):
+            try:
+                path, rows, error = batches.get(timeout=1)
+            except queue.Empty:
+                # A worker that died without reaching its end marker
+                for future, path in futures.items():
+                    if path not in finished and future.done() and future.exception():
+                        finished.add(path)
+                        yield path, None, f"{type(future.exception()).__name__}: {future.exception()}"
+                continue
+            if rows is None:
+                finished.add(path)
+            yield path, rows, error
+    finally:
+        # Stop the queue first so workers blocked on a full queue fail fast
+        manager.shutdown()
+        pool.shutdown(cancel_futures=True)
+
+def _sequential_batches(paths, chunk_size, unanswered_ratio, offsets):
+    for path in paths:
+        try:
+            for rows, errors in parse_file(path, chunk_size, unanswered_ratio, offsets.get(path, 0)):
+                yield path, rows, errors
+            yield path, None, None
+        except Exception as e:
+            yield path, None, f"{type(e).__name__}: {e}"
+
+def import_files(
+    paths: Optional[List[str]] = None,
+    clear_existing: bool = False,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    unanswered_ratio: float = 0.0,
+    workers: Optional[int] = None,
+    force: bool = False,
+    log: Callable[[str], None] = print
+):
+    """
+    Import every new or changed file and return a report with counts and
+    throughput; force re-reads files the manifest lists as unchanged.
+
+    With more than one file and worker, parsing, validation and geocoding
+    run in a process pool while this process is the only writer.
+    """
+    paths = find_import_files() if paths is None else paths
+    started = time.perf_counter()
+    files = {
+        path: {"file": os.path.basename(path), "imported": 0, "updated": 0, "unchanged": 0, "rejected": 0}
+        for path in paths
+    }
+
+    with Session(engine) as session:
+        if clear_existing:
+            drop_search_triggers(engine)
+            drop_spatial_triggers(engine)
+            drop_change_tracking(engine)
+            session.execute(delete(Pobuda))
+            # Ids restart once the table is empty, so stale index entries would match new rows
+            clear_search_index(session.connection())
+            clear_spatial_index(session.connection())
+            bump_version(session, "pobuda")
+            session.execute(delete(PobudaStatsDaily))
+            session.execute(delete(Hotspot))
+            session.execute(delete(ImportManifest))
+            session.execute(delete(ImportCheckpoint))
+            session.commit()
+            sync_upload_refcounts(session)
+            log("🗑️  Existing data cleared")
+
+        if force:
+            fingerprints = {path: (*_file_fingerprint(path), file_checksum(path)) for path in paths}
+        else:
+            fingerprints = changed_files(session, paths)
+        for path in paths:
+            if path not in fingerprints:
+                files[path]["skipped"] = True
+                log(f"⏭️  {files[path]['file']}: unchanged since the last import")
+        pending = [path for path in paths if path in fingerprints]
+        workers = min(len(pending), workers or os.cpu_count() or 1)
+        offsets = resume_offsets(session, fingerprints)
+        for path, offset in offsets.items():
+            files[path]["resumed_at"] = offset
+            log(f"↩️  {files[path]['file']}: resuming after {offset} committed records")
+
+        if workers > 1:
+            batches = _parallel_batches(pending, chunk_size, unanswered_ratio, offsets, workers)
+        else:
+            batches = _sequential_batches(pending, chunk_size, unanswered_ratio, offsets)
+        try:
+            for path, rows, errors in batches:
+                stats = files[path]
+                if rows is None:
+                    if errors:
+                        # Not recorded in the manifest, so the next import retries the file
+                        stats["error"] = errors
+                        log(f"❌ {stats['file']}: {errors} after {stats['imported']} imported")
+                    else:
+                        record_import(session, path, fingerprints[path], offsets.get(path, 0))
+                        log(
+                            f"✅ {stats['file']}: {stats['imported']} imported, {stats['updated']} updated, "
+                            f"{stats['unchanged']} unchanged, {stats['rejected']} rejected"
+                        )
+                    continue
+                offset = offsets.get(path, 0) + len(rows) + len(errors)
+                checksum = fingerprints[path][2]
+                try:
+                    save_checkpoint(session, path, checksum, offset)
+                    if clear_existing:
+                        # The change tracking triggers are suspended for the load
+                        bump_version(session, "pobuda")
+                    inserted, updated, failed = write_rows(session, rows)
+                except SQLAlchemyError:
+                    session.rollback()
+                    save_checkpoint(session, path, checksum, offset)
+                    if clear_existing:
+                        bump_version(session, "pobuda")
+                    inserted, updated, failed = write_rows_isolated(session, rows)
+                offsets[path] = offset
+                for error in (errors + failed)[:max(0, MAX_REPORTED_ERRORS - stats["rejected"])]:
+                    log(f"⚠️  {stats['file']}: skipped record ({error})")
+                stats["imported"] += inserted
+                stats["updated"] += updated
+                stats["unchanged"] += len(rows) - len(failed) - inserted - updated
+                stats["rejected"] += len(errors) + len(failed)
+        finally:
+            batches.close()
+            if clear_existing:
+                rebuild_spatial_index(engine)
+                rebuild_search_index(engine)
+                create_change_tracking(engine)
+
+    seconds = time.perf_counter() - started
+    report = {
+        "files": list(files.values()),
+        **{
+            key: sum(stats[key] for stats in files.values())
+            for key in ("imported", "updated", "unchanged", "rejected")
+        },
+        "workers": workers,
+        "seconds": round(seconds, 3),
+    }
+    processed = report["imported"] + report["updated"] + report["unchanged"]
+    report["rows_per_second"] = round(processed / seconds) if seconds else 0
+    log(
+        f"🎉 Imported {report['imported']} and updated {report['updated']} records "
+        f"in {report['seconds']:.2f}s ({report['rows_per_second']} rows/s)"
+    )
+    return report
@@ -0,0 +1,73 @@
+"""
+Incremental JSON reading for large data files.
+
+JsonStreamReader decodes one value at a time from a file read in fixed-size
+chunks, so memory is bounded by the largest single value rather than by the
+file. iter_json_array() builds on it for files holding a top-level array.
+"""
+
+import json
+
+READ_CHUNK_SIZE = 1 << 16
+
+class JsonStreamReader:
+    """Incremental JSON value reader over a text file"""
+
+    def __init__(self, f, chunk_size: int = READ_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character, or "" at end of file"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof or not self._fill():
+                    raise
+                continue
+            # A number may continue in the next chunk
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self):
+        """Yield the elements of the array starting at the current position"""
+        self.expect("[")
+        while self.peek() != "]":
+            yield self.value()
+            if self.peek() == ",":
+                self.expect(",")
+        self.expect("]")
+
+def iter_json_array(path: str, chunk_size: int = READ_CHUNK_SIZE):
+    """Yield the elements of a file holding one top-level JSON array"""
+    with open(path, "r", encoding="utf-8") as f:
+        yield from JsonStreamReader(f, chunk_size).items()
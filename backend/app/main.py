@@ -1,18 +1,23 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 import os
-import json
-import glob
-from sqlmodel import Session
-from datetime import datetime
+from sqlmodel import Session, func, select
 from .database import reset_database, create_tables, engine
-from .models import Pobuda
+from .models import PobudaStatsDaily
 from .pobuda import router as pobuda_router
 from .auth import router as auth_router
 from .statistics import router as statistics_router
+from .tiles import router as tiles_router, clear_tile_cache
 from .categories import get_categories
+from .conditional import check_not_modified, make_etag
+from .hotspots import hotspot_worker
+from .districts import backfill_district_ids
+from .importer import find_import_files, import_file_status, import_files
+from .stats_rollup import ensure_stats_rollup
+from .storage import UPLOAD_DIR
+from .uploads import UploadFiles, UploadSizeLimit, migrate_legacy_uploads
+from .derivatives import derivative_worker
 
 app = FastAPI()
 
@@ -21,6 +26,8 @@ origins = [
     "http://localhost:5173",
 ]
 
+# Added first so CORS wraps it and its 413 responses carry CORS headers
+app.add_middleware(UploadSizeLimit)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -55,15 +62,30 @@ async def global_exception_handler(request: Request, exc: Exception):
         headers=cors_headers
     )
 
-UPLOAD_DIR = "uploads"
 if not os.path.exists(UPLOAD_DIR):
     os.makedirs(UPLOAD_DIR)
 
-app.mount("/uploads", StaticFiles(directory=UPLOAD_DIR), name="uploads")
+app.mount("/uploads", UploadFiles(directory=UPLOAD_DIR), name="uploads")
 
 app.include_router(pobuda_router)
 app.include_router(auth_router)
 app.include_router(statistics_router)
+app.include_router(tiles_router)
+
+@app.on_event("startup")
+def on_startup():
+    create_tables()
+    with Session(engine) as session:
+        ensure_stats_rollup(session)
+        backfill_district_ids(session)
+        migrate_legacy_uploads(session)
+    hotspot_worker.start()
+    derivative_worker.start()
+
+@app.on_event("shutdown")
+def on_shutdown():
+    hotspot_worker.stop()
+    derivative_worker.stop()
 
 def import_json_data(clear_existing=False):
     """
@@ -73,61 +95,21 @@ def import_json_data(clear_existing=False):
         clear_existing (bool): If True, clear existing data before import
     """
     
-    json_files = glob.glob("../data/*_converted.json")
+    json_files = find_import_files()
     
     if not json_files:
         raise HTTPException(status_code=404, detail="No JSON files found in ../data/ directory")
     
-    with Session(engine) as session:
-        if clear_existing:
-            session.query(Pobuda).delete()
-            session.commit()
-        
-        total_imported = 0
-        
-        for file_path in json_files:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                
-                file_count = 0
-                for pobuda_data in data:
-                    try:
-                        
-                        pobuda = Pobuda(
-                            title=pobuda_data["title"],
-                            description=pobuda_data["description"],
-                            location=pobuda_data["location"],
-                            latitude=pobuda_data["latitude"],
-                            longitude=pobuda_data["longitude"],
-                            email=pobuda_data.get("email") or "anonymous@example.com",  
-                            category=pobuda_data.get("category") or "other",  
-                            status=pobuda_data.get("status") or "v obravnavi",  
-                            created_at=datetime.fromisoformat(pobuda_data["created_at"]),
-                            image_path=pobuda_data.get("image_path")
-                        )
-                        
-                        if pobuda_data.get("responded_at"):
-                            pobuda.responded_at = datetime.fromisoformat(pobuda_data["responded_at"])
-                            pobuda.response = pobuda_data.get("response", "Hvala za vašo pobudo. Obravnavali smo jo.")
-                        
-                        session.add(pobuda)
-                        file_count += 1
-                    except Exception as e:
-                        print(f"Error processing record: {str(e)}")
-                        session.rollback()  
-                        continue
-
-                session.commit()
-                total_imported += file_count
-            except Exception as e:
-                session.rollback()  
-                raise HTTPException(status_code=500, detail=f"Error reading file {file_path}: {str(e)}")
-    
-    return {"message": f"Import completed! Total records imported: {total_imported}"}
+    # Parse in this process: forking parser processes from the threaded
+    # server would copy its locks and connections
+    report = import_files(json_files, clear_existing=clear_existing, workers=1)
+    if clear_existing or report["imported"] or report["updated"]:
+        clear_tile_cache()
+        hotspot_worker.notify_full()
+    return {"message": f"Import completed! Total records imported: {report['imported']}", **report}
 
 @app.post("/api/import-data")
-async def import_data_endpoint(clear_existing: bool = False):
+def import_data_endpoint(clear_existing: bool = False):
     """
     Import JSON data files into the database
     """
@@ -140,36 +122,25 @@ async def import_data_endpoint(clear_existing: bool = False):
         raise HTTPException(status_code=500, detail=f"Error during import: {str(e)}")
 
 @app.get("/api/categories")
-async def get_categories_endpoint():
+async def get_categories_endpoint(request: Request, response: Response):
     """Get list of all available categories"""
-    return get_categories()
+    categories = get_categories()
+    not_modified = check_not_modified(request, response, make_etag("categories", categories))
+    if not_modified:
+        return not_modified
+    return categories
 
 @app.get("/api/import-status")
-async def get_import_status():
+def get_import_status():
     """
     Get information about available JSON files and current database status
     """
     try:
-        
-        json_files = glob.glob("../data/*_converted.json")
-        file_info = []
-        
-        for file_path in json_files:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    file_info.append({
-                        "filename": os.path.basename(file_path),
-                        "record_count": len(data)
-                    })
-            except Exception as e:
-                file_info.append({
-                    "filename": os.path.basename(file_path),
-                    "error": str(e)
-                })
-        
+        json_files = find_import_files()
         with Session(engine) as session:
-            total_records = session.query(Pobuda).count()
+            file_info = import_file_status(session, json_files)
+            # The rollup counts every pobuda once on its creation day
+            total_records = session.exec(select(func.coalesce(func.sum(PobudaStatsDaily.created_count), 0))).one()
         
         return {
             "available_files": file_info,
@@ -0,0 +1,60 @@
+"""
+Conversion manifest for the converted data files.
+
+data/run.py records every file it writes in a manifest.json next to it:
+size, mtime, SHA-256 and record count. Readers trust an entry only while
+the file's size and mtime still match, so a file edited or replaced since
+its conversion is never described by a stale entry; checking that costs one
+stat() per file.
+"""
+
+import hashlib
+import json
+import os
+from typing import Optional
+
+MANIFEST_NAME = "manifest.json"
+
+def file_checksum(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def manifest_path(path: str) -> str:
+    """Manifest covering the data file at path"""
+    return os.path.join(os.path.dirname(os.path.abspath(path)), MANIFEST_NAME)
+
+def read_manifest(path: str):
+    """Entries by file name of the manifest covering path; empty when there is none"""
+    try:
+        with open(manifest_path(path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def conversion_entry(path: str, manifest=None) -> Optional[dict]:
+    """The file's manifest entry when its size and mtime still match, else None"""
+    if manifest is None:
+        manifest = read_manifest(path)
+    entry = manifest.get(os.path.basename(path))
+    stat = os.stat(path)
+    if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+        return entry
+    return None
+
+def record_conversion(path: str, records: int):
+    """Add or replace the entry of a freshly written file"""
+    stat = os.stat(path)
+    manifest = read_manifest(path)
+    manifest[os.path.basename(path)] = {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "sha256": file_checksum(path),
+        "records": records,
+    }
+    target = manifest_path(path)
+    with open(target + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(target + ".tmp", target)
@@ -1,7 +1,8 @@
 from sqlmodel import Field, SQLModel
-from typing import Optional, List
-from datetime import datetime
+from typing import Dict, Optional, List
+from datetime import date, datetime
 from pydantic import BaseModel
+from sqlalchemy import JSON, Column, Computed, Index, Integer
 from enum import Enum
 
 class CategoryEnum(str, Enum):
@@ -41,13 +42,132 @@ class PobudaBase(SQLModel):
     email: str
     category: str = Field(default="other", index=True)
     image_path: Optional[str] = None
+    # Resized, EXIF-free copies of the image by size and format, once the derivative worker made them
+    image_variants: Optional[Dict[str, Dict[str, str]]] = Field(default=None, sa_type=JSON(none_as_null=True))
     status: str = Field(default="v obravnavi", index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     response: Optional[str] = None
     responded_at: Optional[datetime] = None
+    urgency: Optional[int] = None
+    hotspot_id: Optional[int] = Field(default=None, index=True)
+    district_id: Optional[int] = Field(default=None, index=True)
+    # Moved by every ORM and Core update; drives the detail endpoint's ETag
+    updated_at: Optional[datetime] = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow})
+
+# urgency DESC NULLS LAST as a single ascending key, so the admin queue can
+# be indexed and paged with one row-value comparison; a column rather than an
+# expression index, since SQLite only turns row values over columns into ranges
+URGENCY_UNSET_RANK = 2147483647
+URGENCY_RANK_SQL = f"coalesce(-urgency, {URGENCY_UNSET_RANK})"
 
 class Pobuda(PobudaBase, table=True):
+    __table_args__ = (
+        Index("ix_pobuda_created_at_id", "created_at", "id"),
+        Index("ix_pobuda_category_created_at_id", "category", "created_at", "id"),
+        Index("ix_pobuda_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_pobuda_category_status_created_at_id", "category", "status", "created_at", "id"),
+        Index("ix_pobuda_status_category_created_at_id", "status", "category", "created_at", "id"),
+        Index("ix_pobuda_status_urgency_rank_created_at_id", "status", "urgency_rank", "created_at", "id"),
+        Index("ix_pobuda_category_status_urgency_rank_created_at_id", "category", "status", "urgency_rank", "created_at", "id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # Identity of imported records in their source file and a hash of their
+    # source content; NULL for pobude submitted through the app
+    source_key: Optional[str] = Field(default=None, unique=True, index=True)
+    source_hash: Optional[str] = None
+    # Sort key of the admin queue's urgency order, computed by SQLite
+    urgency_rank: Optional[int] = Field(
+        default=None,
+        exclude=True,
+        sa_column=Column("urgency_rank", Integer, Computed(URGENCY_RANK_SQL, persisted=False))
+    )
+
+class PobudaListItem(PobudaBase):
+    id: int
+    snippet: Optional[str] = None
+
+class PobudaNearby(PobudaBase):
+    id: int
+    distance: float
+
+class PobudaCluster(BaseModel):
+    latitude: float
+    longitude: float
+    count: int
+    pending: int
+    responded: int
+
+class PobudaClusters(BaseModel):
+    zoom: int
+    clusters: List[PobudaCluster]
+    points: List[Pobuda]
+
+class PobudaStatsDaily(SQLModel, table=True):
+    """
+    Daily statistics rollup keyed by (day, category, location, status).
+
+    created_count counts pobude created on `day` that currently have `status`;
+    responded_count and response_days_sum cover pobude responded on `day`.
+    """
+    __tablename__ = "pobuda_stats_daily"
+
+    day: date = Field(primary_key=True)
+    category: str = Field(primary_key=True)
+    location: str = Field(primary_key=True)
+    status: str = Field(primary_key=True)
+    created_count: int = 0
+    responded_count: int = 0
+    response_days_sum: int = 0
+
+class Hotspot(SQLModel, table=True):
+    """Spatial cluster of pending pobude found by the hotspot worker"""
     id: Optional[int] = Field(default=None, primary_key=True)
+    latitude: float
+    longitude: float
+    count: int = Field(index=True)
+    radius_m: float
+    top_category: str
+    oldest_created_at: datetime
+    newest_created_at: datetime
+    computed_at: datetime = Field(default_factory=datetime.utcnow)
+
+class ImportManifest(SQLModel, table=True):
+    """Import files as last imported, so unchanged files can be skipped"""
+    __tablename__ = "import_manifest"
+
+    file: str = Field(primary_key=True)
+    size: int
+    mtime: float
+    sha256: str
+    records: int
+    imported_at: datetime = Field(default_factory=datetime.utcnow)
+
+class ImportCheckpoint(SQLModel, table=True):
+    """
+    Records of a partly imported file that are already committed; written in
+    the same transaction as each chunk, so an interrupted import resumes
+    exactly where it stopped
+    """
+    __tablename__ = "import_checkpoint"
+
+    file: str = Field(primary_key=True)
+    sha256: str
+    offset: int
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+class UploadBlob(SQLModel, table=True):
+    """Content-addressed uploaded image and the number of pobude referencing it"""
+    __tablename__ = "upload_blob"
+
+    key: str = Field(primary_key=True)
+    size: int
+    refcount: int = 0
+    # Derivative URLs by size and format; NULL until processed, {} when every attempt failed
+    variants: Optional[Dict[str, Dict[str, str]]] = Field(default=None, sa_type=JSON(none_as_null=True))
+    # Failed derivative runs so far; retries back off until DERIVATIVE_MAX_ATTEMPTS
+    failed_attempts: Optional[int] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
 
 class PobudaCreate(BaseModel):
     title: str
@@ -64,4 +184,6 @@ class Statistics(BaseModel):
     pending_pobude: int
     responded_pobude: int
     daily_stats: List[dict]
-    response_stats: List[dict] 
\ No newline at end of file
+    response_stats: List[dict]
+    days: int = 30
+    granularity: str = "day" 
\ No newline at end of file
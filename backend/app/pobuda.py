@@ -1,1591 +1,30 @@
-from fastapi import APIRouter, HTTPException, File, UploadFile, Form, Query, Depends
-from sqlmodel import Session, select
+from fastapi import APIRouter, HTTPException, File, UploadFile, Form, Query, Depends, Request, Response
+from starlette.concurrency import run_in_threadpool
+from sqlmodel import Session, select, func
+from sqlalchemy import case, tuple_, update
 from datetime import datetime, timedelta
 from collections import defaultdict
-from typing import Optional, List
-import os, shutil
+from typing import Optional, List, Literal
+import base64
+import json
 import random
-from .models import Pobuda, PobudaCreate, PobudaResponse, Statistics
+import numpy as np
+from .models import Hotspot, Pobuda, PobudaCluster, PobudaClusters, PobudaCreate, PobudaListItem, PobudaNearby, PobudaResponse, PobudaStatsDaily, Statistics, UploadBlob
 from .database import engine
+from .search import build_match_query, match_condition, pobuda_fts, rank_expression, render_snippet, snippet_expression
+from .spatial import GRID_ZOOM_LEVELS, bbox_condition, grid_cell, haversine_m, pobuda_grid, pobuda_rtree, radius_bbox
+from .tiles import clear_tile_cache, invalidate_tiles
+from .stats_rollup import apply_rollup, collect_rollup, new_rollup_deltas, rebuild_stats_rollup, record_pobude
+from .hotspots import PENDING_STATUS, hotspot_worker
 from .auth import verify_token
+from .conditional import check_not_modified, make_etag, table_version
+from .geodata import LJUBLJANA_STREETS
+from .geocoder import geocoder, is_generic_location
+from .districts import backfill_district_ids, district_id, get_districts, reload_districts
+from .derivatives import derivative_worker
+from .storage import storage
+from .uploads import StoredUpload, release_upload, save_upload, sync_upload_refcounts, upload_stats
 
-UPLOAD_DIR = "uploads"
-
-LJUBLJANA_STREETS = [
-    "Abramova Ulica",
-    "Adamičeva Ulica",
-    "Adamič-Lundrovo Nabrežje",
-    "Agrokombinatska Cesta",
-    "Ajdovščina",
-    "Aleševa Ulica",
-    "Alešovčeva Ulica",
-    "Aličeva Ulica",
-    "Aljaževa Ulica",
-    "Ambrožev Trg",
-    "Ameriška Ulica",
-    "Andreaševa Ulica",
-    "Andrićeva Ulica",
-    "Anžurjeva Ulica",
-    "Apihova Ulica",
-    "Archinetova Ulica",
-    "Argentinska Ulica",
-    "Arharjeva Cesta",
-    "Arkova Ulica",
-    "Arničeva Ulica",
-    "Artačeva Ulica",
-    "Aškerčeva Cesta",
-    "Avčinova Ulica",
-    "Avgustinčičeva Ulica",
-    "Avsečeva Ulica",
-    "Avstrijska Ulica",
-    "Avšičeva Cesta",
-    "Ažbetova Ulica",
-    "Ažmanova Ulica",
-    "Babičeva Ulica",
-    "Badjurova Ulica",
-    "Bajtova Ulica",
-    "Balinarska Pot",
-    "Baragova Ulica",
-    "Barjanska Cesta",
-    "Barvarska Steza",
-    "Bavdkova Ulica",
-    "Baznikova Ulica",
-    "Bazoviška Ulica",
-    "Beblerjev Trg",
-    "Beethovnova Ulica",
-    "Belačeva Ulica",
-    "Beljaška Ulica",
-    "Belokranjska Ulica",
-    "Beograjska Ulica",
-    "Berčičeva Ulica",
-    "Berčonova Pot",
-    "Berdajsova Ulica",
-    "Bergantova Ulica",
-    "Bernekerjeva Ulica",
-    "Bernikova Ulica",
-    "Besnica",
-    "Betettova Cesta",
-    "Bevkova Cesta",
-    "Bezenškova Ulica",
-    "Bežigrad",
-    "Bičevje",
-    "Bilečanska Ulica",
-    "Bistriška Ulica",
-    "Bitenčeva Ulica",
-    "Bizjakova Ulica",
-    "Bizjanova Ulica",
-    "Bizoviška Cesta",
-    "Blasnikova Ulica",
-    "Blasov Breg",
-    "Blažičeva Ulica",
-    "Bleiweisova Cesta",
-    "Bobenčkova Ulica",
-    "Bobrova Ulica",
-    "Bogišićeva Ulica",
-    "Bognarjeva Pot",
-    "Bohinjčeva Ulica",
-    "Bohoričeva Ulica",
-    "Bokalova Ulica",
-    "Boletova Ulica",
-    "Bolgarska Ulica",
-    "Borovniška Ulica",
-    "Borsetova Ulica",
-    "Borštnikov Trg",
-    "Borutova Ulica",
-    "Božičeva Ulica",
-    "Brajnikova Ulica",
-    "Brankova Ulica",
-    "Bratinova Ulica",
-    "Bratislavska Cesta",
-    "Bratov Čebuljev Ulica",
-    "Bratov Jakopičev Ulica",
-    "Bratov Kunovarjev Ulica",
-    "Bratovševa Ploščad",
-    "Bravničarjeva Ulica",
-    "Brdnikova Ulica",
-    "Breg",
-    "Bregarjeva Ulica",
-    "Brejčeva Ulica",
-    "Brezje Pri Lipoglavu",
-    "Breznikova Ulica",
-    "Brglezov Štradon",
-    "Brilejeva Ulica",
-    "Brnčičeva Ulica",
-    "Brodarjev Trg",
-    "Brodska Cesta",
-    "Burnikova Ulica",
-    "Cankarjev Vrh",
-    "Cankarjeva Cesta",
-    "Cankarjevo Nabrežje",
-    "Carja Dušana Ulica",
-    "Celarčeva Ulica",
-    "Celestinova Ulica",
-    "Celjska Ulica",
-    "Celovška Cesta",
-    "Cerkniška Ulica",
-    "Cerkova Ulica",
-    "Cerutova Ulica",
-    "Cesta 13. Julija",
-    "Cesta 24. Junija",
-    "Cesta 25 Talcev",
-    "Cesta 27. Aprila",
-    "Cesta 30. Avgusta",
-    "Cesta Andreja Bitenca",
-    "Cesta Ceneta Štuparja",
-    "Cesta Cirila Kosmača",
-    "Cesta Dolomitskega Odreda",
-    "Cesta Dveh Cesarjev",
-    "Cesta Ii. Grupe Odredov",
-    "Cesta Ljubljanske Brigade",
-    "Cesta Na Bokalce",
-    "Cesta Na Brdo",
-    "Cesta Na Brinovec",
-    "Cesta Na Brod",
-    "Cesta Na Ježah",
-    "Cesta Na Ključ",
-    "Cesta Na Kope",
-    "Cesta Na Laze",
-    "Cesta Na Loko",
-    "Cesta Na Mesarico",
-    "Cesta Na Obrije",
-    "Cesta Na Ozare",
-    "Cesta Na Poljane",
-    "Cesta Na Prevoje",
-    "Cesta Na Rožnik",
-    "Cesta Na Urh",
-    "Cesta Na Vrhovce",
-    "Cesta Španskih Borcev",
-    "Cesta Urške Zatlerjeve",
-    "Cesta V Dvor",
-    "Cesta V Gameljne",
-    "Cesta V Gorice",
-    "Cesta V Hrastje",
-    "Cesta V Hrib",
-    "Cesta V Kleče",
-    "Cesta V Kostanj",
-    "Cesta V Kresnice",
-    "Cesta V Legarico",
-    "Cesta V Mestni Log",
-    "Cesta V Pečale",
-    "Cesta V Podboršt",
-    "Cesta V Prod",
-    "Cesta V Rožno Dolino",
-    "Cesta V Šmartno",
-    "Cesta V Zajčjo Dobravo",
-    "Cesta V Zeleni Log",
-    "Cesta V Zgornji Log",
-    "Cesta Vstaje",
-    "Chengdujska Cesta",
-    "Cigaletova Ulica",
-    "Cilenškova Ulica",
-    "Cimermanova Ulica",
-    "Cimpermanova Ulica",
-    "Ciril-Metodov Trg",
-    "Cizejeva Ulica",
-    "Clevelandska Ulica",
-    "Colnarjeva Ulica",
-    "Cvetkova Ulica",
-    "Cvetlična Pot",
-    "Čampova Ulica",
-    "Čanžekova Ulica",
-    "Čapova Ulica",
-    "Čargova Ulica",
-    "Čebelarska Ulica",
-    "Čehova Ulica",
-    "Čemažarjeva Ulica",
-    "Čepelnikova Ulica",
-    "Čepovanska Ulica",
-    "Čerinova Ulica",
-    "Černetova Ulica",
-    "Černigojeva Ulica",
-    "Černivčeva Ulica",
-    "Červanova Ulica",
-    "Česnikova Ulica",
-    "Češnjica",
-    "Čevljarska Ulica",
-    "Čižmanova Ulica",
-    "Čopova Ulica",
-    "Črna Pot",
-    "Črna Vas",
-    "Črnuška Cesta",
-    "Črtomirova Ulica",
-    "Čučkova Ulica",
-    "Čufarjeva Ulica",
-    "Dajnkova Ulica",
-    "Dalmatinova Ulica",
-    "Danile Kumarjeve Ulica",
-    "Davčna Ulica",
-    "Dečkova Ulica",
-    "Dečmanova Ulica",
-    "Delakova Ulica",
-    "Delavska Ulica",
-    "Demšarjeva Cesta",
-    "Derčeva Ulica",
-    "Dergančeva Ulica",
-    "Dergomaška Ulica",
-    "Dermotova Ulica",
-    "Detelova Ulica",
-    "Devinska Ulica",
-    "Devova Ulica",
-    "Dimičeva Ulica",
-    "Divjakova Ulica",
-    "Do Proge",
-    "Dobrajčeva Ulica",
-    "Dobrdobska Ulica",
-    "Dobrunjska Cesta",
-    "Dolenjska Cesta",
-    "Dolgi Breg",
-    "Dolgi Most",
-    "Dolgo Brdo",
-    "Dolharjeva Ulica",
-    "Dolina",
-    "Dolinarjeva Ulica",
-    "Dolinškova Ulica",
-    "Dolničarjeva Ulica",
-    "Dolniška Cesta",
-    "Dolomitska Ulica",
-    "Drabosnjakova Ulica",
-    "Draga",
-    "Draveljska Ulica",
-    "Dravska Ulica",
-    "Dražgoška Ulica",
-    "Drenikov Vrh",
-    "Drenikova Ulica",
-    "Društvena Ulica",
-    "Dunajska Cesta",
-    "Dvojna Ulica",
-    "Dvor",
-    "Dvorakova Ulica",
-    "Dvorni Trg",
-    "Džamijska Ulica",
-    "Einspielerjeva Ulica",
-    "Eipprova Ulica",
-    "Ellerjeva Ulica",
-    "Emonska Cesta",
-    "Endliherjeva Ulica",
-    "Erbežnikova Ulica",
-    "Erjavčeva Cesta",
-    "Fabianijeva Ulica",
-    "Fajfarjeva Ulica",
-    "Fani Grumove Ulica",
-    "Ferberjeva Ulica",
-    "Filipičeva Ulica",
-    "Finžgarjeva Ulica",
-    "Flajšmanova Ulica",
-    "Flandrova Ulica",
-    "Forsterjeva Ulica",
-    "Francoska Ulica",
-    "Franketova Ulica",
-    "Frankopanska Ulica",
-    "Frenkova Pot",
-    "Freyerjeva Ulica",
-    "Friškovec",
-    "Funtkova Ulica",
-    "Fužinska Cesta",
-    "Gabrje Pri Jančah",
-    "Gabrov Trg",
-    "Gabrščkova Ulica",
-    "Gača",
-    "Galičeva Ulica",
-    "Galjevica",
-    "Gallusovo Nabrežje",
-    "Gameljska Cesta",
-    "Gasilska Cesta",
-    "Gasparijeva Ulica",
-    "Gašperšičeva Ulica",
-    "Gerbičeva Ulica",
-    "Gestrinova Ulica",
-    "Glavarjeva Ulica",
-    "Gledališka Pasaža",
-    "Gledališka Stolba",
-    "Glinška Ulica",
-    "Glinškova Ploščad",
-    "Globočnikova Ulica",
-    "Glonarjeva Ulica",
-    "Gmajnice",
-    "Gobarska Pot",
-    "Godeževa Ulica",
-    "Gogalova Ulica",
-    "Gola Loka",
-    "Golarjeva Ulica",
-    "Goljarjeva Pot",
-    "Golouhova Ulica",
-    "Gorazdova Ulica",
-    "Goriška Ulica",
-    "Gorjančeva Ulica",
-    "Gorjupova Ulica",
-    "Gorkičeva Ulica",
-    "Gornji Rudnik I",
-    "Gornji Rudnik Ii",
-    "Gornji Rudnik Iii",
-    "Gornji Rudnik Iv",
-    "Gornji Trg",
-    "Goropečnikova Ulica",
-    "Gortanova Ulica",
-    "Gosarjeva Ulica",
-    "Gospodinjska Ulica",
-    "Gosposka Ulica",
-    "Gosposvetska Cesta",
-    "Gotska Ulica",
-    "Govekarjeva Ulica",
-    "Gozdna Pot",
-    "Grablovičeva Ulica",
-    "Gradaška Ulica",
-    "Gradišče",
-    "Gradiškova Ulica",
-    "Gradnikova Ulica",
-    "Grafenauerjeva Ulica",
-    "Grajska Planota",
-    "Grajzerjeva Ulica",
-    "Gramozna Pot",
-    "Grampovčanova Ulica",
-    "Grassellijeva Ulica",
-    "Gregorčičeva Ulica",
-    "Gregorinova Ulica",
-    "Grič",
-    "Grintovška Ulica",
-    "Grobeljca",
-    "Grobeljska Pot",
-    "Groharjeva Cesta",
-    "Grošljeva Ulica",
-    "Groznikova Ulica",
-    "Grška Ulica",
-    "Grško",
-    "Gruberjevo Nabrežje",
-    "Grudnova Ulica",
-    "Grudnovo Nabrežje",
-    "Gubčeva Ulica",
-    "Gunceljska Cesta",
-    "Gundulićeva Ulica",
-    "Gustinčarjeva Ulica",
-    "Gustinčičeva Ulica",
-    "Hacetova Ulica",
-    "Hacquetova Ulica",
-    "Hafnerjeva Ulica",
-    "Hajdrihova Ulica",
-    "Hauptmanca",
-    "Herbersteinova Ulica",
-    "Hladilniška Pot",
-    "Hladnikova Cesta",
-    "Hlebčeva Ulica",
-    "Hodoščkova Ulica",
-    "Hotimirova Ulica",
-    "Hradeckega Cesta",
-    "Hranilniška Ulica",
-    "Hrenova Ulica",
-    "Hribarjevo Nabrežje",
-    "Hribernikova Ulica",
-    "Hribovska Pot",
-    "Hruševska Cesta",
-    "Hrvaška Ulica",
-    "Hrvatski Trg",
-    "Hubadova Ulica",
-    "Hudourniška Pot",
-    "Hudovernikova Ulica",
-    "Idrijska Ulica",
-    "Igriška Ulica",
-    "Ilešičeva Ulica",
-    "Ilirska Ulica",
-    "Ilovški Štradon",
-    "Ingličeva Ulica",
-    "Ipavčeva Ulica",
-    "Italijanska Ulica",
-    "Izletniška Ulica",
-    "Ižanska Cesta",
-    "Jadranska Ulica",
-    "Jakčeva Ulica",
-    "Jakhljeva Ulica",
-    "Jakopičeva Ulica",
-    "Jakšičeva Ulica",
-    "Jalnova Ulica",
-    "Jamnikarjeva Ulica",
-    "Jamova Cesta",
-    "Janče",
-    "Janežičeva Cesta",
-    "Janova Ulica",
-    "Janševa Ulica",
-    "Japljeva Ulica",
-    "Jarčeva Ulica",
-    "Jarnikova Ulica",
-    "Jarše",
-    "Jarška Cesta",
-    "Javor",
-    "Javorjev Drevored",
-    "Javorškova Ulica",
-    "Jazbečeva Pot",
-    "Jelinčičeva Ulica",
-    "Jelovškova Ulica",
-    "Jenkova Ulica",
-    "Jensenova Ulica",
-    "Jerajeva Ulica",
-    "Jerančičeva Ulica",
-    "Jeranova Ulica",
-    "Jesenkova Ulica",
-    "Jesihov Štradon",
-    "Jezerska Ulica",
-    "Ježa",
-    "Ježica",
-    "Ježkova Ulica",
-    "Joškov Štradon",
-    "Jurčeva Ulica",
-    "Jurčičev Trg",
-    "Jurčkova Cesta",
-    "Juričeva Ulica",
-    "Justinova Ulica",
-    "Juvanova Ulica",
-    "K Reaktorju",
-    "Kadilnikova Ulica",
-    "Kajakaška Cesta",
-    "Kajuhova Ulica",
-    "Kalingerjeva Ulica",
-    "Kalinova Ulica",
-    "Kališnikov Trg",
-    "Kaminova Ulica",
-    "Kamniška Ulica",
-    "Kamnogoriška Cesta",
-    "Kamnoseška Ulica",
-    "Kančeva Ulica",
-    "Kanonijeva Cesta",
-    "Kantetova Ulica",
-    "Kapiteljska Ulica",
-    "Kapusova Ulica",
-    "Kardeljeva Ploščad",
-    "Karingerjeva Ulica",
-    "Karlovška Cesta",
-    "Karunova Ulica",
-    "Kastelčeva Ulica",
-    "Kašeljska Cesta",
-    "Katreževa Pot",
-    "Kavadarska Cesta",
-    "Kavčičeva Ulica",
-    "Kavškova Ulica",
-    "Kebetova Ulica",
-    "Kekčeva Ulica",
-    "Kermaunerjeva Ulica",
-    "Kernova Cesta",
-    "Kersnikova Ulica",
-    "Kerševanova Ulica",
-    "Keržičeva Ulica",
-    "Kettejeva Ulica",
-    "Kikljeva Ulica",
-    "Kladezna Ulica",
-    "Klančarjeva Ulica",
-    "Kleče",
-    "Klemenčičeva Ulica",
-    "Klemenova Ulica",
-    "Ključavničarska Ulica",
-    "Klopčičeva Ulica",
-    "Klunova Ulica",
-    "Kmečka Pot",
-    "Knafljev Prehod",
-    "Kneza Koclja Ulica",
-    "Knezov Štradon",
-    "Knezova Ulica",
-    "Knobleharjeva Ulica",
-    "Kobetova Ulica",
-    "Koblarjeva Ulica",
-    "Kocenova Ulica",
-    "Kocjančičeva Ulica",
-    "Kocjanova Ulica",
-    "Kočenska Ulica",
-    "Kodrova Ulica",
-    "Kogejeva Ulica",
-    "Kogojeva Ulica",
-    "Kogovškova Ulica",
-    "Kokaljeva Ulica",
-    "Kolajbova Ulica",
-    "Kolarjeva Ulica",
-    "Kolesarska Pot",
-    "Koleševa Ulica",
-    "Kolezijska Ulica",
-    "Kolinska Ulica",
-    "Kolmanova Ulica",
-    "Kolodvorska Ulica",
-    "Komacova Ulica",
-    "Komanova Ulica",
-    "Komenskega Ulica",
-    "Kongresni Trg",
-    "Kopačeva Cesta",
-    "Kopališka Ulica",
-    "Kopitarjeva Ulica",
-    "Kopna Pot",
-    "Koprska Ulica",
-    "Korenčanova Ulica",
-    "Koreninova Ulica",
-    "Koroška Ulica",
-    "Korotanska Ulica",
-    "Korytkova Ulica",
-    "Kosančeva Ulica",
-    "Koseskega Ulica",
-    "Koseška Cesta",
-    "Kosijeva Ulica",
-    "Kosmačeva Ulica",
-    "Kosova Ulica",
-    "Kosovelova Ulica",
-    "Koščeva Ulica",
-    "Koširjeva Ulica",
-    "Kotnikova Ulica",
-    "Kovačeva Ulica",
-    "Kovačičeva Ulica",
-    "Kovaška Ulica",
-    "Kovinarska Ulica",
-    "Kozarska Cesta",
-    "Kozinova Ulica",
-    "Kozlarjeva Pot",
-    "Koželjeva Ulica",
-    "Krakovska Ulica",
-    "Krakovski Nasip",
-    "Kraljeva Ulica",
-    "Kranerjeva Ulica",
-    "Kranjčeva Ulica",
-    "Kraška Ulica",
-    "Kratka Pot",
-    "Kratka Steza",
-    "Kregarjeva Ulica",
-    "Krekov Trg",
-    "Kreljeva Ulica",
-    "Kremžarjeva Ulica",
-    "Krimska Ulica",
-    "Kristanova Ulica",
-    "Krištofova Ulica",
-    "Kriva Pot",
-    "Krivec",
-    "Križevniška Ulica",
-    "Križna Ulica",
-    "Krmčeva Ulica",
-    "Krmeljeva Ulica",
-    "Krojaška Ulica",
-    "Kropova Ulica",
-    "Krošljeva Ulica",
-    "Krovska Ulica",
-    "Krožna Pot",
-    "Krvinova Ulica",
-    "Kržičeva Ulica",
-    "Kudrova Ulica",
-    "Kumanovska Ulica",
-    "Kumerdejeva Ulica",
-    "Kumrovška Ulica",
-    "Kunaverjeva Ulica",
-    "Kurilniška Ulica",
-    "Kurirska Ulica",
-    "Kušarjeva Ulica",
-    "Kuštrinova Ulica",
-    "Kuzeletova Ulica",
-    "Kuzmičeva Ulica",
-    "Kvedrova Cesta",
-    "Lahova Pot",
-    "Lajovčeva Ulica",
-    "Laknerjeva Ulica",
-    "Lakotence",
-    "Lambergarjeva Ulica",
-    "Lampetova Ulica",
-    "Lamutova Ulica",
-    "Langusova Ulica",
-    "Latinski Trg",
-    "Lavričeva Ulica",
-    "Lavrinova Ulica",
-    "Layerjeva Ulica",
-    "Lazarjeva Ulica",
-    "Ledarska Ulica",
-    "Legatova Ulica",
-    "Lemeževa Ulica",
-    "Lepi Pot",
-    "Lepodvorska Ulica",
-    "Leskoškova Cesta",
-    "Leskovičeva Ulica",
-    "Letališka Cesta",
-    "Levarjeva Ulica",
-    "Levčeva Ulica",
-    "Levičnikova Ulica",
-    "Levstikov Trg",
-    "Levstikova Ulica",
-    "Likozarjeva Ulica",
-    "Linhartov Podhod",
-    "Linhartova Cesta",
-    "Lipahova Ulica",
-    "Lipe",
-    "Litijska Cesta",
-    "Litostrojska Cesta",
-    "Livada",
-    "Livarska Ulica",
-    "Ljubeljska Ulica",
-    "Ločnikarjeva Ulica",
-    "Lončarska Steza",
-    "Lotričeva Ulica",
-    "Lovrenčičeva Ulica",
-    "Lovska Ulica",
-    "Lovšetova Ulica",
-    "Ložarjeva Ulica",
-    "Lubejeva Ulica",
-    "Luize Pesjakove Ulica",
-    "Lunačkova Ulica",
-    "Lužiško-Srbska Ulica",
-    "Mačkov Kot",
-    "Mačkova Ulica",
-    "Madžarska Ulica",
-    "Magajnova Ulica",
-    "Magistrova Ulica",
-    "Maistrova Ulica",
-    "Majaronova Ulica",
-    "Majde Šilčeve Ulica",
-    "Majde Vrhovnikove Ulica",
-    "Majorja Lavriča Ulica",
-    "Makucova Ulica",
-    "Mala Čolnarska Ulica",
-    "Mala Ulica",
-    "Mala Vas",
-    "Malejeva Ulica",
-    "Malenškova Ulica",
-    "Maleševa Ulica",
-    "Malgajeva Ulica",
-    "Mali Lipoglav",
-    "Mali Trg",
-    "Mali Vrh Pri Prežganju",
-    "Malnarjeva Ulica",
-    "Malo Trebeljevo",
-    "Malova Ulica",
-    "Marčenkova Ulica",
-    "Marentičeva Ulica",
-    "Mareška Pot",
-    "Mariborska Ulica",
-    "Marice Kovačeve Ulica",
-    "Marincljeva Ulica",
-    "Marinovševa Cesta",
-    "Marjekova Pot",
-    "Maroltova Ulica",
-    "Martina Krpana Ulica",
-    "Martinčeva Ulica",
-    "Martinova Pot",
-    "Martinova Ulica",
-    "Marušičeva Ulica",
-    "Masarykova Cesta",
-    "Mašera-Spasićeva Ulica",
-    "Matjanova Pot",
-    "Matjaževa Ulica",
-    "Maurerjeva Ulica",
-    "Mazijeva Ulica",
-    "Mazovčeva Pot",
-    "Med Hmeljniki",
-    "Medarska Ulica",
-    "Medenska Cesta",
-    "Medno",
-    "Medvedova Cesta",
-    "Medveščkova Ulica",
-    "Mekinčeva Ulica",
-    "Melikova Ulica",
-    "Menardova Ulica",
-    "Mencingerjeva Ulica",
-    "Merčnikova Ulica",
-    "Merosodna Ulica",
-    "Mesarska Cesta",
-    "Mesesnelova Ulica",
-    "Mestni Trg",
-    "Meškova Ulica",
-    "Metelkova Ulica",
-    "Metliška Ulica",
-    "Miheličeva Cesta",
-    "Mihov Štradon",
-    "Miklavčeva Ulica",
-    "Miklošičeva Cesta",
-    "Mikuževa Ulica",
-    "Milčetova Pot",
-    "Milčinskega Ulica",
-    "Mire Lenardičeve Ulica",
-    "Mirje",
-    "Mirna Pot",
-    "Mislejeva Ulica",
-    "Mivka",
-    "Mizarska Pot",
-    "Mladinska Ulica",
-    "Mlake",
-    "Mlinska Pot",
-    "Močilnikarjeva Ulica",
-    "Močnikova Ulica",
-    "Mokrška Ulica",
-    "Molekova Ulica",
-    "Moskovska Ulica",
-    "Moškričeva Ulica",
-    "Mrharjeva Ulica",
-    "Mrzelova Ulica",
-    "Mucherjeva Ulica",
-    "Murkova Ulica",
-    "Murnikova Ulica",
-    "Murnova Ulica",
-    "Muzejska Ulica",
-    "Na Brežini",
-    "Na Cvetači",
-    "Na Delih",
-    "Na Dolih",
-    "Na Gaju",
-    "Na Gmajni",
-    "Na Griču",
-    "Na Herši",
-    "Na Jami",
-    "Na Klančku",
-    "Na Korošci",
-    "Na Palcah",
-    "Na Peči",
-    "Na Požaru",
-    "Na Produ",
-    "Na Rojah",
-    "Na Stolbi",
-    "Na Straški Vrh",
-    "Na Tezi",
-    "Na Trati",
-    "Na Žalah",
-    "Nade Ovčakove Ulica",
-    "Nadgoriška Cesta",
-    "Nagodetova Ulica",
-    "Nahlikova Ulica",
-    "Nahtigalova Ulica",
-    "Nanoška Ulica",
-    "Nasperska Pot",
-    "Nazorjeva Ulica",
-    "Nedohova Ulica",
-    "Neubergerjeva Ulica",
-    "Njegoševa Cesta",
-    "Nova Ulica",
-    "Novakova Pot",
-    "Novakova Ulica",
-    "Nove Fužine",
-    "Novi Trg",
-    "Novinarska Ulica",
-    "Novo Naselje",
-    "Novo Polje, Cesta I",
-    "Novo Polje, Cesta Ii",
-    "Novo Polje, Cesta Iii",
-    "Novo Polje, Cesta Iv",
-    "Novo Polje, Cesta Ix",
-    "Novo Polje, Cesta V",
-    "Novo Polje, Cesta Vi",
-    "Novo Polje, Cesta Vii",
-    "Novo Polje, Cesta Viii",
-    "Novo Polje, Cesta X",
-    "Novo Polje, Cesta Xi",
-    "Novo Polje, Cesta Xii",
-    "Novo Polje, Cesta Xiii",
-    "Novo Polje, Cesta Xiv",
-    "Novo Polje, Cesta Xix",
-    "Novo Polje, Cesta Xv",
-    "Novo Polje, Cesta Xvi",
-    "Novo Polje, Cesta Xvii",
-    "Novo Polje, Cesta Xviii",
-    "Novo Polje, Cesta Xxi",
-    "Novo Polje, Cesta Xxiii",
-    "Novosadska Ulica",
-    "Nusdorferjeva Ulica",
-    "Ob Daljnovodu",
-    "Ob Dolenjski Železnici",
-    "Ob Farjevcu",
-    "Ob Kamniški Progi",
-    "Ob Ljubljanici",
-    "Ob Mejašu",
-    "Ob Potoku",
-    "Ob Pristanu",
-    "Ob Savi",
-    "Ob Sotočju",
-    "Ob Studencu",
-    "Ob Zdravstvenem Domu",
-    "Ob Zeleni Jami",
-    "Ob Zelenici",
-    "Ob Železnici",
-    "Ob Žici",
-    "Obirska Ulica",
-    "Obrežna Steza",
-    "Obrije",
-    "Obvozna Cesta",
-    "Ocvirkova Ulica",
-    "Ogrinčeva Ulica",
-    "Okiškega Ulica",
-    "Okrogarjeva Ulica",
-    "Omahnova Ulica",
-    "Omejčeva Ulica",
-    "Omersova Ulica",
-    "Opekarska Cesta",
-    "Oražnova Ulica",
-    "Orlova Ulica",
-    "Osenjakova Ulica",
-    "Oslavijska Ulica",
-    "Osojna Pot",
-    "Osterčeva Ulica",
-    "Ovčakova Ulica",
-    "Pahorjeva Ulica",
-    "Palmejeva Ulica",
-    "Pance",
-    "Papirniška Pot",
-    "Papirniški Trg",
-    "Parmova Ulica",
-    "Parmska Cesta",
-    "Partizanska Ulica",
-    "Pasterkova Pot",
-    "Pavlovčeva Ulica",
-    "Pavšičeva Ulica",
-    "Pečarjeva Ulica",
-    "Pečinska Ulica",
-    "Pečnik",
-    "Pečnikova Ulica",
-    "Pegamova Ulica",
-    "Perčeva Ulica",
-    "Peričeva Ulica",
-    "Periška Cesta",
-    "Perkova Ulica",
-    "Peršinova Cesta",
-    "Peruzzijeva Ulica",
-    "Pesarska Cesta",
-    "Pestotnikova Ulica",
-    "Peščena Pot",
-    "Petkova Ulica",
-    "Petkovškovo Nabrežje",
-    "Petrčeva Ulica",
-    "Petričeva Ulica",
-    "Pilonova Ulica",
-    "Pionirska Pot",
-    "Pipanova Pot",
-    "Pirnatova Ulica",
-    "Pivovarniška Ulica",
-    "Planinska Cesta",
-    "Planinškova Ulica",
-    "Plečnikov Podhod",
-    "Plečnikov Trg",
-    "Plemljeva Ulica",
-    "Plešičeva Ulica",
-    "Pleteršnikova Ulica",
-    "Plevančeva Ulica",
-    "Pločanska Ulica",
-    "Pod Akacijami",
-    "Pod Bregom",
-    "Pod Bresti",
-    "Pod Brezami",
-    "Pod Bukvami",
-    "Pod Debnim Vrhom",
-    "Pod Gabri",
-    "Pod Gozdom",
-    "Pod Gričem",
-    "Pod Hrasti",
-    "Pod Hribom",
-    "Pod Hruško",
-    "Pod Jelšami",
-    "Pod Jeseni",
-    "Pod Jezom",
-    "Pod Ježami",
-    "Pod Kamno Gorico",
-    "Pod Klancem",
-    "Pod Kostanji",
-    "Pod Lipami",
-    "Pod Topoli",
-    "Pod Trančo",
-    "Pod Turnom",
-    "Pod Vrbami",
-    "Podgorica",
-    "Podgornikova Ulica",
-    "Podgorska Cesta",
-    "Podgrajska Cesta",
-    "Podhod Ajdovščina",
-    "Podjunska Ulica",
-    "Podlimbarskega Ulica",
-    "Podlipoglav",
-    "Podmilščakova Ulica",
-    "Podmolniška Cesta",
-    "Podrožniška Pot",
-    "Podutiška Cesta",
-    "Podvozna Pot",
-    "Pogačarjev Trg",
-    "Pohlinova Ulica",
-    "Poklukarjeva Ulica",
-    "Pokopališka Ulica",
-    "Polakova Ulica",
-    "Polanškova Ulica",
-    "Poljanska Cesta",
-    "Poljanski Nasip",
-    "Polje",
-    "Polje, Cesta Ii",
-    "Polje, Cesta V",
-    "Polje, Cesta Vi",
-    "Polje, Cesta Viii",
-    "Polje, Cesta X",
-    "Polje, Cesta Xii",
-    "Polje, Cesta Xiv",
-    "Polje, Cesta Xl",
-    "Polje, Cesta Xliv",
-    "Polje, Cesta Xlvi",
-    "Polje, Cesta Xvi",
-    "Polje, Cesta Xviii",
-    "Polje, Cesta Xx",
-    "Polje, Cesta Xxii",
-    "Polje, Cesta Xxiv",
-    "Polje, Cesta Xxvi",
-    "Polje, Cesta Xxviii",
-    "Polje, Cesta Xxx",
-    "Polje, Cesta Xxxii",
-    "Polje, Cesta Xxxiv",
-    "Polje, Cesta Xxxvi",
-    "Polje, Cesta Xxxviii",
-    "Poljedelska Ulica",
-    "Poljska Pot",
-    "Popovičeva Ulica",
-    "Porentova Ulica",
-    "Posavskega Ulica",
-    "Postojnska Ulica",
-    "Pot Čez Gmajno",
-    "Pot Do Šole",
-    "Pot Draga Jakopiča",
-    "Pot Heroja Trtnika",
-    "Pot Ilegalcev",
-    "Pot K Igrišču",
-    "Pot K Izviru",
-    "Pot K Ribniku",
-    "Pot K Savi",
-    "Pot K Sejmišču",
-    "Pot K Skakalnici",
-    "Pot K Studencu",
-    "Pot Na Breje",
-    "Pot Na Drenikov Vrh",
-    "Pot Na Fužine",
-    "Pot Na Golovec",
-    "Pot Na Goro",
-    "Pot Na Gradišče",
-    "Pot Na Grič",
-    "Pot Na Hreše",
-    "Pot Na Labar",
-    "Pot Na Mah",
-    "Pot Na Most",
-    "Pot Na Orle",
-    "Pot Na Rakovo Jelšo",
-    "Pot Na Visoko",
-    "Pot Na Zduše",
-    "Pot Rdečega Križa",
-    "Pot Sodarjev",
-    "Pot V Boršt",
-    "Pot V Čeželj",
-    "Pot V Dolino",
-    "Pot V Goričico",
-    "Pot V Hrastovec",
-    "Pot V Hribec",
-    "Pot V Mejah",
-    "Pot V Mlake",
-    "Pot V Podgorje",
-    "Pot V Smrečje",
-    "Pot V Zeleni Gaj",
-    "Pot Za Brdom",
-    "Pot Za Razori",
-    "Potočnikova Ulica",
-    "Potokarjeva Ulica",
-    "Potrčeva Ulica",
-    "Povšetova Ulica",
-    "Praprotnikova Ulica",
-    "Prašnikarjeva Ulica",
-    "Praznikova Ulica",
-    "Pražakova Ulica",
-    "Prečna Ulica",
-    "Pred Savljami",
-    "Predjamska Cesta",
-    "Pregljeva Ulica",
-    "Preglov Trg",
-    "Prekmurska Ulica",
-    "Prelčeva Ulica",
-    "Preloge",
-    "Prelovčeva Ulica",
-    "Premrlova Ulica",
-    "Preradovićeva Ulica",
-    "Preserska Ulica",
-    "Presetnikova Ulica",
-    "Prešernov Trg",
-    "Prešernova Cesta",
-    "Pretnarjeva Ulica",
-    "Prežganje",
-    "Prežihova Ulica",
-    "Pri Borštu",
-    "Pri Malem Kamnu",
-    "Pri Mostiščarjih",
-    "Pri Velikem Kamnu",
-    "Pribinova Ulica",
-    "Prijateljeva Ulica",
-    "Primorska Ulica",
-    "Primožičeva Ulica",
-    "Prinčičeva Ulica",
-    "Prisojna Ulica",
-    "Prištinska Ulica",
-    "Privoz",
-    "Privškova Ulica",
-    "Proletarska Cesta",
-    "Prule",
-    "Prušnikova Ulica",
-    "Prvomajska Ulica",
-    "Pržanjska Ulica",
-    "Pšatnik",
-    "Pšatska Pot",
-    "Ptujska Ulica",
-    "Pugljeva Ulica",
-    "Puharjeva Ulica",
-    "Puhova Ulica",
-    "Puhtejeva Ulica",
-    "Pustovrhova Ulica",
-    "Puterlejeva Ulica",
-    "Putrihova Ulica",
-    "Raičeva Ulica",
-    "Rakarska Ulica",
-    "Rakovniška Ulica",
-    "Rakuševa Ulica",
-    "Ramovševa Ulica",
-    "Rašica",
-    "Rašiška Ulica",
-    "Ravbarjeva Ulica",
-    "Ravna Pot",
-    "Ravnikova Ulica",
-    "Ravno Brdo",
-    "Razdevškova Ulica",
-    "Reber",
-    "Reboljeva Ulica",
-    "Rečna Ulica",
-    "Redelonghijeva Ulica",
-    "Regentova Cesta",
-    "Repče",
-    "Resljeva Cesta",
-    "Reška Ulica",
-    "Rezijanska Ulica",
-    "Ribičičeva Ulica",
-    "Ribji Trg",
-    "Ribniška Ulica",
-    "Riharjeva Ulica",
-    "Rimska Cesta",
-    "Rjava Cesta",
-    "Robbova Ulica",
-    "Robičeva Ulica",
-    "Rocenska Ulica",
-    "Rodičeva Ulica",
-    "Rojčeva Ulica",
-    "Romavhova Ulica",
-    "Rosna Pot",
-    "Roška Cesta",
-    "Rotarjeva Ulica",
-    "Rovšnikova Ulica",
-    "Rozmanova Ulica",
-    "Rožančeva Cesta",
-    "Rožanska Ulica",
-    "Rožičeva Ulica",
-    "Rožna Dolina, Cesta I",
-    "Rožna Dolina, Cesta Ii",
-    "Rožna Dolina, Cesta Iii",
-    "Rožna Dolina, Cesta Iv",
-    "Rožna Dolina, Cesta Ix",
-    "Rožna Dolina, Cesta V",
-    "Rožna Dolina, Cesta Vi",
-    "Rožna Dolina, Cesta Vii",
-    "Rožna Dolina, Cesta Viii",
-    "Rožna Dolina, Cesta X",
-    "Rožna Dolina, Cesta Xi",
-    "Rožna Dolina, Cesta Xii",
-    "Rožna Dolina, Cesta Xiii",
-    "Rožna Dolina, Cesta Xix",
-    "Rožna Dolina, Cesta Xv",
-    "Rožna Dolina, Cesta Xvii",
-    "Rožna Dolina, Cesta Xxi",
-    "Rožna Ulica",
-    "Rudnik I",
-    "Rudnik Ii",
-    "Rudnik Iii",
-    "Runkova Ulica",
-    "Rusjanov Trg",
-    "Ruska Ulica",
-    "Rutarjeva Ulica",
-    "Sadinja Vas",
-    "Sajovčeva Ulica",
-    "Salendrova Ulica",
-    "Samova Ulica",
-    "Saškova Ulica",
-    "Sattnerjeva Ulica",
-    "Saveljska Cesta",
-    "Savinova Ulica",
-    "Savinškova Ulica",
-    "Savlje",
-    "Savska Cesta",
-    "Scopolijeva Ulica",
-    "Sedejeva Ulica",
-    "Selanov Trg",
-    "Selanova Ulica",
-    "Seliškarjeva Ulica",
-    "Selo Pri Pancah",
-    "Setnikarjeva Ulica",
-    "Seunigova Ulica",
-    "Simončičeva Ulica",
-    "Simonitijeva Ulica",
-    "Siva Pot",
-    "Skapinova Ulica",
-    "Sketova Ulica",
-    "Skopčeva Ulica",
-    "Skopska Ulica",
-    "Skrbinškova Ulica",
-    "Slape",
-    "Slapnikova Ulica",
-    "Slavčja Ulica",
-    "Slodnjakova Ulica",
-    "Slomškova Ulica",
-    "Slovenčeva Ulica",
-    "Slovenska Cesta",
-    "Smerdujeva Ulica",
-    "Smoletova Ulica",
-    "Smrekarjeva Ulica",
-    "Smrtnikova Ulica",
-    "Sneberska Cesta",
-    "Snebersko Nabrežje",
-    "Snežniška Ulica",
-    "Snojeva Ulica",
-    "Sodarska Steza",
-    "Sojerjeva Ulica",
-    "Sončna Pot",
-    "Sostrska Cesta",
-    "Soška Ulica",
-    "Soteska",
-    "Soteška Pot",
-    "Soussenska Ulica",
-    "Sovretova Ulica",
-    "Splitska Ulica",
-    "Spodnje Gameljne",
-    "Spodnji Rudnik I",
-    "Spodnji Rudnik Ii",
-    "Spodnji Rudnik Iii",
-    "Spodnji Rudnik Iv",
-    "Spodnji Rudnik V",
-    "Spomeniška Pot",
-    "Srebrničeva Ulica",
-    "Središka Ulica",
-    "Srednja Pot",
-    "Srednje Gameljne",
-    "Stadionska Ulica",
-    "Stanežiče",
-    "Staničeva Ulica",
-    "Stantetova Ulica",
-    "Stara Ježica",
-    "Stara Slovenska Ulica",
-    "Stare Črnuče",
-    "Staretova Ulica",
-    "Stari Trg",
-    "Stegne",
-    "Steletova Ulica",
-    "Sternadova Ulica",
-    "Sternenova Ulica",
-    "Stiška Ulica",
-    "Stolpniška Ulica",
-    "Stoženska Ulica",
-    "Stožice",
-    "Stranska Pot",
-    "Stražarjeva Ulica",
-    "Streliška Ulica",
-    "Stritarjeva Ulica",
-    "Strmec",
-    "Strmeckijeva Ulica",
-    "Strmi Pot",
-    "Strniševa Cesta",
-    "Strojeva Ulica",
-    "Strossmayerjeva Ulica",
-    "Strugarska Ulica",
-    "Studenec",
-    "Suhadolčanova Ulica",
-    "Sulčja Ulica",
-    "Svetčeva Ulica",
-    "Svetosavska Ulica",
-    "Šarhova Ulica",
-    "Šentjakob",
-    "Šentpavel",
-    "Šentviška Ulica",
-    "Šercerjeva Ulica",
-    "Šerkova Ulica",
-    "Šestova Ulica",
-    "Šibeniška Ulica",
-    "Šifrerjeva Ulica",
-    "Šinkov Štradon",
-    "Šišenska Cesta",
-    "Šivičeva Ulica",
-    "Škerjančeva Ulica",
-    "Škerljeva Ulica",
-    "Škofova Ulica",
-    "Škrabčeva Ulica",
-    "Šlajmerjeva Ulica",
-    "Šlandrova Ulica",
-    "Šlosarjeva Ulica",
-    "Šmarna Gora",
-    "Šmarnogorska Pot",
-    "Šmartinska Cesta",
-    "Šmartno",
-    "Španova Pot",
-    "Španska Ulica",
-    "Športna Ulica",
-    "Štajerska Cesta",
-    "Štebijeva Cesta",
-    "Štefančeva Ulica",
-    "Štefanova Ulica",
-    "Štembalova Ulica",
-    "Štepanjska Cesta",
-    "Štepanjsko Nabrežje",
-    "Štihova Ulica",
-    "Štirnova Ulica",
-    "Štrekljeva Ulica",
-    "Štrukljeva Ulica",
-    "Študentovska Ulica",
-    "Štukljeva Cesta",
-    "Štula",
-    "Štularjeva Ulica",
-    "Šturmova Ulica",
-    "Šubičeva Ulica",
-    "Šumarjeva Ulica",
-    "Švabićeva Ulica",
-    "Švarova Ulica",
-    "Švedska Ulica",
-    "Švegljeva Cesta",
-    "Tabor",
-    "Taborska Cesta",
-    "Tacenska Cesta",
-    "Tavčarjeva Ulica",
-    "Tbilisijska Ulica",
-    "Tehnološki Park",
-    "Tesarska Ulica",
-    "Teslova Ulica",
-    "Tesna Ulica",
-    "Tesovnikova Ulica",
-    "Thumova Ulica",
-    "Tiha Ulica",
-    "Tiranova Ulica",
-    "Tischlerjeva Ulica",
-    "Tisnikarjeva Ulica",
-    "Tivolska Cesta",
-    "Tkalska Ulica",
-    "Tobačna Ulica",
-    "Tolminska Ulica",
-    "Tolstojeva Ulica",
-    "Tomačevo",
-    "Tomačevska Cesta",
-    "Tomažičeva Ulica",
-    "Tomčeva Ulica",
-    "Tometova Ulica",
-    "Tominškova Ulica",
-    "Tomišeljska Ulica",
-    "Tomšičeva Ulica",
-    "Toplarniška Ulica",
-    "Topniška Ulica",
-    "Torkarjeva Ulica",
-    "Toško Čelo",
-    "Tovarniška Ulica",
-    "Tratnikova Ulica",
-    "Travniška Ulica",
-    "Trbeže",
-    "Trdinova Ulica",
-    "Trebinjska Ulica",
-    "Trebušakova Ulica",
-    "Trg 9. Maja",
-    "Trg Francoske Revolucije",
-    "Trg Komandanta Staneta",
-    "Trg Mladih",
-    "Trg Mladinskih Delov. Brigad",
-    "Trg Osvobodilne Fronte",
-    "Trg Prekomorskih Brigad",
-    "Trg Republike",
-    "Triglavska Ulica",
-    "Trinkova Ulica",
-    "Trnovčeva Ulica",
-    "Trnovska Ulica",
-    "Trnovski Pristan",
-    "Trpinčeva Ulica",
-    "Trstenjakova Ulica",
-    "Trtnikova Ulica",
-    "Trubarjeva Cesta",
-    "Tržaška Cesta",
-    "Tržna Ulica",
-    "Tugomerjeva Ulica",
-    "Tuji Grm",
-    "Turjaška Ulica",
-    "Turnerjeva Ulica",
-    "Udvančeva Ulica",
-    "Ukmarjeva Ulica",
-    "Ulica 15. Aprila",
-    "Ulica 15. Maja",
-    "Ulica 24. Avgusta",
-    "Ulica 28. Maja",
-    "Ulica 9. Junija",
-    "Ulica Aktivistov",
-    "Ulica Alme Sodnik",
-    "Ulica Alojza Kajina",
-    "Ulica Ambrožiča Novljana",
-    "Ulica Andreja Kumarja",
-    "Ulica Ane Ziherlove",
-    "Ulica Angelce Ocepkove",
-    "Ulica Angele Ljubičeve",
-    "Ulica Angele Vode",
-    "Ulica Bena Zupančiča",
-    "Ulica Borca Petra",
-    "Ulica Borcev Za Severno Mejo",
-    "Ulica Bratov Babnik",
-    "Ulica Bratov Bezlajev",
-    "Ulica Bratov Blanč",
-    "Ulica Bratov Jančar",
-    "Ulica Bratov Knapič",
-    "Ulica Bratov Komel",
-    "Ulica Bratov Kraljič",
-    "Ulica Bratov Martinec",
-    "Ulica Bratov Miklič",
-    "Ulica Bratov Novak",
-    "Ulica Bratov Rozmanov",
-    "Ulica Bratov Škofov",
-    "Ulica Bratov Tuma",
-    "Ulica Bratov Učakar",
-    "Ulica Bratov Židan",
-    "Ulica Carla Benza",
-    "Ulica Dušana Kraigherja",
-    "Ulica Ekvorna",
-    "Ulica Ernesta Kramerja",
-    "Ulica Ferda Kozaka",
-    "Ulica Franca Mlakarja",
-    "Ulica Franca Nebca",
-    "Ulica Franje Koširjeve",
-    "Ulica Gledališča Btc",
-    "Ulica Goce Delčeva",
-    "Ulica Gradnikove Brigade",
-    "Ulica Gubčeve Brigade",
-    "Ulica Hermana Potočnika",
-    "Ulica Iga Grudna",
-    "Ulica Ivana Roba",
-    "Ulica Ivane Kobilce",
-    "Ulica Ivanke Kožuh",
-    "Ulica Ivice Pirjevčeve",
-    "Ulica Jana Husa",
-    "Ulica Janeza Pavla Ii.",
-    "Ulica Janeza Rožiča",
-    "Ulica Josipine Turnograjske",
-    "Ulica Jožeta Jame",
-    "Ulica Jožeta Japlja",
-    "Ulica Jožeta Mirtiča",
-    "Ulica Jožeta Štruklja",
-    "Ulica Juša Kozaka",
-    "Ulica Konrada Babnika",
-    "Ulica Koroškega Bataljona",
-    "Ulica Lili Novy",
-    "Ulica Lizike Jančarjeve",
-    "Ulica Lojzeta Spacala",
-    "Ulica Lojzke Štebijeve",
-    "Ulica Lovre Klemenčiča",
-    "Ulica Malči Beličeve",
-    "Ulica Manice Komanove",
-    "Ulica Marije Drakslerjeve",
-    "Ulica Marije Hvaličeve",
-    "Ulica Marije Mlinar",
-    "Ulica Marje Boršnikove",
-    "Ulica Marka Šlajmerja",
-    "Ulica Metoda Mikuža",
-    "Ulica Milana Majcna",
-    "Ulica Milke Kerinove",
-    "Ulica Minke Bobnar",
-    "Ulica Mire Miheličeve",
-    "Ulica Mirka Jurce",
-    "Ulica Mirka Tomšiča",
-    "Ulica Miroslava Kokolja",
-    "Ulica Miroslava Turka",
-    "Ulica Miru",
-    "Ulica Molniške Čete",
-    "Ulica Na Grad",
-    "Ulica Nade Čamernikove",
-    "Ulica Nadgoriških Borcev",
-    "Ulica Olge Mohorjeve",
-    "Ulica Padlih Borcev",
-    "Ulica Pariške Komune",
-    "Ulica Pavle Jeromnove",
-    "Ulica Pohorskega Bataljona",
-    "Ulica Polonce Čude",
-    "Ulica Pregnancev",
-    "Ulica Prvoborcev",
-    "Ulica Rezke Dragarjeve",
-    "Ulica Rozke Usenik",
-    "Ulica Rudolfa Janežiča",
-    "Ulica Staneta Severja",
-    "Ulica Stare Pravde",
-    "Ulica Štefke Zbašnikove",
-    "Ulica Talcev",
-    "Ulica Tomšičeve Brigade",
-    "Ulica Tončke Čečeve",
-    "Ulica V Kokovšek",
-    "Ulica Vida Khisla",
-    "Ulica Vide Janežičeve",
-    "Ulica Vide Pregarčeve",
-    "Ulica Vladimirja Trampuža",
-    "Ulica Za Travniki",
-    "Ulica Zore Majcnove",
-    "Ulica Zore Ragancinove",
-    "Ulica Žanke Erjavec",
-    "Ulica Željka Tonija",
-    "Uraničeva Ulica",
-    "Uršičev Štradon",
-    "Usnjarska Ulica",
-    "V Češnjico",
-    "V Dolini",
-    "V Dovjež",
-    "V Karlovce",
-    "V Karlovce",
-    "V Kladeh",
-    "V Murglah",
-    "V Sige",
-    "V Toplice",
-    "V Varde",
-    "V Zalar",
-    "Vagajeva Ulica",
-    "Valjavčeva Ulica",
-    "Valjhunova Ulica",
-    "Valvasorjeva Ulica",
-    "Vandotova Ulica",
-    "Vaška Pot",
-    "Vavpotičeva Ulica",
-    "Večna Pot",
-    "Vegova Ulica",
-    "Velebitska Ulica",
-    "Velika Čolnarska Ulica",
-    "Veliki Lipoglav",
-    "Veliki Štradon",
-    "Veliko Trebeljevo",
-    "Velikovška Ulica",
-    "Velnarjeva Ulica",
-    "Verdnikova Ulica",
-    "Verovškova Ulica",
-    "Veršičeva Ulica",
-    "Veselova Ulica",
-    "Vevška Cesta",
-    "Videmska Ulica",
-    "Vidergarjeva Ulica",
-    "Vidičeva Ulica",
-    "Vidmarjeva Ulica",
-    "Vidovdanska Cesta",
-    "Vilharjev Podhod",
-    "Vilharjeva Cesta",
-    "Vinčarjeva Ulica",
-    "Vinterca",
-    "Vipavska Ulica",
-    "Vipotnikova Ulica",
-    "Viška Cesta",
-    "Višnjevarjeva Ulica",
-    "Vižmarska Pot",
-    "Vnajnarje",
-    "Vodmatska Ulica",
-    "Vodna Steza",
-    "Vodnikov Trg",
-    "Vodnikova Cesta",
-    "Vodnikovo Naselje",
-    "Vodovodna Cesta",
-    "Voduškova Ulica",
-    "Vogelna Ulica",
-    "Vojkova Cesta",
-    "Volaričeva Ulica",
-    "Volarjev Štradon",
-    "Volavlje",
-    "Vošnjakova Ulica",
-    "Vožarski Pot",
-    "Vranja Pot",
-    "Vrazov Trg",
-    "Vrbovec",
-    "Vrbska Ulica",
-    "Vregova Ulica",
-    "Vrhovci, Cesta I",
-    "Vrhovci, Cesta Ii",
-    "Vrhovci, Cesta Iii",
-    "Vrhovci, Cesta Iv",
-    "Vrhovci, Cesta Ix",
-    "Vrhovci, Cesta V",
-    "Vrhovci, Cesta Vi",
-    "Vrhovci, Cesta Viii",
-    "Vrhovci, Cesta X",
-    "Vrhovci, Cesta Xi",
-    "Vrhovci, Cesta Xii",
-    "Vrhovci, Cesta Xiii",
-    "Vrhovci, Cesta Xiv",
-    "Vrhovci, Cesta Xix",
-    "Vrhovci, Cesta Xv",
-    "Vrhovci, Cesta Xvi",
-    "Vrhovci, Cesta Xvii",
-    "Vrhovci, Cesta Xviii",
-    "Vrhovci, Cesta Xx",
-    "Vrhovci, Cesta Xxi",
-    "Vrhovci, Cesta Xxii",
-    "Vrhovci, Cesta Xxvi",
-    "Vrhovci, Cesta Xxviii",
-    "Vrhovci, Cesta Xxx",
-    "Vrhovci, Cesta Xxxii",
-    "Vrhovčeva Ulica",
-    "Vrhovnikova Ulica",
-    "Vrščajeva Ulica",
-    "Vrtača",
-    "Vrtna Ulica",
-    "Vrtnarska Cesta",
-    "Vulčeva Ulica",
-    "Vurnikova Ulica",
-    "Vzajemna Ulica",
-    "Windischerjeva Ulica",
-    "Wolfova Ulica",
-    "Za Čreslom",
-    "Za Garažami",
-    "Za Gasilskim Domom",
-    "Za Gradom",
-    "Za Krajem",
-    "Za Opekarno",
-    "Za Partizanskim Domom",
-    "Za Progo",
-    "Za Vasjo",
-    "Zabretova Ulica",
-    "Zadnikarjeva Ulica",
-    "Zadobrovška Cesta",
-    "Zadružna Ulica",
-    "Zagradišče",
-    "Zagrebška Ulica",
-    "Zajčeva Pot",
-    "Zajčevi Dvori",
-    "Zakotnikova Ulica",
-    "Zakrajškova Ulica",
-    "Zalaznikova Ulica",
-    "Zaletelova Ulica",
-    "Zaloška Cesta",
-    "Zapuška Cesta",
-    "Zarnikova Ulica",
-    "Zasavska Cesta",
-    "Zavetiška Ulica",
-    "Zavoglje",
-    "Završje",
-    "Zbašnikova Ulica",
-    "Zdešarjeva Cesta",
-    "Zdravstvena Pot",
-    "Zelena Pot",
-    "Zelenova Ulica",
-    "Zeljarska Ulica",
-    "Zemljemerska Ulica",
-    "Zevnikova Ulica",
-    "Zgornja Besnica",
-    "Zgornje Gameljne",
-    "Ziherlova Ulica",
-    "Ziljska Ulica",
-    "Zlatek",
-    "Znamenjska Ulica",
-    "Zofke Kvedrove Ulica",
-    "Zoisova Cesta",
-    "Zoletova Ulica",
-    "Zupanova Ulica",
-    "Zvezda",
-    "Zvezdarska Ulica",
-    "Zvezna Ulica",
-    "Zvonarska Ulica",
-    "Žabarjeva Ulica",
-    "Žabja Ulica",
-    "Žabjak",
-    "Žalska Ulica",
-    "Žaucerjeva Ulica",
-    "Žebretova Ulica",
-    "Žeje",
-    "Železna Cesta",
-    "Železnikarjeva Ulica",
-    "Žerjalova Ulica",
-    "Žibertova Ulica",
-    "Židankova Ulica",
-    "Židovska Steza",
-    "Židovska Ulica",
-    "Žigonova Ulica",
-    "Živaličeva Ulica",
-    "Živinozdravska Ulica",
-    "Žolgerjeva Ulica",
-    "Žorgova Ulica",
-    "Župančičeva Ulica"
-]
 
 LJUBLJANA_LOCATIONS = [
     "Ljubljana Center", "Bežigrad", "Šiška", "Vič", "Moste",
@@ -1791,6 +230,7 @@ def generate_random_pobude():
         for pobuda in pobude_to_delete:
             session.delete(pobuda)
         session.commit()
+        sync_upload_refcounts(session)
         
         
         for pobuda_data in RANDOM_POBUDE_DATA:
@@ -1829,7 +269,11 @@ def generate_random_pobude():
             
             session.add(pobuda)
         
-        session.commit()
+        session.flush()
+        rebuild_stats_rollup(session)
+        backfill_district_ids(session)
+        clear_tile_cache()
+        hotspot_worker.notify_full()
         return len(RANDOM_POBUDE_DATA)
 
 router = APIRouter()
@@ -1846,16 +290,7 @@ async def create_pobuda(
     image: Optional[UploadFile] = File(None)
 ):
     
-    image_path = None
-    if image:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_extension = os.path.splitext(image.filename)[1]
-        filename = f"pobuda_{timestamp}{file_extension}"
-        file_path = os.path.join(UPLOAD_DIR, filename)
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(image.file, buffer)
-        image_path = f"/uploads/{filename}"
-
+    upload = await save_upload(image) if image else None
     pobuda = Pobuda(
         title=title,
         description=description,
@@ -1864,32 +299,214 @@ async def create_pobuda(
         longitude=longitude,
         email=email,
         category=category,
-        image_path=image_path
+        image_path=storage.url(upload.key) if upload else None
     )
+    # Geocoding and the database write block, so keep them off the event loop
+    try:
+        return await run_in_threadpool(_insert_pobuda, pobuda, upload)
+    except BaseException:
+        if upload:
+            await run_in_threadpool(_release_upload, upload.key)
+        raise
+
+def _release_upload(key: str):
+    with Session(engine) as session:
+        release_upload(session, key)
+
+def _insert_pobuda(pobuda: Pobuda, upload: Optional[StoredUpload] = None) -> Pobuda:
+    if is_generic_location(pobuda.location):
+        pobuda.location = geocoder.location(pobuda.latitude, pobuda.longitude)
+    pobuda.district_id = district_id(pobuda.latitude, pobuda.longitude)
     with Session(engine) as session:
         session.add(pobuda)
+        variants = None
+        if upload:
+            # save_upload() counted the reference already
+            session.flush()
+            # Read after the write lock is held, so a worker finishing now either
+            # committed already or will update this row after our commit
+            variants = session.exec(select(UploadBlob.variants).where(UploadBlob.key == upload.key)).one()
+            pobuda.image_variants = variants or None
+        record_pobude(session, [pobuda])
         session.commit()
         session.refresh(pobuda)
+        invalidate_tiles(pobuda.latitude, pobuda.longitude)
+        hotspot_worker.notify(pobuda.latitude, pobuda.longitude)
+        if upload and variants is None:
+            derivative_worker.submit(upload.key)
         return pobuda
 
+@router.get("/api/pobude/bbox", response_model=List[Pobuda])
+def get_pobude_in_bbox(
+    min_lat: float = Query(..., alias="minLat", ge=-90, le=90),
+    min_lng: float = Query(..., alias="minLng", ge=-180, le=180),
+    max_lat: float = Query(..., alias="maxLat", ge=-90, le=90),
+    max_lng: float = Query(..., alias="maxLng", ge=-180, le=180),
+    category: Optional[str] = Query(default=None),
+    status: Optional[str] = Query(default=None),
+    limit: int = Query(default=800, ge=1, le=5000)
+):
+    if min_lat > max_lat or min_lng > max_lng:
+        raise HTTPException(status_code=400, detail="Invalid bounding box")
+    with Session(engine) as session:
+        statement = select(Pobuda).where(Pobuda.id.in_(
+            select(pobuda_rtree.c.id).where(bbox_condition(min_lat, min_lng, max_lat, max_lng))
+        ))
+        
+        if category and category != "all":
+            statement = statement.where(Pobuda.category == category)
+        
+        if status and status != "all":
+            statement = statement.where(Pobuda.status == status)
+        
+        statement = statement.order_by(Pobuda.created_at.desc()).limit(limit)
+        return session.exec(statement).all()
+
+@router.get("/api/pobude/nearby", response_model=List[PobudaNearby])
+def get_nearby_pobude(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+    radius: float = Query(default=200, gt=0, le=5000),
+    k: int = Query(default=10, ge=1, le=50),
+    category: Optional[str] = Query(default=None),
+    status: Optional[str] = Query(default=None)
+):
+    """Up to k pobude within radius meters, closest first; distance is in meters"""
+    with Session(engine) as session:
+        statement = select(Pobuda.id, Pobuda.latitude, Pobuda.longitude).where(Pobuda.id.in_(
+            select(pobuda_rtree.c.id).where(bbox_condition(*radius_bbox(lat, lng, radius)))
+        ))
+        
+        if category and category != "all":
+            statement = statement.where(Pobuda.category == category)
+        
+        if status and status != "all":
+            statement = statement.where(Pobuda.status == status)
+        
+        candidates = np.array(session.exec(statement).all(), dtype=np.float64).reshape(-1, 3)
+        distances = haversine_m(lat, lng, candidates[:, 1], candidates[:, 2])
+        order = np.argsort(distances, kind="stable")[:k]
+        order = order[distances[order] <= radius]
+        if not len(order):
+            return []
+        
+        nearest = {int(candidates[i, 0]): float(distances[i]) for i in order}
+        pobude = session.exec(select(Pobuda).where(Pobuda.id.in_(list(nearest)))).all()
+        pobude.sort(key=lambda p: nearest[p.id])
+        return [PobudaNearby(**p.model_dump(), distance=round(nearest[p.id], 1)) for p in pobude]
+
+CLUSTER_POINT_LIMIT = 2000
+
+@router.get("/api/pobude/clusters", response_model=PobudaClusters)
+def get_pobuda_clusters(
+    min_lat: float = Query(..., alias="minLat", ge=-90, le=90),
+    min_lng: float = Query(..., alias="minLng", ge=-180, le=180),
+    max_lat: float = Query(..., alias="maxLat", ge=-90, le=90),
+    max_lng: float = Query(..., alias="maxLng", ge=-180, le=180),
+    zoom: int = Query(..., ge=0, le=22)
+):
+    """Grid clusters for the viewport, or individual points above the highest grid zoom"""
+    if min_lat > max_lat or min_lng > max_lng:
+        raise HTTPException(status_code=400, detail="Invalid bounding box")
+    with Session(engine) as session:
+        if zoom > GRID_ZOOM_LEVELS[-1]:
+            points = session.exec(
+                select(Pobuda)
+                .where(Pobuda.id.in_(
+                    select(pobuda_rtree.c.id).where(bbox_condition(min_lat, min_lng, max_lat, max_lng))
+                ))
+                .limit(CLUSTER_POINT_LIMIT)
+            ).all()
+            return PobudaClusters(zoom=zoom, clusters=[], points=points)
+        
+        level = max(zoom, GRID_ZOOM_LEVELS[0])
+        min_x, min_y = grid_cell(min_lat, min_lng, level)
+        max_x, max_y = grid_cell(max_lat, max_lng, level)
+        total = func.sum(pobuda_grid.c.count)
+        rows = session.exec(
+            select(
+                total,
+                func.sum(pobuda_grid.c.lat_sum),
+                func.sum(pobuda_grid.c.lng_sum),
+                func.sum(case((pobuda_grid.c.status == "v obravnavi", pobuda_grid.c.count), else_=0)),
+                func.sum(case((pobuda_grid.c.status == "odgovorjeno", pobuda_grid.c.count), else_=0)),
+            )
+            .where(
+                pobuda_grid.c.zoom == level,
+                pobuda_grid.c.cell_x.between(min_x, max_x),
+                pobuda_grid.c.cell_y.between(min_y, max_y),
+            )
+            .group_by(pobuda_grid.c.cell_x, pobuda_grid.c.cell_y)
+            .having(total > 0)
+        ).all()
+        clusters = [
+            PobudaCluster(
+                latitude=lat_sum / count,
+                longitude=lng_sum / count,
+                count=count,
+                pending=pending,
+                responded=responded
+            )
+            for count, lat_sum, lng_sum, pending, responded in rows
+        ]
+        return PobudaClusters(zoom=zoom, clusters=clusters, points=[])
+
 @router.get("/api/pobude/{pobuda_id}", response_model=Pobuda)
-def get_pobuda(pobuda_id: int):
+def get_pobuda(pobuda_id: int, request: Request, response: Response):
     with Session(engine) as session:
+        current = session.exec(select(Pobuda.id, Pobuda.updated_at).where(Pobuda.id == pobuda_id)).first()
+        if current:
+            not_modified = check_not_modified(request, response, make_etag("pobuda", *current))
+            if not_modified:
+                return not_modified
         pobuda = session.get(Pobuda, pobuda_id)
         if not pobuda:
             raise HTTPException(status_code=404, detail="Pobuda not found")
         return pobuda
 
-@router.get("/api/pobude", response_model=List[Pobuda])
+def encode_cursor(pobuda):
+    """Opaque keyset cursor pointing just past `pobuda` in created_at desc, id desc order"""
+    raw = f"{pobuda.created_at.isoformat()},{pobuda.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, pobuda_id = raw.rsplit(",", 1)
+        return datetime.fromisoformat(created_at), int(pobuda_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+@router.get("/api/pobude", response_model=List[PobudaListItem])
 def get_pobude(
+    request: Request,
+    response: Response,
     limit: Optional[int] = Query(default=None, ge=1, le=100), 
     offset: Optional[int] = Query(default=None, ge=0),
+    after: Optional[str] = Query(default=None),
     category: Optional[str] = Query(default=None),
     status: Optional[str] = Query(default=None),
     search: Optional[str] = Query(default=None)
 ):
-    with Session(engine) as session:        
-        statement = select(Pobuda)
+    with Session(engine) as session:
+        etag = make_etag("pobude", table_version(session), sorted(request.query_params.multi_items()))
+        not_modified = check_not_modified(request, response, etag)
+        if not_modified:
+            return not_modified
+
+        match_query = build_match_query(search) if search and search.strip() else None
+        
+        if match_query:
+            if after is not None:
+                raise HTTPException(status_code=400, detail="Cursor pagination cannot be combined with search")
+            statement = (
+                select(Pobuda, snippet_expression())
+                .join(pobuda_fts, pobuda_fts.c.rowid == Pobuda.id)
+                .where(match_condition(match_query))
+                .order_by(rank_expression(), Pobuda.created_at.desc())
+            )
+        else:
+            statement = select(Pobuda).order_by(Pobuda.created_at.desc(), Pobuda.id.desc())
         
         if category and category != "all":
             statement = statement.where(Pobuda.category == category)    
@@ -1897,31 +514,28 @@ def get_pobude(
         if status and status != "all":
             statement = statement.where(Pobuda.status == status)
         
-        if search and search.strip():
-            search_term = f"%{search.strip()}%"
-            statement = statement.where(
-                (Pobuda.title.ilike(search_term)) |
-                (Pobuda.description.ilike(search_term)) |
-                (Pobuda.location.ilike(search_term))
-            )
-        
-        statement = statement.order_by(Pobuda.created_at.desc())
+        if after is not None:
+            statement = statement.where(tuple_(Pobuda.created_at, Pobuda.id) < tuple_(*decode_cursor(after)))
+            offset = None
+            limit = limit if limit is not None else 10
         
         if limit is None and offset is None:
-            if status and status == "v obravnavi":
-                pobude = session.exec(statement).all()
-                return pobude
-            else:
-                statement = statement.limit(800)
-                pobude = session.exec(statement).all()
-                return pobude
+            statement = statement.limit(800)
+            return _list_items(session.exec(statement).all(), match_query)
         
         effective_limit = limit if limit is not None else 10
         effective_offset = offset if offset is not None else 0
         
         statement = statement.offset(effective_offset).limit(effective_limit)
         pobude = session.exec(statement).all()
-        return pobude
+        if not match_query and len(pobude) == effective_limit:
+            response.headers["X-Next-Cursor"] = encode_cursor(pobude[-1])
+        return _list_items(pobude, match_query)
+
+def _list_items(rows, with_snippets):
+    if not with_snippets:
+        return rows
+    return [PobudaListItem(**pobuda.model_dump(), snippet=render_snippet(snippet)) for pobuda, snippet in rows]
 
 @router.put("/api/pobude/{pobuda_id}/respond", response_model=Pobuda)
 def respond_to_pobuda(pobuda_id: int, response_data: PobudaResponse, token: str = Depends(verify_token)):
@@ -1929,14 +543,122 @@ def respond_to_pobuda(pobuda_id: int, response_data: PobudaResponse, token: str
         pobuda = session.get(Pobuda, pobuda_id)
         if not pobuda:
             raise HTTPException(status_code=404, detail="Pobuda not found")
+        deltas = collect_rollup(new_rollup_deltas(), pobuda, -1)
         pobuda.response = response_data.response
         pobuda.status = "odgovorjeno"
         pobuda.responded_at = datetime.utcnow()
+        collect_rollup(deltas, pobuda)
+        apply_rollup(session, deltas)
+        hotspot_id, pobuda.hotspot_id = pobuda.hotspot_id, None
         session.add(pobuda)
         session.commit()
         session.refresh(pobuda)
+        invalidate_tiles(pobuda.latitude, pobuda.longitude)
+        hotspot_worker.notify(pobuda.latitude, pobuda.longitude, hotspot_id)
         return pobuda
 
+# Leading sort keys per queue order, all ascending and followed by created_at, id
+ADMIN_QUEUE_ORDERS = {
+    "oldest": (),
+    "category": (Pobuda.category,),
+    "urgency": (Pobuda.urgency_rank,),
+}
+
+def encode_queue_cursor(keys):
+    """Opaque keyset cursor for the admin queue from the sort keys of the last row"""
+    *leading, created_at, pobuda_id = keys
+    raw = json.dumps([*leading, created_at.isoformat(), pobuda_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_queue_cursor(cursor: str, length: int):
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode())
+        if not isinstance(keys, list) or len(keys) != length:
+            raise ValueError("wrong number of keys")
+        keys[-2] = datetime.fromisoformat(keys[-2])
+        return keys
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def pending_count(session: Session, category: Optional[str] = None):
+    """Number of pending pobude, read from the statistics rollup"""
+    statement = select(func.sum(PobudaStatsDaily.created_count)).where(PobudaStatsDaily.status == "v obravnavi")
+    if category:
+        statement = statement.where(PobudaStatsDaily.category == category)
+    return session.exec(statement).one() or 0
+
+@router.get("/api/admin/queue", response_model=List[Pobuda])
+def get_admin_queue(
+    response: Response,
+    limit: int = Query(default=20, ge=1, le=100),
+    after: Optional[str] = Query(default=None),
+    order: Literal["oldest", "category", "urgency"] = Query(default="oldest"),
+    category: Optional[str] = Query(default=None),
+    token: str = Depends(verify_token)
+):
+    """
+    Page through pending pobude by keyset cursor; X-Total-Count carries the
+    backlog size and X-Next-Cursor the cursor of the following page
+    """
+    leading = ADMIN_QUEUE_ORDERS[order]
+    if category and category != "all":
+        # Constant within the page, so it would only defeat the index
+        leading = tuple(key for key in leading if key is not Pobuda.category)
+    else:
+        category = None
+    keys = (*leading, Pobuda.created_at, Pobuda.id)
+    with Session(engine) as session:
+        statement = select(Pobuda, *keys).where(Pobuda.status == "v obravnavi")
+        if category:
+            statement = statement.where(Pobuda.category == category)
+        if after is not None:
+            statement = statement.where(tuple_(*keys) > tuple_(*decode_queue_cursor(after, len(keys))))
+        rows = session.exec(statement.order_by(*keys).limit(limit)).all()
+        response.headers["X-Total-Count"] = str(pending_count(session, category))
+        if len(rows) == limit:
+            response.headers["X-Next-Cursor"] = encode_queue_cursor(rows[-1][1:])
+        return [row[0] for row in rows]
+
+@router.get("/api/admin/uploads/stats")
+def get_upload_stats(token: str = Depends(verify_token)):
+    """Responses and bytes served from /uploads since startup"""
+    return upload_stats.snapshot()
+
+@router.post("/api/admin/districts/reload")
+def reload_district_boundaries(token: str = Depends(verify_token)):
+    """Pick up edited district data in app.geodata and reassign every pobuda to the new districts"""
+    with Session(engine) as session:
+        changed = reload_districts(session)
+    return {"changed": changed, "districts": len(get_districts())}
+
+@router.get("/api/admin/hotspots", response_model=List[Hotspot])
+def get_hotspots(
+    limit: int = Query(default=20, ge=1, le=100),
+    min_count: int = Query(default=1, ge=1),
+    token: str = Depends(verify_token)
+):
+    """Largest clusters of pending pobude, as last computed by the hotspot worker"""
+    with Session(engine) as session:
+        statement = (
+            select(Hotspot)
+            .where(Hotspot.count >= min_count)
+            .order_by(Hotspot.count.desc(), Hotspot.oldest_created_at.asc())
+            .limit(limit)
+        )
+        return session.exec(statement).all()
+
+@router.get("/api/admin/hotspots/{hotspot_id}/pobude", response_model=List[Pobuda])
+def get_hotspot_pobude(hotspot_id: int, token: str = Depends(verify_token)):
+    with Session(engine) as session:
+        if not session.get(Hotspot, hotspot_id):
+            raise HTTPException(status_code=404, detail="Hotspot not found")
+        statement = (
+            select(Pobuda)
+            .where(Pobuda.hotspot_id == hotspot_id, Pobuda.status == PENDING_STATUS)
+            .order_by(Pobuda.created_at.asc(), Pobuda.id.asc())
+        )
+        return session.exec(statement).all()
+
 @router.get("/api/streets/search", response_model=List[str])
 def search_streets(q: str = Query(..., min_length=2), limit: int = Query(20, ge=1, le=50)):
     query_lower = q.lower()
@@ -1965,6 +687,15 @@ def ai_prioritize_initiatives(initiatives: List[Pobuda], token: str = Depends(ve
         
         prioritized = prioritize_pobude_list_structured(pobude_for_chatgpt)
         
+        with Session(engine) as session:
+            known_ids = set(session.exec(
+                select(Pobuda.id).where(Pobuda.id.in_([item["id"] for item in prioritized]))
+            ).all())
+            updates = [{"id": item["id"], "urgency": item["nujnost"]} for item in prioritized if item["id"] in known_ids]
+            if updates:
+                session.execute(update(Pobuda), updates)
+                session.commit()
+        
         prioritized.sort(key=lambda x: x["nujnost"], reverse=True)
         return prioritized
     except Exception as e:
@@ -1973,39 +704,79 @@ def ai_prioritize_initiatives(initiatives: List[Pobuda], token: str = Depends(ve
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Error processing AI prioritization: {str(e)}")
 
+STATISTICS_WINDOWS = (7, 30, 90, 365)
+
+def _bucket_start(day, granularity):
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+def _next_bucket(bucket_start, granularity):
+    if granularity == "week":
+        return bucket_start + timedelta(days=7)
+    if granularity == "month":
+        return (bucket_start + timedelta(days=32)).replace(day=1)
+    return bucket_start + timedelta(days=1)
+
+def _bucket_expression(granularity):
+    """SQLite expression matching _bucket_start() for the rollup day column"""
+    if granularity == "week":
+        return func.date(PobudaStatsDaily.day, "-6 days", "weekday 1")
+    if granularity == "month":
+        return func.strftime("%Y-%m-01", PobudaStatsDaily.day)
+    return func.date(PobudaStatsDaily.day)
+
 @router.get("/api/admin/statistics", response_model=Statistics)
-def get_statistics(token: str = Depends(verify_token)):
+def get_statistics(
+    days: int = Query(default=30),
+    granularity: Literal["day", "week", "month"] = Query(default="day"),
+    token: str = Depends(verify_token)
+):
+    if days not in STATISTICS_WINDOWS:
+        raise HTTPException(status_code=400, detail=f"days must be one of {', '.join(map(str, STATISTICS_WINDOWS))}")
     with Session(engine) as session:
-        pobude = session.exec(select(Pobuda)).all()
-        total_pobude = len(pobude)
-        pending_pobude = sum(1 for p in pobude if p.status == "v obravnavi")
-        responded_pobude = sum(1 for p in pobude if p.status == "odgovorjeno")
+        total_pobude, pending_pobude, responded_pobude = session.exec(
+            select(
+                func.sum(PobudaStatsDaily.created_count),
+                func.sum(case((PobudaStatsDaily.status == "v obravnavi", PobudaStatsDaily.created_count), else_=0)),
+                func.sum(case((PobudaStatsDaily.status == "odgovorjeno", PobudaStatsDaily.created_count), else_=0)),
+            )
+        ).one()
         today = datetime.utcnow().date()
-        thirty_days_ago = today - timedelta(days=30)
-        daily_stats = []
-        response_stats = []
+        window_start = today - timedelta(days=days - 1)
+        bucket = _bucket_expression(granularity)
+        rows = session.exec(
+            select(
+                bucket,
+                func.sum(PobudaStatsDaily.created_count),
+                func.sum(PobudaStatsDaily.responded_count),
+            )
+            .where(PobudaStatsDaily.day >= window_start)
+            .group_by(bucket)
+        ).all()
         daily_counts = defaultdict(int)
         response_counts = defaultdict(int)
-        for pobuda in pobude:
-            created_date = pobuda.created_at.date()
-            if created_date >= thirty_days_ago:
-                daily_counts[created_date] += 1
-            if pobuda.responded_at:
-                response_date = pobuda.responded_at.date()
-                if response_date >= thirty_days_ago:
-                    response_counts[response_date] += 1
-        for i in range(30):
-            date = today - timedelta(days=i)
-            daily_stats.append({"date": date.isoformat(), "count": daily_counts[date]})
-            response_stats.append({"date": date.isoformat(), "count": response_counts[date]})
-        daily_stats.reverse()
-        response_stats.reverse()
+        for bucket_date, created_count, responded_count in rows:
+            daily_counts[bucket_date] = created_count or 0
+            response_counts[bucket_date] = responded_count or 0
+        daily_stats = []
+        response_stats = []
+        current = _bucket_start(window_start, granularity)
+        while current <= today:
+            key = current.isoformat()
+            daily_stats.append({"date": key, "count": daily_counts[key]})
+            response_stats.append({"date": key, "count": response_counts[key]})
+            current = _next_bucket(current, granularity)
         return Statistics(
-            total_pobude=total_pobude,
-            pending_pobude=pending_pobude,
-            responded_pobude=responded_pobude,
+            total_pobude=total_pobude or 0,
+            pending_pobude=pending_pobude or 0,
+            responded_pobude=responded_pobude or 0,
             daily_stats=daily_stats,
-            response_stats=response_stats
+            response_stats=response_stats,
+            days=days,
+            granularity=granularity
         )
 
 @router.post("/api/generate-random-data")
@@ -0,0 +1,122 @@
+"""
+SQLite FTS5 full-text index over pobuda title, description and location.
+
+The index is an external-content FTS5 table kept in sync with pobuda by
+triggers, tokenized with unicode61 and remove_diacritics so that
+"ceste" matches "česte" and "sola" matches "šola".
+"""
+
+import html
+import re
+from typing import Optional
+from sqlalchemy import Integer, column, func, literal_column, table, text
+
+FTS_TABLE = "pobuda_fts"
+
+pobuda_fts = table(FTS_TABLE, column("rowid", Integer))
+
+FTS_COLUMNS = ("title", "description", "location")
+
+# bm25 weights for title, description and location
+FTS_WEIGHTS = (10.0, 1.0, 5.0)
+
+# Private-use characters marking matches in raw snippets; the text around
+# them is user input, so it is escaped before the markers become <mark> tags
+SNIPPET_START = "\ue000"
+SNIPPET_END = "\ue001"
+
+_CREATE_FTS = f"""
+CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+    title, description, location,
+    content='pobuda', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+)
+"""
+
+_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON pobuda BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description, location)
+        VALUES (new.id, new.title, new.description, new.location);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON pobuda BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description, location)
+        VALUES ('delete', old.id, old.title, old.description, old.location);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description, location ON pobuda BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description, location)
+        VALUES ('delete', old.id, old.title, old.description, old.location);
+        INSERT INTO {FTS_TABLE}(rowid, title, description, location)
+        VALUES (new.id, new.title, new.description, new.location);
+    END
+    """,
+]
+
+def create_search_index(engine):
+    """Create the FTS table and triggers, populating the index on first creation"""
+    with engine.begin() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        ).first()
+        if not exists:
+            connection.execute(text(_CREATE_FTS))
+            connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        for trigger in _TRIGGERS:
+            connection.execute(text(trigger))
+
+def drop_search_index(engine):
+    drop_search_triggers(engine)
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+
+def drop_search_triggers(engine):
+    """Stop indexing pobuda writes for a bulk load; rebuild_search_index() catches up"""
+    with engine.begin() as connection:
+        for suffix in ("ai", "ad", "au"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}"))
+
+def clear_search_index(connection):
+    """Empty the index in the caller's transaction, alongside a delete of every pobuda"""
+    connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')"))
+
+def rebuild_search_index(engine):
+    """Reindex every pobuda and restore the triggers in one transaction, so searches never see a gap"""
+    with engine.begin() as connection:
+        connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        for trigger in _TRIGGERS:
+            connection.execute(text(trigger))
+
+def build_match_query(search: str) -> Optional[str]:
+    """
+    Turn free text into a safe FTS5 query of prefix terms.
+
+    Every word is quoted so FTS5 operators in user input are treated as text,
+    and the last word matches as a prefix for search-as-you-type.
+    """
+    words = re.findall(r"\w+", search)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+def match_condition(match_query: str):
+    return literal_column(FTS_TABLE).op("MATCH")(match_query)
+
+def rank_expression():
+    return func.bm25(literal_column(FTS_TABLE), *FTS_WEIGHTS)
+
+def snippet_expression(tokens: int = 12):
+    """Fragment from whichever column matched best, matches between sentinels; pass it to render_snippet()"""
+    return func.snippet(literal_column(FTS_TABLE), -1, SNIPPET_START, SNIPPET_END, "…", tokens)
+
+def render_snippet(raw: Optional[str]) -> Optional[str]:
+    """HTML-escape a snippet, then turn its sentinels into <mark> tags"""
+    if raw is None:
+        return None
+    return html.escape(raw).replace(SNIPPET_START, "<mark>").replace(SNIPPET_END, "</mark>")
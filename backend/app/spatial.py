@@ -0,0 +1,274 @@
+"""
+Spatial indexes over pobuda coordinates.
+
+pobuda_rtree is an SQLite R-tree holding one degenerate box per pobuda
+(min == max). pobuda_grid is a cluster hierarchy: per zoom level, the count
+and coordinate sums of pobude in each grid cell, split by status. Both are
+kept in sync with the pobuda table by triggers, so inserts from the API and
+from the bulk importers are indexed without extra code; imports into an
+emptied table suspend the triggers and rebuild both once at the end.
+"""
+
+import math
+import numpy as np
+from sqlalchemy import Float, Integer, and_, column, table, text
+
+LJUBLJANA_BOUNDS = {
+    "min_lat": 46.001016,
+    "max_lat": 46.145,
+    "min_lng": 14.411316,
+    "max_lng": 14.636532
+}
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE_LAT = 111320.0
+
+RTREE_TABLE = "pobuda_rtree"
+GRID_TABLE = "pobuda_grid"
+GRID_LEVELS_TABLE = "pobuda_grid_levels"
+
+# Zoom levels with precomputed clusters; above the last one the map gets points
+GRID_ZOOM_LEVELS = range(10, 17)
+
+# Grid cells per 256px tile edge, i.e. roughly 32px clusters on screen
+GRID_CELLS_PER_TILE = 8
+
+pobuda_rtree = table(
+    RTREE_TABLE,
+    column("id", Integer),
+    column("min_lat", Float),
+    column("max_lat", Float),
+    column("min_lng", Float),
+    column("max_lng", Float),
+)
+
+pobuda_grid = table(
+    GRID_TABLE,
+    column("zoom", Integer),
+    column("cell_x", Integer),
+    column("cell_y", Integer),
+    column("status"),
+    column("count", Integer),
+    column("lat_sum", Float),
+    column("lng_sum", Float),
+)
+
+def grid_cell_size(zoom: int) -> float:
+    """Cell edge in degrees; the same for latitude and longitude"""
+    return 360.0 / (2 ** zoom) / GRID_CELLS_PER_TILE
+
+def grid_cell(latitude: float, longitude: float, zoom: int):
+    """(cell_x, cell_y) truncated the same way as the SQL triggers"""
+    size = grid_cell_size(zoom)
+    return int((longitude + 180.0) / size), int((latitude + 90.0) / size)
+
+_CREATE_RTREE = f"""
+CREATE VIRTUAL TABLE {RTREE_TABLE} USING rtree(id, min_lat, max_lat, min_lng, max_lng)
+"""
+
+_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {RTREE_TABLE}_ai AFTER INSERT ON pobuda BEGIN
+        INSERT INTO {RTREE_TABLE}(id, min_lat, max_lat, min_lng, max_lng)
+        VALUES (new.id, new.latitude, new.latitude, new.longitude, new.longitude);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {RTREE_TABLE}_ad AFTER DELETE ON pobuda BEGIN
+        DELETE FROM {RTREE_TABLE} WHERE id = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {RTREE_TABLE}_au AFTER UPDATE OF latitude, longitude ON pobuda BEGIN
+        UPDATE {RTREE_TABLE}
+        SET min_lat = new.latitude, max_lat = new.latitude, min_lng = new.longitude, max_lng = new.longitude
+        WHERE id = new.id;
+    END
+    """,
+]
+
+_CREATE_GRID = [
+    f"""
+    CREATE TABLE {GRID_LEVELS_TABLE} (
+        zoom INTEGER PRIMARY KEY,
+        cell_size FLOAT NOT NULL
+    )
+    """,
+    f"""
+    CREATE TABLE {GRID_TABLE} (
+        zoom INTEGER NOT NULL,
+        cell_x INTEGER NOT NULL,
+        cell_y INTEGER NOT NULL,
+        status VARCHAR NOT NULL,
+        count INTEGER NOT NULL,
+        lat_sum FLOAT NOT NULL,
+        lng_sum FLOAT NOT NULL,
+        PRIMARY KEY (zoom, cell_x, cell_y, status)
+    )
+    """,
+]
+
+def _grid_upsert(row: str, sign: str) -> str:
+    """Add (sign '+') or remove (sign '-') the row alias `new`/`old` from every level"""
+    return f"""
+        INSERT INTO {GRID_TABLE}(zoom, cell_x, cell_y, status, count, lat_sum, lng_sum)
+        SELECT zoom,
+               CAST(({row}.longitude + 180.0) / cell_size AS INTEGER),
+               CAST(({row}.latitude + 90.0) / cell_size AS INTEGER),
+               {row}.status, {sign}1, {sign}{row}.latitude, {sign}{row}.longitude
+        FROM {GRID_LEVELS_TABLE} WHERE true
+        ON CONFLICT(zoom, cell_x, cell_y, status) DO UPDATE SET
+            count = count + excluded.count,
+            lat_sum = lat_sum + excluded.lat_sum,
+            lng_sum = lng_sum + excluded.lng_sum;
+    """
+
+def _grid_prune(row: str) -> str:
+    """Drop the emptied cells of the row alias `old`, looked up by primary key rather than scanned"""
+    return f"""
+        DELETE FROM {GRID_TABLE}
+        WHERE status = {row}.status AND count <= 0 AND (zoom, cell_x, cell_y) IN (
+            SELECT zoom,
+                   CAST(({row}.longitude + 180.0) / cell_size AS INTEGER),
+                   CAST(({row}.latitude + 90.0) / cell_size AS INTEGER)
+            FROM {GRID_LEVELS_TABLE}
+        );
+    """
+
+_GRID_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {GRID_TABLE}_ai AFTER INSERT ON pobuda BEGIN
+        {_grid_upsert("new", "+")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {GRID_TABLE}_ad AFTER DELETE ON pobuda BEGIN
+        {_grid_upsert("old", "-")}
+        {_grid_prune("old")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {GRID_TABLE}_au AFTER UPDATE OF latitude, longitude, status ON pobuda BEGIN
+        {_grid_upsert("old", "-")}
+        {_grid_upsert("new", "+")}
+        {_grid_prune("old")}
+    END
+    """,
+]
+
+_POPULATE_RTREE = f"""
+INSERT INTO {RTREE_TABLE}(id, min_lat, max_lat, min_lng, max_lng)
+SELECT id, latitude, latitude, longitude, longitude FROM pobuda
+"""
+
+_POPULATE_GRID = f"""
+INSERT INTO {GRID_TABLE}(zoom, cell_x, cell_y, status, count, lat_sum, lng_sum)
+SELECT zoom,
+       CAST((longitude + 180.0) / cell_size AS INTEGER) AS cell_x,
+       CAST((latitude + 90.0) / cell_size AS INTEGER) AS cell_y,
+       status, count(*), sum(latitude), sum(longitude)
+FROM pobuda CROSS JOIN {GRID_LEVELS_TABLE}
+GROUP BY zoom, cell_x, cell_y, status
+"""
+
+def _table_exists(connection, name):
+    return connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": name},
+    ).first() is not None
+
+def create_spatial_index(engine):
+    """Create the R-tree, the cluster grid and their triggers, populating them on first creation"""
+    with engine.begin() as connection:
+        if not _table_exists(connection, RTREE_TABLE):
+            connection.execute(text(_CREATE_RTREE))
+            connection.execute(text(_POPULATE_RTREE))
+        if not _table_exists(connection, GRID_TABLE):
+            for statement in _CREATE_GRID:
+                connection.execute(text(statement))
+            connection.execute(
+                text(f"INSERT INTO {GRID_LEVELS_TABLE}(zoom, cell_size) VALUES (:zoom, :cell_size)"),
+                [{"zoom": zoom, "cell_size": grid_cell_size(zoom)} for zoom in GRID_ZOOM_LEVELS],
+            )
+            connection.execute(text(_POPULATE_GRID))
+        _create_triggers(connection)
+
+def _create_triggers(connection):
+    # Grid triggers are replaced, not kept, so databases get the current bodies
+    for suffix in ("ai", "ad", "au"):
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {GRID_TABLE}_{suffix}"))
+    for trigger in _TRIGGERS + _GRID_TRIGGERS:
+        connection.execute(text(trigger))
+
+def drop_spatial_triggers(engine):
+    """Stop indexing pobuda writes for a bulk load; rebuild_spatial_index() catches up"""
+    with engine.begin() as connection:
+        for name in (RTREE_TABLE, GRID_TABLE):
+            for suffix in ("ai", "ad", "au"):
+                connection.execute(text(f"DROP TRIGGER IF EXISTS {name}_{suffix}"))
+
+def clear_spatial_index(connection):
+    """Empty the R-tree and grid in the caller's transaction, alongside a delete of every pobuda"""
+    connection.execute(text(f"DELETE FROM {RTREE_TABLE}"))
+    connection.execute(text(f"DELETE FROM {GRID_TABLE}"))
+
+def rebuild_spatial_index(engine):
+    """Repopulate the R-tree and grid and restore the triggers in one transaction"""
+    with engine.begin() as connection:
+        clear_spatial_index(connection)
+        connection.execute(text(_POPULATE_RTREE))
+        connection.execute(text(_POPULATE_GRID))
+        _create_triggers(connection)
+
+def drop_spatial_index(engine):
+    drop_spatial_triggers(engine)
+    with engine.begin() as connection:
+        for name in (RTREE_TABLE, GRID_TABLE, GRID_LEVELS_TABLE):
+            connection.execute(text(f"DROP TABLE IF EXISTS {name}"))
+
+def bbox_condition(min_lat: float, min_lng: float, max_lat: float, max_lng: float):
+    """
+    R-tree overlap test.
+
+    The R-tree stores 32-bit floats rounded outwards, so points up to ~1e-6
+    degrees outside the box can match; that is well below map precision.
+    """
+    return and_(
+        pobuda_rtree.c.max_lat >= min_lat,
+        pobuda_rtree.c.min_lat <= max_lat,
+        pobuda_rtree.c.max_lng >= min_lng,
+        pobuda_rtree.c.min_lng <= max_lng,
+    )
+
+def radius_bbox(latitude: float, longitude: float, radius_m: float):
+    """(min_lat, min_lng, max_lat, max_lng) enclosing a circle of radius_m"""
+    dlat = radius_m / METERS_PER_DEGREE_LAT
+    dlng = radius_m / (METERS_PER_DEGREE_LAT * max(math.cos(math.radians(latitude)), 1e-6))
+    return latitude - dlat, longitude - dlng, latitude + dlat, longitude + dlng
+
+def haversine_m(latitude: float, longitude: float, latitudes, longitudes):
+    """Great-circle distances in meters from one point to arrays of points"""
+    lat1 = math.radians(latitude)
+    lat2 = np.radians(latitudes)
+    dlat = lat2 - lat1
+    dlng = np.radians(longitudes) - math.radians(longitude)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+def in_ljubljana(latitudes, longitudes):
+    """Boolean mask of the points inside LJUBLJANA_BOUNDS"""
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    return (
+        (latitudes >= LJUBLJANA_BOUNDS["min_lat"]) & (latitudes <= LJUBLJANA_BOUNDS["max_lat"])
+        & (longitudes >= LJUBLJANA_BOUNDS["min_lng"]) & (longitudes <= LJUBLJANA_BOUNDS["max_lng"])
+    )
+
+_REFERENCE_LAT = math.radians((LJUBLJANA_BOUNDS["min_lat"] + LJUBLJANA_BOUNDS["max_lat"]) / 2)
+
+def project_m(latitudes, longitudes):
+    """Equirectangular projection to (x, y) meters, accurate enough at city scale"""
+    return np.column_stack((
+        np.asarray(longitudes, dtype=np.float64) * METERS_PER_DEGREE_LAT * math.cos(_REFERENCE_LAT),
+        np.asarray(latitudes, dtype=np.float64) * METERS_PER_DEGREE_LAT,
+    ))
@@ -1,16 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlmodel import Session, select, func
-from datetime import datetime, timedelta
-from typing import List
+from sqlalchemy import case
+from datetime import date, datetime, timedelta
+from typing import List, Optional
 import random
+import numpy as np
 from .database import get_session
-from .models import Pobuda
+from .models import Pobuda, PobudaStatsDaily
 from .categories import get_categories
+from .cache import TTLCache
+from .conditional import STATS_VERSION, check_not_modified, make_etag, table_version
+from .spatial import LJUBLJANA_BOUNDS
+from .districts import districts_version, get_districts
 
 router = APIRouter(prefix="/api/statistics", tags=["statistics"])
 
 CATEGORIES = get_categories()
 
+HEATMAP_CACHE_TTL = 60
+
+_heatmap_cache = TTLCache(maxsize=256, ttl=HEATMAP_CACHE_TTL)
+_districts_cache = TTLCache(maxsize=4, ttl=HEATMAP_CACHE_TTL)
+
 def generate_random_category_stats():
     """Generate random category statistics for demonstration"""
     stats = []
@@ -59,44 +70,49 @@ def generate_random_location_stats():
         })
     return stats
 
-@router.get("/public")
-async def get_public_statistics(session: Session = Depends(get_session)):
-    """Get public statistics for the statistics page"""
-    
-    
-    total_pobude = session.exec(select(func.count(Pobuda.id))).first() or 0
-    pending_pobude = session.exec(
-        select(func.count(Pobuda.id)).where(Pobuda.status == "v obravnavi")
-    ).first() or 0
-    responded_pobude = session.exec(
-        select(func.count(Pobuda.id)).where(Pobuda.status == "odgovorjeno")
-    ).first() or 0
-    
-    response_rate = (responded_pobude / total_pobude * 100) if total_pobude > 0 else 0
-    
-    
+STATUS_PENDING = "v obravnavi"
+STATUS_RESPONDED = "odgovorjeno"
+
+def _status_counts():
+    """Conditional aggregates over the rollup shared by all grouped queries"""
+    return (
+        func.sum(PobudaStatsDaily.created_count),
+        func.sum(case((PobudaStatsDaily.status == STATUS_RESPONDED, PobudaStatsDaily.created_count), else_=0)),
+        func.sum(case((PobudaStatsDaily.status == STATUS_PENDING, PobudaStatsDaily.created_count), else_=0)),
+    )
+
+def get_category_summary(session: Session):
+    """
+    Return (summary, category_stats) from a single category-grouped query.
+
+    The summary totals are summed over every category present in the rollup,
+    so rows with categories outside CATEGORIES are still counted.
+    """
+    responded_only = PobudaStatsDaily.status == STATUS_RESPONDED
+    rows = session.exec(
+        select(
+            PobudaStatsDaily.category,
+            *_status_counts(),
+            func.sum(case((responded_only, PobudaStatsDaily.response_days_sum), else_=0)),
+            func.sum(case((responded_only, PobudaStatsDaily.responded_count), else_=0)),
+        ).group_by(PobudaStatsDaily.category)
+    ).all()
+
+    by_category = {}
+    total_pobude = pending_pobude = responded_pobude = 0
+    response_days = answered_count = 0
+    for category, total, responded, pending, days, answered_rows in rows:
+        by_category[category] = (total, responded or 0, pending or 0)
+        total_pobude += total
+        responded_pobude += responded or 0
+        pending_pobude += pending or 0
+        response_days += days or 0
+        answered_count += answered_rows or 0
+
     category_stats = []
     for category in CATEGORIES:
-        category_total = session.exec(
-            select(func.count(Pobuda.id)).where(Pobuda.category == category)
-        ).first() or 0
-        
-        category_responded = session.exec(
-            select(func.count(Pobuda.id)).where(
-                Pobuda.category == category, 
-                Pobuda.status == "odgovorjeno"
-            )
-        ).first() or 0
-        
-        category_pending = session.exec(
-            select(func.count(Pobuda.id)).where(
-                Pobuda.category == category, 
-                Pobuda.status == "v obravnavi"
-            )
-        ).first() or 0
-        
+        category_total, category_responded, category_pending = by_category.get(category, (0, 0, 0))
         cat_response_rate = (category_responded / category_total * 100) if category_total > 0 else 0
-        
         category_stats.append({
             "category": category,
             "total": category_total,
@@ -104,98 +120,92 @@ async def get_public_statistics(session: Session = Depends(get_session)):
             "responded": category_responded,
             "response_rate": round(cat_response_rate, 1)
         })
+
+    response_rate = (responded_pobude / total_pobude * 100) if total_pobude > 0 else 0
+    average_response_time = (response_days / answered_count) if answered_count else None
+
+    summary = {
+        "total_pobude": total_pobude,
+        "pending_pobude": pending_pobude,
+        "responded_pobude": responded_pobude,
+        "response_rate": round(response_rate, 1),
+        "average_response_time": round(average_response_time, 1) if average_response_time else None
+    }
+    return summary, category_stats
+
+def get_monthly_stats(session: Session, months: int = 6):
+    """Totals per calendar month for the last `months` months, newest first"""
+    today = datetime.now().date()
+    month_keys = []
+    year, month = today.year, today.month
+    for _ in range(months):
+        month_keys.append(f"{year:04d}-{month:02d}")
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+
+    month_bucket = func.strftime("%Y-%m", PobudaStatsDaily.day)
+    total, responded, _ = _status_counts()
+    rows = session.exec(
+        select(month_bucket, total, responded)
+        .where(PobudaStatsDaily.day >= date.fromisoformat(f"{month_keys[-1]}-01"))
+        .group_by(month_bucket)
+    ).all()
+    by_month = {key: (count or 0, responded_count or 0) for key, count, responded_count in rows}
+
+    return [
+        {
+            "month": key,
+            "total": by_month.get(key, (0, 0))[0],
+            "responded": by_month.get(key, (0, 0))[1]
+        }
+        for key in month_keys
+    ]
+
+def get_location_stats(session: Session, limit: int = 10):
+    """Totals for the `limit` locations with the most pobude"""
+    total, responded, _ = _status_counts()
+    rows = session.exec(
+        select(PobudaStatsDaily.location, total, responded)
+        .group_by(PobudaStatsDaily.location)
+        .having(total > 0)
+        .order_by(total.desc())
+        .limit(limit)
+    ).all()
+    return [
+        {
+            "location": location,
+            "total": location_total,
+            "responded": location_responded or 0,
+            "pending": location_total - (location_responded or 0)
+        }
+        for location, location_total, location_responded in rows
+    ]
+
+@router.get("/public")
+async def get_public_statistics(request: Request, response: Response, session: Session = Depends(get_session)):
+    """Get public statistics for the statistics page"""
+    version = table_version(session, "pobuda", STATS_VERSION)
+    # Monthly stats are relative to today, so the day is part of the tag
+    not_modified = check_not_modified(request, response, make_etag("statistics", version, date.today()))
+    if not_modified:
+        return not_modified
     
+    summary, category_stats = get_category_summary(session)
     
-    if total_pobude == 0:
+    if summary["total_pobude"] == 0:
         category_stats = generate_random_category_stats()
         monthly_stats = generate_random_monthly_stats()
         location_stats = generate_random_location_stats()
-        average_response_time = random.uniform(2.5, 8.0)
+        summary["average_response_time"] = round(random.uniform(2.5, 8.0), 1)
     else:
-        
-        monthly_stats = []
-        for i in range(6):
-            start_date = datetime.now() - timedelta(days=30*i)
-            end_date = start_date + timedelta(days=30)
-            
-            monthly_total = session.exec(
-                select(func.count(Pobuda.id)).where(
-                    Pobuda.created_at >= start_date,
-                    Pobuda.created_at < end_date
-                )
-            ).first() or 0
-            
-            monthly_responded = session.exec(
-                select(func.count(Pobuda.id)).where(
-                    Pobuda.created_at >= start_date,
-                    Pobuda.created_at < end_date,
-                    Pobuda.status == "odgovorjeno"
-                )
-            ).first() or 0
-            
-            monthly_stats.append({
-                "month": start_date.strftime("%Y-%m"),
-                "total": monthly_total,
-                "responded": monthly_responded
-            })
-        
-        
-        location_stats = []
-        locations = session.exec(
-            select(Pobuda.location).distinct()
-        ).all()
-        
-        for location in locations[:10]:  
-            location_total = session.exec(
-                select(func.count(Pobuda.id)).where(Pobuda.location == location)
-            ).first() or 0
-            
-            location_responded = session.exec(
-                select(func.count(Pobuda.id)).where(
-                    Pobuda.location == location,
-                    Pobuda.status == "odgovorjeno"
-                )
-            ).first() or 0
-            
-            location_stats.append({
-                "location": location,
-                "total": location_total,
-                "responded": location_responded,
-                "pending": location_total - location_responded
-            })
-        
-        
-        responded_pobude_with_time = session.exec(
-            select(Pobuda).where(
-                Pobuda.status == "odgovorjeno",
-                Pobuda.responded_at.is_not(None)
-            )
-        ).all()
-        
-        if responded_pobude_with_time:
-            total_days = 0
-            for pobuda in responded_pobude_with_time:
-                if pobuda.responded_at and pobuda.created_at:
-                    days = (pobuda.responded_at - pobuda.created_at).days
-                    total_days += days
-            
-            average_response_time = total_days / len(responded_pobude_with_time)
-        else:
-            average_response_time = None
-    
+        monthly_stats = get_monthly_stats(session)
+        location_stats = get_location_stats(session)
     
     category_stats_sorted = sorted(category_stats, key=lambda x: x['response_rate'])
     most_problematic = category_stats_sorted[0] if category_stats_sorted else None
     least_problematic = category_stats_sorted[-1] if category_stats_sorted else None
     
     return {
-        "summary": {
-            "total_pobude": total_pobude,
-            "pending_pobude": pending_pobude,
-            "responded_pobude": responded_pobude,
-            "response_rate": round(response_rate, 1),
-            "average_response_time": round(average_response_time, 1) if average_response_time else None
-        },
+        "summary": summary,
         "category_stats": category_stats,
         "monthly_stats": monthly_stats,
         "location_stats": location_stats,
@@ -206,17 +216,141 @@ async def get_public_statistics(session: Session = Depends(get_session)):
 @router.get("/monthly")
 async def get_monthly_statistics(session: Session = Depends(get_session)):
     """Get monthly statistics"""
-    stats = await get_public_statistics(session)
-    return stats["monthly_stats"]
+    return get_monthly_stats(session)
 
 @router.get("/locations")
 async def get_location_statistics(session: Session = Depends(get_session)):
     """Get statistics by location"""
-    stats = await get_public_statistics(session)
-    return stats["location_stats"]
+    return get_location_stats(session)
 
 @router.get("/summary")
 async def get_summary_statistics(session: Session = Depends(get_session)):
     """Get summary statistics"""
-    stats = await get_public_statistics(session)
-    return stats["summary"] 
\ No newline at end of file
+    summary, _ = get_category_summary(session)
+    return summary
+
+def get_district_stats(session: Session):
+    """Per-district totals, response rate and median response time, keyed by district id"""
+    responded = func.sum(case((Pobuda.status == STATUS_RESPONDED, 1), else_=0))
+    counts = session.exec(
+        select(Pobuda.district_id, func.count(), responded)
+        .where(Pobuda.district_id.is_not(None))
+        .group_by(Pobuda.district_id)
+    ).all()
+
+    rows = session.exec(
+        select(Pobuda.district_id, func.julianday(Pobuda.responded_at) - func.julianday(Pobuda.created_at))
+        .where(Pobuda.district_id.is_not(None), Pobuda.status == STATUS_RESPONDED, Pobuda.responded_at.is_not(None))
+    ).all()
+    medians = {}
+    if rows:
+        ids = np.array([row[0] for row in rows])
+        days = np.array([row[1] for row in rows], dtype=np.float64)
+        order = np.lexsort((days, ids))
+        ids, days = ids[order], days[order]
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+        for district_id, group in zip(ids[starts].tolist(), np.split(days, starts[1:])):
+            medians[district_id] = round(float(np.median(group)), 1)
+
+    stats = {}
+    for district_id, total, district_responded in counts:
+        district_responded = district_responded or 0
+        stats[district_id] = {
+            "total": total,
+            "responded": district_responded,
+            "pending": total - district_responded,
+            "response_rate": round(district_responded / total * 100, 1) if total else 0,
+            "median_response_days": medians.get(district_id)
+        }
+    return stats
+
+@router.get("/districts")
+def get_district_statistics(geometry: bool = True, session: Session = Depends(get_session)):
+    """District aggregates as a GeoJSON FeatureCollection, ready for a choropleth"""
+    key = (geometry, districts_version())
+    cached = _districts_cache.get(key)
+    if cached is not None:
+        return cached
+
+    stats = get_district_stats(session)
+    empty = {"total": 0, "responded": 0, "pending": 0, "response_rate": 0, "median_response_days": None}
+    result = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "id": district["id"],
+                "geometry": {"type": "Polygon", "coordinates": [district["ring"]]} if geometry else None,
+                "properties": {"district_id": district["id"], "name": district["name"], **stats.get(district["id"], empty)}
+            }
+            for district in get_districts()
+        ]
+    }
+    _districts_cache.set(key, result)
+    return result
+
+def _gaussian_matrix(size: int, sigma: float):
+    """Row-normalised Gaussian blur operator along one grid axis"""
+    index = np.arange(size)
+    kernel = np.exp(-((index[:, None] - index[None, :]) ** 2) / (2 * sigma ** 2))
+    return kernel / kernel.sum(axis=1, keepdims=True)
+
+def compute_heatmap(latitudes, longitudes, resolution: int, sigma: float):
+    """Bin coordinates into a resolution x resolution grid over LJUBLJANA_BOUNDS"""
+    grid, _, _ = np.histogram2d(
+        latitudes,
+        longitudes,
+        bins=resolution,
+        range=[
+            [LJUBLJANA_BOUNDS["min_lat"], LJUBLJANA_BOUNDS["max_lat"]],
+            [LJUBLJANA_BOUNDS["min_lng"], LJUBLJANA_BOUNDS["max_lng"]],
+        ],
+    )
+    if sigma > 0:
+        blur = _gaussian_matrix(resolution, sigma)
+        grid = blur @ grid @ blur.T
+    return grid
+
+@router.get("/heatmap")
+def get_heatmap(
+    category: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    resolution: int = Query(default=64, ge=8, le=256),
+    sigma: float = Query(default=0, ge=0, le=10),
+    session: Session = Depends(get_session)
+):
+    """
+    Density grid of pobude over Ljubljana.
+
+    Rows run south to north and columns west to east; sigma is the optional
+    Gaussian smoothing radius in grid cells.
+    """
+    key = (category, status, date_from, date_to, resolution, sigma)
+    cached = _heatmap_cache.get(key)
+    if cached is not None:
+        return cached
+
+    statement = select(Pobuda.latitude, Pobuda.longitude)
+    if category and category != "all":
+        statement = statement.where(Pobuda.category == category)
+    if status and status != "all":
+        statement = statement.where(Pobuda.status == status)
+    if date_from:
+        statement = statement.where(Pobuda.created_at >= datetime.combine(date_from, datetime.min.time()))
+    if date_to:
+        statement = statement.where(Pobuda.created_at < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+
+    coordinates = np.array(session.exec(statement).all(), dtype=np.float64).reshape(-1, 2)
+    grid = compute_heatmap(coordinates[:, 0], coordinates[:, 1], resolution, sigma)
+
+    result = {
+        "bounds": LJUBLJANA_BOUNDS,
+        "resolution": resolution,
+        "total": int(coordinates.shape[0]),
+        "max": float(grid.max()) if grid.size else 0.0,
+        "grid": np.round(grid, 3).tolist()
+    }
+    _heatmap_cache.set(key, result)
+    return result
@@ -0,0 +1,140 @@
+"""
+Incrementally maintained statistics rollup (pobuda_stats_daily).
+
+Writers collect per-key deltas with collect_rollup() and apply them with
+apply_rollup() inside the same transaction that writes the pobude, so the
+statistics endpoints can read a few hundred pre-aggregated rows instead of
+scanning the pobuda table.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from sqlalchemy import Integer, cast, func, literal, union_all, delete
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, select
+from .conditional import STATS_VERSION, bump_version
+from .models import Pobuda, PobudaStatsDaily
+
+ROLLUP_KEY = ("day", "category", "location", "status")
+ROLLUP_VALUES = ("created_count", "responded_count", "response_days_sum")
+
+def response_days(created_at: datetime, responded_at: datetime) -> int:
+    """Whole days between creation and response, truncated like the SQL rebuild"""
+    seconds = (responded_at.replace(microsecond=0) - created_at.replace(microsecond=0)).total_seconds()
+    return int(seconds / 86400)
+
+def _sql_response_days():
+    return (
+        cast(func.strftime("%s", Pobuda.responded_at), Integer)
+        - cast(func.strftime("%s", Pobuda.created_at), Integer)
+    ) // 86400
+
+def new_rollup_deltas():
+    """Return an empty delta accumulator for collect_rollup()"""
+    return defaultdict(lambda: [0, 0, 0])
+
+def collect_rollup(deltas, pobuda, sign: int = 1):
+    """
+    Add (sign=1) or remove (sign=-1) the contribution of one pobuda.
+
+    To move a pobuda between rollup rows, collect it with sign=-1 before
+    changing it and with sign=1 afterwards.
+    """
+    created = deltas[(pobuda.created_at.date(), pobuda.category, pobuda.location, pobuda.status)]
+    created[0] += sign
+    if pobuda.responded_at:
+        responded = deltas[(pobuda.responded_at.date(), pobuda.category, pobuda.location, pobuda.status)]
+        responded[1] += sign
+        responded[2] += sign * response_days(pobuda.created_at, pobuda.responded_at)
+    return deltas
+
+def apply_rollup(session: Session, deltas):
+    """Upsert collected deltas; the caller commits"""
+    params = [
+        dict(zip(ROLLUP_KEY + ROLLUP_VALUES, key + tuple(values)))
+        for key, values in deltas.items()
+        if any(values)
+    ]
+    if not params:
+        return
+    statement = insert(PobudaStatsDaily)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(ROLLUP_KEY),
+        set_={
+            column: getattr(PobudaStatsDaily, column) + getattr(statement.excluded, column)
+            for column in ROLLUP_VALUES
+        },
+    )
+    session.execute(statement, params)
+
+def record_pobude(session: Session, pobude):
+    """Add newly inserted pobude to the rollup"""
+    deltas = new_rollup_deltas()
+    for pobuda in pobude:
+        collect_rollup(deltas, pobuda)
+    apply_rollup(session, deltas)
+
+def _rollup_from_pobuda():
+    """Select the rollup rows freshly aggregated from the pobuda table"""
+    created = select(
+        func.date(Pobuda.created_at).label("day"),
+        Pobuda.category,
+        Pobuda.location,
+        Pobuda.status,
+        literal(1).label("created"),
+        literal(0).label("responded"),
+        literal(0).label("days"),
+    )
+    responded = select(
+        func.date(Pobuda.responded_at),
+        Pobuda.category,
+        Pobuda.location,
+        Pobuda.status,
+        literal(0),
+        literal(1),
+        _sql_response_days(),
+    ).where(Pobuda.responded_at.is_not(None))
+    events = union_all(created, responded).subquery()
+    return select(
+        events.c.day,
+        events.c.category,
+        events.c.location,
+        events.c.status,
+        func.sum(events.c.created),
+        func.sum(events.c.responded),
+        func.sum(events.c.days),
+    ).group_by(events.c.day, events.c.category, events.c.location, events.c.status)
+
+def rebuild_stats_rollup(session: Session) -> int:
+    """Recompute the whole rollup from the pobuda table; the caller commits"""
+    session.execute(delete(PobudaStatsDaily))
+    session.execute(
+        insert(PobudaStatsDaily).from_select(list(ROLLUP_KEY + ROLLUP_VALUES), _rollup_from_pobuda())
+    )
+    bump_version(session, STATS_VERSION)
+    return session.exec(select(func.count()).select_from(PobudaStatsDaily)).one()
+
+def check_stats_rollup(session: Session):
+    """Return a list of (key, stored, expected) for rollup rows that drifted"""
+    expected = {
+        (str(day), category, location, status): (created, responded, days)
+        for day, category, location, status, created, responded, days in session.exec(_rollup_from_pobuda()).all()
+    }
+    stored = {
+        (str(row.day), row.category, row.location, row.status): (row.created_count, row.responded_count, row.response_days_sum)
+        for row in session.exec(select(PobudaStatsDaily)).all()
+        if row.created_count or row.responded_count or row.response_days_sum
+    }
+    drift = []
+    for key in sorted(expected.keys() | stored.keys()):
+        if stored.get(key) != expected.get(key):
+            drift.append((key, stored.get(key), expected.get(key)))
+    return drift
+
+def ensure_stats_rollup(session: Session):
+    """Build the rollup once for databases created before it existed"""
+    has_rollup = session.exec(select(PobudaStatsDaily.day).limit(1)).first() is not None
+    has_pobude = session.exec(select(Pobuda.id).limit(1)).first() is not None
+    if has_pobude and not has_rollup:
+        rebuild_stats_rollup(session)
+        session.commit()
@@ -0,0 +1,137 @@
+"""
+Storage backends for uploaded images.
+
+Uploads are content addressed: the key of an image is its SHA-256 spread
+over two directory levels (ab/cd/abcd…ef.jpg), so identical images share one
+object and no directory grows past a few hundred entries. LocalStorage keeps
+them under uploads/ for the /uploads static mount; S3Storage puts them in an
+S3-compatible bucket (MinIO, Ceph, AWS) for deployments with several nodes.
+Select the backend with UPLOAD_STORAGE=local|s3.
+"""
+
+import io
+import mimetypes
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
+
+UPLOAD_DIR = "uploads"
+UPLOAD_URL = "/uploads"
+# Local staging area for files on their way into storage
+INCOMING_DIR = os.path.join(UPLOAD_DIR, ".incoming")
+
+def blob_key(digest: str, extension: str) -> str:
+    """Sharded storage key for content with the given SHA-256 hex digest"""
+    return f"{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+def incoming_file():
+    """Open a new staging file for put(); returns (file, path)"""
+    os.makedirs(INCOMING_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=INCOMING_DIR, prefix="upload-", suffix=".part")
+    return os.fdopen(fd, "wb"), path
+
+class UploadStorage(ABC):
+    """Interface of an upload backend; keys come from blob_key()"""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def put(self, key: str, source_path: str):
+        """Move a finished local file to key; an existing key is kept and the file dropped"""
+
+    @abstractmethod
+    def open(self, key: str):
+        """Seekable binary file with the content of key"""
+
+    @abstractmethod
+    def delete(self, key: str):
+        ...
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        ...
+
+class LocalStorage(UploadStorage):
+    def __init__(self, root: str = UPLOAD_DIR, base_url: str = UPLOAD_URL):
+        self.root = root
+        self.base_url = base_url
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def put(self, key: str, source_path: str):
+        path = self.path(key)
+        if os.path.exists(path):
+            os.remove(source_path)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(source_path, path)
+
+    def open(self, key: str):
+        return open(self.path(key), "rb")
+
+    def delete(self, key: str):
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+class S3Storage(UploadStorage):
+    """S3-compatible bucket; needs boto3, credentials come from the usual AWS variables"""
+
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None, public_url: Optional[str] = None):
+        import boto3
+        from botocore.exceptions import ClientError
+
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.client_error = ClientError
+        self.bucket = bucket
+        self.public_url = (public_url or f"{endpoint_url or 'https://s3.amazonaws.com'}/{bucket}").rstrip("/")
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+        except self.client_error:
+            return False
+        return True
+
+    def put(self, key: str, source_path: str):
+        if not self.exists(key):
+            self.client.upload_file(source_path, self.bucket, key, ExtraArgs={
+                "ContentType": mimetypes.guess_type(key)[0] or "application/octet-stream",
+                "CacheControl": "public, max-age=31536000, immutable",
+            })
+        os.remove(source_path)
+
+    def open(self, key: str):
+        return io.BytesIO(self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+
+    def delete(self, key: str):
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def url(self, key: str) -> str:
+        return f"{self.public_url}/{key}"
+
+def get_storage() -> UploadStorage:
+    if os.getenv("UPLOAD_STORAGE", "local") == "s3":
+        return S3Storage(
+            os.environ["UPLOAD_S3_BUCKET"],
+            endpoint_url=os.getenv("UPLOAD_S3_ENDPOINT"),
+            public_url=os.getenv("UPLOAD_S3_PUBLIC_URL"),
+        )
+    return LocalStorage()
+
+storage = get_storage()
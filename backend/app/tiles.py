@@ -0,0 +1,226 @@
+"""
+Mapbox Vector Tile (MVT) endpoint for pobuda points.
+
+Tiles are encoded directly as protobuf (MVT spec 2.1). Up to the highest
+grid zoom a tile holds a "clusters" point layer built from the precomputed
+pobuda_grid (count, pending, responded), like /api/pobude/clusters; above it
+a "pobude" point layer with id, status and category, capped at
+TILE_FEATURE_LIMIT features per tile. Encoded tiles are kept in a bounded
+in-process cache; writes through the API evict the tiles that can show the
+changed pobuda (at cluster zooms every tile its grid cell overlaps, since
+the cell's centroid can move across a tile edge), and entries expire after
+TILE_CACHE_TTL so edits made outside the API (import scripts, manual SQL)
+show up as well.
+"""
+
+import math
+from fastapi import APIRouter, HTTPException, Response
+from sqlalchemy import case, func
+from sqlmodel import Session, select
+from .cache import TTLCache
+from .database import engine
+from .models import Pobuda
+from .spatial import GRID_ZOOM_LEVELS, bbox_condition, grid_cell, grid_cell_size, pobuda_grid, pobuda_rtree
+
+router = APIRouter(tags=["tiles"])
+
+TILE_EXTENT = 4096
+TILE_LAYER = "pobude"
+TILE_CLUSTER_LAYER = "clusters"
+# Points per tile above the highest grid zoom, where a tile spans a few hundred meters
+TILE_FEATURE_LIMIT = 4096
+MAX_TILE_ZOOM = 22
+TILE_CACHE_SIZE = 2048
+TILE_CACHE_TTL = 300
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+_tile_cache = TTLCache(maxsize=TILE_CACHE_SIZE, ttl=TILE_CACHE_TTL)
+
+def tile_bounds(z: int, x: int, y: int):
+    """(min_lat, min_lng, max_lat, max_lng) of a web mercator tile"""
+    n = 2 ** z
+
+    def lat(tile_y):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    return lat(y + 1), x / n * 360.0 - 180.0, lat(y), (x + 1) / n * 360.0 - 180.0
+
+def _mercator(latitude: float, longitude: float, z: int):
+    """Fractional tile coordinates of a point at zoom z"""
+    n = 2 ** z
+    lat_rad = math.radians(latitude)
+    tile_x = (longitude + 180.0) / 360.0 * n
+    tile_y = (1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n
+    return tile_x, tile_y
+
+def tile_for_point(latitude: float, longitude: float, z: int):
+    tile_x, tile_y = _mercator(latitude, longitude, z)
+    n = 2 ** z
+    return min(int(tile_x), n - 1), min(int(tile_y), n - 1)
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+def _field(number: int, payload: bytes) -> bytes:
+    """Length-delimited protobuf field"""
+    return _varint(number << 3 | 2) + _varint(len(payload)) + payload
+
+def _varint_field(number: int, value: int) -> bytes:
+    return _varint(number << 3) + _varint(value)
+
+def _packed(number: int, values) -> bytes:
+    return _field(number, b"".join(_varint(value) for value in values))
+
+def _value(value) -> bytes:
+    """MVT Value message: uint_value for counts, string_value otherwise"""
+    if isinstance(value, int):
+        return _varint_field(5, value)
+    return _field(1, str(value).encode())
+
+def encode_layer(name: str, keys, rows, z: int, x: int, y: int) -> bytes:
+    """Encode (id or None, latitude, longitude, values by key) rows as one MVT point layer"""
+    values = []
+    value_index = {}
+    features = []
+    for feature_id, latitude, longitude, properties in rows:
+        tags = []
+        for key_number, value in enumerate(properties):
+            if (type(value), value) not in value_index:
+                value_index[(type(value), value)] = len(values)
+                values.append(value)
+            tags += [key_number, value_index[(type(value), value)]]
+        tile_x, tile_y = _mercator(latitude, longitude, z)
+        px = round((tile_x - x) * TILE_EXTENT)
+        py = round((tile_y - y) * TILE_EXTENT)
+        features.append(
+            (_varint_field(1, feature_id) if feature_id is not None else b"")
+            + _packed(2, tags)
+            + _varint_field(3, 1)  # POINT
+            + _packed(4, [9, _zigzag(px), _zigzag(py)])  # MoveTo(1)
+        )
+    layer = (
+        _varint_field(15, 2)
+        + _field(1, name.encode())
+        + b"".join(_field(2, feature) for feature in features)
+        + b"".join(_field(3, key.encode()) for key in keys)
+        + b"".join(_field(4, _value(value)) for value in values)
+        + _varint_field(5, TILE_EXTENT)
+    )
+    return _field(3, layer)
+
+def encode_tile(rows, z: int, x: int, y: int) -> bytes:
+    """Encode (id, latitude, longitude, status, category) rows as the pobude layer"""
+    return encode_layer(
+        TILE_LAYER,
+        ["status", "category"],
+        ((pobuda_id, latitude, longitude, (status, category)) for pobuda_id, latitude, longitude, status, category in rows),
+        z, x, y
+    )
+
+def encode_cluster_tile(rows, z: int, x: int, y: int) -> bytes:
+    """Encode (latitude, longitude, count, pending, responded) rows as the clusters layer"""
+    return encode_layer(
+        TILE_CLUSTER_LAYER,
+        ["count", "pending", "responded"],
+        ((None, latitude, longitude, (count, pending, responded)) for latitude, longitude, count, pending, responded in rows),
+        z, x, y
+    )
+
+def _grid_level(z: int) -> int:
+    """Grid zoom whose cells make up the clusters of a tile at zoom z"""
+    return min(max(z, GRID_ZOOM_LEVELS[0]), GRID_ZOOM_LEVELS[-1])
+
+def _tile_clusters(session: Session, z: int, x: int, y: int):
+    """Grid clusters whose centroid lies in the tile, from the grid level closest to z"""
+    min_lat, min_lng, max_lat, max_lng = tile_bounds(z, x, y)
+    level = _grid_level(z)
+    min_x, min_y = grid_cell(min_lat, min_lng, level)
+    max_x, max_y = grid_cell(max_lat, max_lng, level)
+    total = func.sum(pobuda_grid.c.count)
+    rows = session.exec(
+        select(
+            total,
+            func.sum(pobuda_grid.c.lat_sum),
+            func.sum(pobuda_grid.c.lng_sum),
+            func.sum(case((pobuda_grid.c.status == "v obravnavi", pobuda_grid.c.count), else_=0)),
+            func.sum(case((pobuda_grid.c.status == "odgovorjeno", pobuda_grid.c.count), else_=0)),
+        )
+        .where(
+            pobuda_grid.c.zoom == level,
+            pobuda_grid.c.cell_x.between(min_x, max_x),
+            pobuda_grid.c.cell_y.between(min_y, max_y),
+        )
+        .group_by(pobuda_grid.c.cell_x, pobuda_grid.c.cell_y)
+        .having(total > 0)
+    ).all()
+    clusters = []
+    for count, lat_sum, lng_sum, pending, responded in rows:
+        latitude, longitude = lat_sum / count, lng_sum / count
+        # Cells straddle tile edges; the centroid decides which tile shows them
+        if min_lat <= latitude < max_lat and min_lng <= longitude < max_lng:
+            clusters.append((latitude, longitude, count, pending, responded))
+    return clusters
+
+def invalidate_tiles(latitude: float, longitude: float):
+    """
+    Evict every cached tile that can show the point: at cluster zooms all
+    tiles overlapping its grid cell, whose centroid the change moved, above
+    them the tile containing the point
+    """
+    for z in range(MAX_TILE_ZOOM + 1):
+        if z > GRID_ZOOM_LEVELS[-1]:
+            _tile_cache.pop((z, *tile_for_point(latitude, longitude, z)))
+            continue
+        level = _grid_level(z)
+        size = grid_cell_size(level)
+        cell_x, cell_y = grid_cell(latitude, longitude, level)
+        min_lng, min_lat = cell_x * size - 180.0, cell_y * size - 90.0
+        # Tile y grows southwards
+        min_x, min_y = tile_for_point(min(min_lat + size, 90.0), min_lng, z)
+        max_x, max_y = tile_for_point(min_lat, min(min_lng + size, 180.0), z)
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                _tile_cache.pop((z, x, y))
+
+def clear_tile_cache():
+    _tile_cache.clear()
+
+@router.get("/api/tiles/{z}/{x}/{y}.mvt")
+def get_tile(z: int, x: int, y: int):
+    if not 0 <= z <= MAX_TILE_ZOOM or not 0 <= x < 2 ** z or not 0 <= y < 2 ** z:
+        raise HTTPException(status_code=404, detail="Tile not found")
+
+    key = (z, x, y)
+    data = _tile_cache.get(key)
+    if data is None:
+        with Session(engine) as session:
+            if z <= GRID_ZOOM_LEVELS[-1]:
+                data = encode_cluster_tile(_tile_clusters(session, z, x, y), z, x, y)
+            else:
+                min_lat, min_lng, max_lat, max_lng = tile_bounds(z, x, y)
+                rows = session.exec(
+                    select(Pobuda.id, Pobuda.latitude, Pobuda.longitude, Pobuda.status, Pobuda.category)
+                    .where(Pobuda.id.in_(
+                        select(pobuda_rtree.c.id).where(bbox_condition(min_lat, min_lng, max_lat, max_lng))
+                    ))
+                    .limit(TILE_FEATURE_LIMIT)
+                ).all()
+                data = encode_tile(rows, z, x, y)
+        _tile_cache.set(key, data)
+
+    return Response(
+        content=data,
+        media_type=MVT_MEDIA_TYPE,
+        headers={"Cache-Control": f"public, max-age={TILE_CACHE_TTL}"}
+    )
@@ -0,0 +1,364 @@
+"""
+Image uploads for pobude.
+
+UploadSizeLimit rejects multipart requests larger than the upload limit
+before their body is read: at once from Content-Length, or as soon as a
+chunked body passes the limit. Starlette has spooled the rest of the body by
+the time an endpoint runs; save_upload() copies it in chunks to a temporary file, hashing it on
+the way, with every blocking read and write in the threadpool, removes its
+EXIF/XMP metadata and hands the finished file to the storage backend under
+its content hash. Size and type are checked while copying, so an oversized
+or non-image upload is rejected without ever being stored.
+
+Identical images are stored once. upload_blob counts the pobude referencing
+each stored image, and images nobody references any more are deleted. An
+upload counts its reference before its file is stored, and releasing the
+last reference deletes the file before committing, so a concurrent upload of
+the same image either keeps the file or waits and stores it again.
+
+UploadFiles serves the /uploads mount. A content-addressed file never
+changes under its name, so it is cached for a year as immutable, with its
+hash as a strong ETag; conditional and range requests are answered by
+Starlette's FileResponse, and upload_stats counts what was sent.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import threading
+from collections import Counter
+from typing import NamedTuple, Optional
+from fastapi import HTTPException, UploadFile
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.responses import FileResponse, JSONResponse
+from starlette.staticfiles import NotModifiedResponse
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, func, select
+from starlette.concurrency import run_in_threadpool
+from .database import engine
+from .models import Pobuda, UploadBlob
+from .derivatives import delete_derivatives, metadata_supported, strip_metadata
+from .storage import UPLOAD_DIR, UPLOAD_URL, blob_key, incoming_file, storage
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+# Room for the other form fields and multipart framing next to the image
+MAX_FORM_FIELDS_BYTES = 1024 * 1024
+# Flat pobuda_<timestamp><ext> files written before uploads were content addressed
+LEGACY_UPLOAD_PREFIX = "pobuda_"
+MIGRATION_BATCH = 500
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Legacy flat names could be reused, so those are always revalidated
+MUTABLE_CACHE_CONTROL = "public, no-cache"
+# ab/cd/<sha256>[_<derivative>].<ext>, as written by blob_key() and derivative_key()
+CONTENT_ADDRESSED_PATH = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{2}/(?P<name>[0-9a-f]{64}(?:_[a-z]+)?)\.[a-z0-9]+$")
+
+# Accepted image types by their leading bytes; the stored extension comes
+# from the detected type, never from the client's filename. HEIC is not
+# accepted: Pillow cannot decode it to remove metadata or build derivatives.
+IMAGE_SIGNATURES = {
+    b"\xff\xd8\xff": ".jpg",
+    b"\x89PNG\r\n\x1a\n": ".png",
+    b"GIF87a": ".gif",
+    b"GIF89a": ".gif",
+}
+
+class StoredUpload(NamedTuple):
+    key: str
+    size: int
+
+def detect_image_type(head: bytes) -> Optional[str]:
+    """Extension for the image type the first bytes belong to, or None"""
+    for signature, extension in IMAGE_SIGNATURES.items():
+        if head.startswith(signature):
+            return extension
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+def _too_large(max_bytes: int):
+    return HTTPException(status_code=413, detail=f"Image is larger than {max_bytes // (1024 * 1024)} MB")
+
+def _discard(f, path: str):
+    f.close()
+    if os.path.exists(path):
+        os.remove(path)
+
+def _finish(f, temp_path: str, digest: str, extension: str) -> StoredUpload:
+    f.flush()
+    os.fsync(f.fileno())
+    f.close()
+    # Not deferred to the derivative worker: the key is the hash of the
+    # stripped file, and the original must never be served with its GPS data
+    try:
+        stripped = strip_metadata(temp_path)
+    except Exception:
+        raise HTTPException(status_code=415, detail="Image could not be read")
+    if stripped:
+        digest, _ = _file_digest(temp_path)
+    key = blob_key(digest, extension)
+    size = os.path.getsize(temp_path)
+    with Session(engine) as session:
+        acquire_upload(session, key, size)
+        session.commit()
+    try:
+        storage.put(key, temp_path)
+    except BaseException:
+        with Session(engine) as session:
+            release_upload(session, key)
+        raise
+    return StoredUpload(key, size)
+
+async def save_upload(upload: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> StoredUpload:
+    """
+    Store an uploaded image without metadata under its content hash;
+    raises 413, 415 or 503. The upload is counted as a reference already:
+    the caller keeps it with a committed pobuda or drops it with
+    release_upload().
+    """
+    if not metadata_supported():
+        raise HTTPException(status_code=503, detail="Image uploads are unavailable")
+    if upload.size is not None and upload.size > max_bytes:
+        raise _too_large(max_bytes)
+    if upload.content_type and not upload.content_type.startswith("image/"):
+        raise HTTPException(status_code=415, detail="Only image uploads are supported")
+
+    f, temp_path = await run_in_threadpool(incoming_file)
+    try:
+        extension = None
+        written = 0
+        digest = hashlib.sha256()
+        while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+            if extension is None:
+                extension = detect_image_type(chunk)
+                if extension is None:
+                    raise HTTPException(status_code=415, detail="Unsupported image format")
+            written += len(chunk)
+            if written > max_bytes:
+                raise _too_large(max_bytes)
+            digest.update(chunk)
+            await run_in_threadpool(f.write, chunk)
+        if extension is None:
+            raise HTTPException(status_code=400, detail="Empty image upload")
+
+        return await run_in_threadpool(_finish, f, temp_path, digest.hexdigest(), extension)
+    except BaseException:
+        await run_in_threadpool(_discard, f, temp_path)
+        raise
+
+class UploadSizeLimit:
+    """ASGI middleware refusing multipart bodies over max_bytes with 413"""
+
+    def __init__(self, app, max_bytes: int = MAX_UPLOAD_BYTES + MAX_FORM_FIELDS_BYTES):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        headers = Headers(scope=scope)
+        if not headers.get("content-type", "").startswith("multipart/form-data"):
+            return await self.app(scope, receive, send)
+        content_length = headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            response = JSONResponse({"detail": _too_large(MAX_UPLOAD_BYTES).detail}, status_code=413)
+            return await response(scope, receive, send)
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # FastAPI re-raises HTTPException from body parsing unchanged
+                    raise _too_large(MAX_UPLOAD_BYTES)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+def acquire_upload(session: Session, key: str, size: int, count: int = 1):
+    """Count new references to a stored image; the caller commits"""
+    statement = insert(UploadBlob).values(key=key, size=size, refcount=count)
+    session.execute(statement.on_conflict_do_update(
+        index_elements=["key"],
+        set_={"refcount": UploadBlob.refcount + statement.excluded.refcount},
+    ))
+
+def release_upload(session: Session, key: str):
+    """Drop a reference whose pobuda was never committed, deleting the image with the last one; commits"""
+    refcount = session.execute(
+        update(UploadBlob).where(UploadBlob.key == key)
+        .values(refcount=UploadBlob.refcount - 1)
+        .returning(UploadBlob.refcount)
+    ).scalar_one_or_none()
+    if refcount is not None and refcount <= 0:
+        session.execute(delete(UploadBlob).where(UploadBlob.key == key))
+        # Deleted while the update holds the write lock: an upload of the same
+        # image counts its reference only after this commit, then stores it again
+        storage.delete(key)
+        delete_derivatives(key)
+    session.commit()
+
+def sync_upload_refcounts(session: Session):
+    """
+    Recount references from pobuda.image_path after bulk deletes, drop the
+    blobs nothing references and delete their images; commits
+    """
+    counts = dict(session.exec(
+        select(Pobuda.image_path, func.count())
+        .where(Pobuda.image_path.is_not(None))
+        .group_by(Pobuda.image_path)
+    ).all())
+    unreferenced = []
+    for blob in session.exec(select(UploadBlob)).all():
+        refcount = counts.get(storage.url(blob.key), 0)
+        if refcount == 0:
+            unreferenced.append(blob.key)
+            session.delete(blob)
+        elif refcount != blob.refcount:
+            blob.refcount = refcount
+            session.add(blob)
+    session.commit()
+    # Only after the commit, so a failed commit never loses a referenced image
+    for key in unreferenced:
+        storage.delete(key)
+        delete_derivatives(key)
+    return len(unreferenced)
+
+def _file_digest(path: str):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        head = f.read(UPLOAD_CHUNK_SIZE)
+        block = head
+        while block:
+            digest.update(block)
+            block = f.read(UPLOAD_CHUNK_SIZE)
+    return digest.hexdigest(), head
+
+def migrate_legacy_uploads(session: Session, directory: str = UPLOAD_DIR) -> int:
+    """
+    Move flat pobuda_* uploads that pobude still reference into content
+    addressed storage and repoint their image_path, removing their metadata
+    on the way when Pillow is available. Each file is copied into storage,
+    then committed, then removed, so an interrupted migration resumes where
+    it stopped. Unreferenced legacy files are left alone.
+    """
+    if not os.path.isdir(directory):
+        return 0
+    legacy = [
+        entry for entry in os.scandir(directory)
+        if entry.is_file() and entry.name.startswith(LEGACY_UPLOAD_PREFIX)
+    ]
+    migrated = 0
+    for start in range(0, len(legacy), MIGRATION_BATCH):
+        batch = {f"{UPLOAD_URL}/{entry.name}": entry for entry in legacy[start:start + MIGRATION_BATCH]}
+        referenced = session.exec(
+            select(Pobuda.image_path).where(Pobuda.image_path.in_(list(batch))).distinct()
+        ).all()
+        for url in referenced:
+            entry = batch[url]
+            f, temp_path = incoming_file()
+            with f:
+                with open(entry.path, "rb") as source:
+                    shutil.copyfileobj(source, f)
+            if metadata_supported():
+                try:
+                    strip_metadata(temp_path)
+                except Exception as e:
+                    print(f"Could not remove metadata from {entry.name}: {str(e)}")
+            digest, head = _file_digest(temp_path)
+            extension = detect_image_type(head) or os.path.splitext(entry.name)[1].lower()
+            key = blob_key(digest, extension)
+            size = os.path.getsize(temp_path)
+            storage.put(key, temp_path)
+            result = session.execute(
+                update(Pobuda).where(Pobuda.image_path == url).values(image_path=storage.url(key))
+            )
+            acquire_upload(session, key, size, result.rowcount)
+            session.commit()
+            os.remove(entry.path)
+            migrated += 1
+    return migrated
+
+class UploadStats:
+    """Thread-safe counters of /uploads responses by status and body bytes sent"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self.responses = Counter()
+            self.bytes_sent = 0
+
+    def record(self, status: int, body_bytes: int):
+        with self._lock:
+            self.responses[status] += 1
+            self.bytes_sent += body_bytes
+
+    def snapshot(self):
+        with self._lock:
+            responses = dict(self.responses)
+            bytes_sent = self.bytes_sent
+        served = sum(count for status, count in responses.items() if status in (200, 206, 304))
+        return {
+            "requests": sum(responses.values()),
+            "responses": {str(status): count for status, count in sorted(responses.items())},
+            "not_modified": responses.get(304, 0),
+            "partial": responses.get(206, 0),
+            # Share of served requests answered from the client's cache by a 304
+            "revalidation_hit_ratio": round(responses.get(304, 0) / served, 4) if served else 0.0,
+            "bytes_sent": bytes_sent,
+        }
+
+upload_stats = UploadStats()
+
+class UploadFiles(StaticFiles):
+    """StaticFiles for uploads/ with immutable caching, hash ETags and traffic counters"""
+
+    async def __call__(self, scope, receive, send):
+        status = 0
+        body_bytes = 0
+
+        async def counting_send(message):
+            nonlocal status, body_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                body_bytes = 0
+                if scope["method"] != "HEAD":
+                    # Servers with the pathsend extension never emit body messages
+                    body_bytes = int(Headers(raw=message["headers"]).get("content-length", 0))
+            await send(message)
+
+        try:
+            await super().__call__(scope, receive, counting_send)
+        except StarletteHTTPException as e:
+            status = e.status_code
+            raise
+        finally:
+            upload_stats.record(status, body_bytes)
+
+    def lookup_path(self, path: str):
+        # Staging files under .incoming are never served
+        if any(part.startswith(".") for part in path.replace("\\", "/").split("/")):
+            return "", None
+        return super().lookup_path(path)
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200):
+        relative = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        match = CONTENT_ADDRESSED_PATH.match(relative)
+        headers = {"cache-control": IMMUTABLE_CACHE_CONTROL if match else MUTABLE_CACHE_CONTROL}
+        if match:
+            headers["etag"] = f'"{match.group("name")}"'
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers)
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Recompute the pobuda_stats_daily rollup from the pobuda table.
+Run this after editing the database by hand, or with --check to only report drift.
+"""
+
+import os
+import sys
+from sqlmodel import Session
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import engine, create_tables
+from app.stats_rollup import check_stats_rollup, rebuild_stats_rollup
+
+def rebuild_stats(check_only=False):
+    create_tables()
+    with Session(engine) as session:
+        drift = check_stats_rollup(session)
+        if drift:
+            print(f"⚠️  {len(drift)} rollup rows differ from the pobuda table:")
+            for key, stored, expected in drift[:20]:
+                print(f"   {key}: stored={stored} expected={expected}")
+            if len(drift) > 20:
+                print(f"   ... and {len(drift) - 20} more")
+        else:
+            print("✅ Rollup matches the pobuda table")
+
+        if check_only:
+            return len(drift)
+
+        row_count = rebuild_stats_rollup(session)
+        session.commit()
+        print(f"✅ Rollup rebuilt with {row_count} rows")
+        return len(drift)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rebuild the statistics rollup table")
+    parser.add_argument("--check", action="store_true", help="Only report drift, do not rebuild")
+
+    args = parser.parse_args()
+
+    print("🔄 Rebuilding statistics rollup...")
+    drift_count = rebuild_stats(check_only=args.check)
+    sys.exit(1 if args.check and drift_count else 0)
@@ -1,9 +1,29 @@
 import json
+import os
+import sys
 from datetime import datetime
+import numpy as np
 from pyproj import Transformer
 import random
 
-transformer = Transformer.from_crs("EPSG:3794", "EPSG:4326", always_xy=True)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+from app.spatial import in_ljubljana
+from app.jsonstream import JsonStreamReader
+from app.manifest import record_conversion
+
+# ArcGIS reports the Slovene national grids under ESRI ids
+ESRI_TO_EPSG = {102060: 3912}
+DEFAULT_EPSG = 3794
+BATCH_SIZE = 5000
+
+_transformers = {}
+
+def get_transformer(spatial_reference):
+    wkid = (spatial_reference or {}).get("latestWkid") or (spatial_reference or {}).get("wkid") or DEFAULT_EPSG
+    epsg = ESRI_TO_EPSG.get(wkid, wkid)
+    if epsg not in _transformers:
+        _transformers[epsg] = Transformer.from_crs(f"EPSG:{epsg}", "EPSG:4326", always_xy=True)
+    return _transformers[epsg]
 
 possible_responses = [
     "Vaša pobuda je bila obravnavana in ustrezno rešena.",
@@ -63,42 +83,112 @@ category_map = {
     46: "Zapore cest"
 }
 
-def convert_pobude(input_file, output_file):
+def iter_dump(input_file):
+    """
+    Stream an ArcGIS query dump: yields (header, feature) for every feature,
+    where header holds the top-level keys seen before "features"
+    (transform, spatialReference, ...)
+    """
     with open(input_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    results = []
-    for feature in data["features"]:
-        attributes = feature["attributes"]
-        geometry = feature["geometry"]
-
-        lon, lat = transformer.transform(geometry["x"], geometry["y"])
-
-        category_id = attributes.get("MOL_VRSTE_POBUD_ID")
-        category = category_map.get(category_id, "other")
-
-        pobuda = {
-            "title": attributes.get("NASLOV_POBUDE", "Neznan naslov"),
-            "description": attributes.get("VSEBINA", ""),
-            "location": "Ljubljana",
-            "latitude": lat,
-            "longitude": lon,
-            "email": attributes.get("UPORABNIK_MOL", "unknown@example.com"),
-            "category": category,
-            "image_path": None,
-            "status": "odgovorjeno" if attributes.get("STATUS_POBUDE") == 2 else "v obravnavi",
-            "created_at": datetime.utcfromtimestamp(attributes["DATUM_VNOSA"] / 1000).isoformat(),
-            "response": random.choice(possible_responses) if attributes.get("DATUM_ZADNJEGA_ODGOVORA") else None,
-            "responded_at": datetime.utcfromtimestamp(attributes["DATUM_ZADNJEGA_ODGOVORA"] / 1000).isoformat()
-            if attributes.get("DATUM_ZADNJEGA_ODGOVORA") else None
-        }
-
-        results.append(pobuda)
+        reader = JsonStreamReader(f)
+        header = {}
+        reader.expect("{")
+        while reader.peek() != "}":
+            key = reader.value()
+            reader.expect(":")
+            if key != "features":
+                header[key] = reader.value()
+            else:
+                for feature in reader.items():
+                    yield header, feature
+            if reader.peek() == ",":
+                reader.expect(",")
+
+def dequantize(transform, x, y):
+    """Apply the ArcGIS quantization transform (scale, translate) to integer coordinates"""
+    if not transform:
+        return x, y
+    scale_x, scale_y = transform["scale"][:2]
+    translate_x, translate_y = transform["translate"][:2]
+    if transform.get("originPosition", "upperLeft") == "upperLeft":
+        return translate_x + x * scale_x, translate_y - y * scale_y
+    return translate_x + x * scale_x, translate_y + y * scale_y
+
+def to_pobuda(attributes, lat, lon):
+    # Seeded per record, so converting the same dump again yields the same file
+    rng = random.Random(attributes.get("OBJECTID"))
+    category_id = attributes.get("MOL_VRSTE_POBUD_ID")
+    category = category_map.get(category_id, "other")
 
+    return {
+        "title": attributes.get("NASLOV_POBUDE", "Neznan naslov"),
+        "description": attributes.get("VSEBINA", ""),
+        "location": "Ljubljana",
+        "latitude": lat,
+        "longitude": lon,
+        "email": attributes.get("UPORABNIK_MOL", "unknown@example.com"),
+        "category": category,
+        "image_path": None,
+        "status": "odgovorjeno" if attributes.get("STATUS_POBUDE") == 2 else "v obravnavi",
+        "created_at": datetime.utcfromtimestamp(attributes["DATUM_VNOSA"] / 1000).isoformat(),
+        "response": rng.choice(possible_responses) if attributes.get("DATUM_ZADNJEGA_ODGOVORA") else None,
+        "responded_at": datetime.utcfromtimestamp(attributes["DATUM_ZADNJEGA_ODGOVORA"] / 1000).isoformat()
+        if attributes.get("DATUM_ZADNJEGA_ODGOVORA") else None,
+        "source_id": attributes.get("OBJECTID")
+    }
+
+def convert_batch(header, batch):
+    """Dequantize and reproject a batch of features with one transform call"""
+    x = np.array([feature["geometry"]["x"] for feature in batch], dtype=np.float64)
+    y = np.array([feature["geometry"]["y"] for feature in batch], dtype=np.float64)
+    x, y = dequantize(header.get("transform"), x, y)
+    lon, lat = get_transformer(header.get("spatialReference")).transform(x, y)
+    valid = in_ljubljana(lat, lon)
+    records = [
+        to_pobuda(feature["attributes"], latitude, longitude)
+        for feature, latitude, longitude, ok in zip(batch, lat.tolist(), lon.tolist(), valid.tolist())
+        if ok
+    ]
+    return records, len(batch) - len(records)
+
+def convert_pobude(input_file, output_file):
+    converted = 0
+    skipped = 0
     with open(output_file, "w", encoding="utf-8") as out:
-        json.dump(results, out, ensure_ascii=False, indent=2)
+        out.write("[")
+
+        def write(records):
+            nonlocal converted
+            for record in records:
+                text = json.dumps(record, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+                out.write(("," if converted else "") + "\n  " + text)
+                converted += 1
+
+        batch = []
+        header = {}
+        for header, feature in iter_dump(input_file):
+            geometry = feature.get("geometry")
+            if not geometry or geometry.get("x") is None or geometry.get("y") is None:
+                skipped += 1
+                continue
+            batch.append(feature)
+            if len(batch) >= BATCH_SIZE:
+                records, rejected = convert_batch(header, batch)
+                write(records)
+                skipped += rejected
+                batch = []
+        if batch:
+            records, rejected = convert_batch(header, batch)
+            write(records)
+            skipped += rejected
+
+        out.write("\n]" if converted else "]")
+    # Lets the importer report and fingerprint the file without reading it again
+    record_conversion(output_file, converted)
 
-    print(f"Pretvorjenih {len(results)} pobud in shranjenih v {output_file}")
+    print(f"Pretvorjenih {converted} pobud in shranjenih v {output_file}")
+    if skipped:
+        print(f"Preskočenih {skipped} pobud brez koordinat ali izven Ljubljane")
 
 if __name__ == "__main__":
     convert_pobude("data1.json", "data1_converted.json")
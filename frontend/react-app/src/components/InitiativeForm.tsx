@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { createPobuda } from '../services/api';
+import { createPobuda, getNearbyPobude, NearbyPobuda } from '../services/api';
 import { useNavigate } from 'react-router-dom';
 import { searchStreets } from '../services/api';
 
@@ -45,6 +45,7 @@ const InitiativeForm: React.FC<InitiativeFormProps> = ({ selectedLocation, onCle
   const [streetOptions, setStreetOptions] = useState<string[]>([]);
   const [isSearching, setIsSearching] = useState(false);
   const [streetError, setStreetError] = useState<string | null>(null);
+  const [nearbyPobude, setNearbyPobude] = useState<NearbyPobuda[]>([]);
 
   
   useEffect(() => {
@@ -79,6 +80,11 @@ const InitiativeForm: React.FC<InitiativeFormProps> = ({ selectedLocation, onCle
         latitude: selectedLocation.latitude,
         longitude: selectedLocation.longitude
       }));
+      getNearbyPobude(selectedLocation.latitude, selectedLocation.longitude)
+        .then(setNearbyPobude)
+        .catch(() => setNearbyPobude([]));
+    } else {
+      setNearbyPobude([]);
     }
   }, [selectedLocation]);
 
@@ -199,6 +205,18 @@ const InitiativeForm: React.FC<InitiativeFormProps> = ({ selectedLocation, onCle
                 <div className="text-muted mb-2">
                   Izbrane koordinate: {formData.latitude.toFixed(6)}, {formData.longitude.toFixed(6)}
                 </div>
+                {nearbyPobude.length > 0 && (
+                  <div className="alert alert-warning" role="status">
+                    <strong>V bližini že obstajajo prijave:</strong>
+                    <ul className="mb-0">
+                      {nearbyPobude.map(pobuda => (
+                        <li key={pobuda.id}>
+                          {pobuda.title} ({Math.round(pobuda.distance)} m, {pobuda.status})
+                        </li>
+                      ))}
+                    </ul>
+                  </div>
+                )}
                 <button
                   type="button"
                   className="btn btn-outline-danger btn-sm"
@@ -311,7 +329,7 @@ const InitiativeForm: React.FC<InitiativeFormProps> = ({ selectedLocation, onCle
                     setFormData(prev => ({ ...prev, image: file }));
                     setSelectedFileName(file ? file.name : '');
                   }}
-                  accept="image/*"
+                  accept="image/jpeg,image/png,image/gif,image/webp"
                   aria-describedby="image-help"
                   disabled={isSubmitting}
                 />
@@ -1,11 +1,8 @@
 import React, { useEffect, useState } from 'react';
 import { MapContainer, TileLayer, Marker, Popup, useMapEvents, useMap } from 'react-leaflet';
-import MarkerClusterGroup from 'react-leaflet-cluster';
 import { Icon, LatLngBounds, LatLng } from 'leaflet';
-import { getPobude, Pobuda } from '../services/api';
+import { getPobudaClusters, MapBounds, Pobuda, PobudaCluster } from '../services/api';
 import 'leaflet/dist/leaflet.css';
-import 'leaflet.markercluster/dist/MarkerCluster.css';
-import 'leaflet.markercluster/dist/MarkerCluster.Default.css';
 import L from 'leaflet';
 
 const mapFocusStyles = `
@@ -82,6 +79,16 @@ const pendingIcon = new L.Icon({
     shadowSize: [41, 41]
 });
 
+const clusterIcon = (cluster: PobudaCluster) => {
+    const size = cluster.count < 10 ? 30 : cluster.count < 100 ? 40 : 50;
+    const background = cluster.pending > 0 ? 'rgba(241, 128, 23, 0.8)' : 'rgba(110, 204, 57, 0.8)';
+    return L.divIcon({
+        html: `<div style="width:${size}px;height:${size}px;line-height:${size}px;border-radius:50%;background:${background};text-align:center;font-weight:bold;">${cluster.count}</div>`,
+        className: '',
+        iconSize: [size, size],
+    });
+};
+
 interface MapViewProps {
     isSelectionMode: boolean;
     onLocationSelect?: (lat: number, lng: number) => void;
@@ -105,6 +112,42 @@ const MapBoundsHandler: React.FC = () => {
     return null;
 };
 
+const toMapBounds = (bounds: LatLngBounds): MapBounds => ({
+    minLat: bounds.getSouth(),
+    minLng: bounds.getWest(),
+    maxLat: bounds.getNorth(),
+    maxLng: bounds.getEast(),
+});
+
+const ViewportLoader = ({ onLoad }: { onLoad: (bounds: MapBounds, zoom: number) => void }) => {
+    const map = useMap();
+
+    useEffect(() => {
+        onLoad(toMapBounds(map.getBounds()), map.getZoom());
+    }, [map]);
+
+    return null;
+};
+
+const ClusterMarkers = ({ clusters }: { clusters: PobudaCluster[] }) => {
+    const map = useMap();
+
+    return (
+        <>
+            {clusters.map((cluster) => (
+                <Marker
+                    key={`${cluster.latitude},${cluster.longitude}`}
+                    position={[cluster.latitude, cluster.longitude]}
+                    icon={clusterIcon(cluster)}
+                    eventHandlers={{
+                        click: () => map.setView([cluster.latitude, cluster.longitude], map.getZoom() + 2),
+                    }}
+                />
+            ))}
+        </>
+    );
+};
+
 const MapFocus = ({ focusLocation }: { focusLocation: [number, number] | null }) => {
     const map = useMap();
 
@@ -119,25 +162,26 @@ const MapFocus = ({ focusLocation }: { focusLocation: [number, number] | null })
 
 const MapView: React.FC<MapViewProps> = ({ isSelectionMode, onLocationSelect, focusLocation }) => {
     const [pobude, setPobude] = useState<Pobuda[]>([]);
+    const [clusters, setClusters] = useState<PobudaCluster[]>([]);
     const [selectedLocation, setSelectedLocation] = useState<[number, number] | null>(null);
 
-    useEffect(() => {
-        if (!isSelectionMode) {
-            fetchPobude();
-        }
-    }, [isSelectionMode]);
-
-    const fetchPobude = async () => {
+    const fetchPobude = async (bounds: MapBounds, zoom: number) => {
         try {
-            const data = await getPobude();
-            setPobude(data);
+            const data = await getPobudaClusters(bounds, zoom);
+            setClusters(data.clusters);
+            setPobude(data.points);
         } catch (error) {
             console.error('Error fetching pobude:', error);
         }
     };
 
     const MapEvents = () => {
-        useMapEvents({
+        const map = useMapEvents({
+            moveend: () => {
+                if (!isSelectionMode) {
+                    fetchPobude(toMapBounds(map.getBounds()), map.getZoom());
+                }
+            },
             click: (e) => {
                 if (isSelectionMode && onLocationSelect) {
                     const { lat, lng } = e.latlng;
@@ -172,49 +216,44 @@ const MapView: React.FC<MapViewProps> = ({ isSelectionMode, onLocationSelect, fo
                     url="https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png"
                 />
                 <MapEvents />
+                {!isSelectionMode && <ViewportLoader onLoad={fetchPobude} />}
                 <MapFocus focusLocation={focusLocation || null} />
 
-                <MarkerClusterGroup
-                    chunkedLoading
-                    maxClusterRadius={50}
-                    spiderfyOnMaxZoom={true}
-                    showCoverageOnHover={false}
-                >
-                    {pobude.map((pobuda) => {
-                        if (
-                            typeof pobuda.latitude !== 'number' || 
-                            typeof pobuda.longitude !== 'number' ||
-                            isNaN(pobuda.latitude) || 
-                            isNaN(pobuda.longitude)
-                        ) {
-                            return null;
-                        }
-
-                        return (
-                            <Marker
-                                key={pobuda.id}
-                                position={[pobuda.latitude, pobuda.longitude]}
-                                icon={pobuda.status === 'odgovorjeno' ? answeredIcon : pendingIcon}
-                            >
-                                <Popup>
-                                    <div className="popup-content" tabIndex={-1}>
-                                        <h3 className="h6">{pobuda.title}</h3>
-                                        <p className="text-muted mb-2">
-                                            <small>{pobuda.location}</small>
-                                        </p>
-                                        <p className="mb-2">{pobuda.description.substring(0, 100)}...</p>
-                                        <span 
-                                            className={`badge bg-${pobuda.status === 'v obravnavi' ? 'warning' : 'success'}`}
-                                            aria-label={`Status: ${pobuda.status}`}
-                                        >
-                                            {pobuda.status}
-                                        </span>
-                                    </div>
-                                </Popup>
-                            </Marker>
-                        );
-                    })}
-                </MarkerClusterGroup>
+                <ClusterMarkers clusters={clusters} />
+                {pobude.map((pobuda) => {
+                    if (
+                        typeof pobuda.latitude !== 'number' || 
+                        typeof pobuda.longitude !== 'number' ||
+                        isNaN(pobuda.latitude) || 
+                        isNaN(pobuda.longitude)
+                    ) {
+                        return null;
+                    }
+
+                    return (
+                        <Marker
+                            key={pobuda.id}
+                            position={[pobuda.latitude, pobuda.longitude]}
+                            icon={pobuda.status === 'odgovorjeno' ? answeredIcon : pendingIcon}
+                        >
+                            <Popup>
+                                <div className="popup-content" tabIndex={-1}>
+                                    <h3 className="h6">{pobuda.title}</h3>
+                                    <p className="text-muted mb-2">
+                                        <small>{pobuda.location}</small>
+                                    </p>
+                                    <p className="mb-2">{pobuda.description.substring(0, 100)}...</p>
+                                    <span 
+                                        className={`badge bg-${pobuda.status === 'v obravnavi' ? 'warning' : 'success'}`}
+                                        aria-label={`Status: ${pobuda.status}`}
+                                    >
+                                        {pobuda.status}
+                                    </span>
+                                </div>
+                            </Popup>
+                        </Marker>
+                    );
+                })}
 
                 {isSelectionMode && selectedLocation && (
                     <Marker
@@ -46,6 +46,7 @@ const AdminPage = () => {
   const [searchTerm, setSearchTerm] = useState('');
   const [pageSize] = useState<number>(20);
   const [offset, setOffset] = useState<number>(0);
+  const [queueCursor, setQueueCursor] = useState<string | null>(null);
   const [hasMore, setHasMore] = useState<boolean>(true);
   const [noResults, setNoResults] = useState<boolean>(false);
   const [autoFillFetches, setAutoFillFetches] = useState<number>(0);
@@ -72,6 +73,7 @@ const AdminPage = () => {
   
   useEffect(() => {
     setOffset(0);
+    setQueueCursor(null);
     setPobude([]);
     setHasMore(true);
     setNoResults(false);
@@ -82,6 +84,7 @@ const AdminPage = () => {
   
   useEffect(() => {
     setOffset(0);
+    setQueueCursor(null);
     setPobude([]);
     setHasMore(true);
     setNoResults(false);
@@ -133,20 +136,26 @@ const AdminPage = () => {
       }
       
       
-      if (statusFilter === 'v obravnavi') {
-        const [pobudeData, statsData] = await Promise.all([
-          getPobude({ 
-            category: categoryFilter !== 'all' ? categoryFilter : undefined,
-            status: 'v obravnavi',
-            search: searchTerm.trim() !== '' ? searchTerm.trim() : undefined
-            
-          }),
+      if (statusFilter === 'v obravnavi' && searchTerm.trim() === '') {
+        const queueParams = new URLSearchParams({ limit: String(pageSize) });
+        if (!reset && queueCursor) queueParams.set('after', queueCursor);
+        if (categoryFilter !== 'all') queueParams.set('category', categoryFilter);
+        const [queueResponse, statsData] = await Promise.all([
+          authenticatedFetch(`/admin/queue?${queueParams}`),
           authenticatedFetch('/admin/statistics').then(res => res.json())
         ]);
-        setPobude(pobudeData);
-        setOffset(pobudeData.length);
+        const pobudeData: Pobuda[] = await queueResponse.json();
+        const nextCursor = queueResponse.headers.get('X-Next-Cursor');
+        setQueueCursor(nextCursor);
+        if (reset) {
+          setPobude(pobudeData);
+          setOffset(pobudeData.length);
+        } else {
+          setPobude(prev => [...prev, ...pobudeData]);
+          setOffset(prev => prev + pobudeData.length);
+        }
         setStatistics(statsData);
-        setHasMore(false); 
+        setHasMore(nextCursor !== null);
       } else {
         
         const nextOffset = reset ? 0 : offset;
@@ -180,7 +189,7 @@ const AdminPage = () => {
       setIsSearching(false);
       isFetchingRef.current = false;
     }
-  }, [offset, pageSize, categoryFilter, statusFilter, searchTerm]);
+  }, [offset, queueCursor, pageSize, categoryFilter, statusFilter, searchTerm]);
 
   const filterPobude = () => {
     let filtered = [...pobude];
@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import { getPobude, Pobuda, toAssetUrl } from '../services/api';
+import { getPobude, imageUrl, Pobuda } from '../services/api';
 import { Link } from 'react-router-dom';
 
 const AllInitiativesPage: React.FC = () => {
@@ -54,7 +54,8 @@ const AllInitiativesPage: React.FC = () => {
             <article className="card h-100">
               {initiative.image_path && (
                 <img 
-                  src={toAssetUrl(initiative.image_path)}
+                  src={imageUrl(initiative, 'thumb')}
+                  loading="lazy"
                   className="card-img-top"
                   alt={`Slika za pobudo: ${initiative.title}`}
                   style={{ height: '200px', objectFit: 'cover' }}
@@ -1,7 +1,7 @@
 import { useState, useEffect, useRef, useCallback } from 'react';
-import { getPobude, Pobuda } from '../services/api';
+import { getPobude, getPobudePage, Pobuda } from '../services/api';
 import MapView from '../components/MapView';
-import { toAssetUrl } from '../services/api';
+import { imageUrl } from '../services/api';
 
 const PobudePage = () => {
     const [pobude, setPobude] = useState<Pobuda[]>([]);
@@ -14,6 +14,7 @@ const PobudePage = () => {
     const [focusLocation, setFocusLocation] = useState<[number, number] | null>(null);
     const [pageSize, setPageSize] = useState<number>(20);
     const [offset, setOffset] = useState<number>(0);
+    const [cursor, setCursor] = useState<string | null>(null);
     const [hasMore, setHasMore] = useState<boolean>(true);
     const isFetchingRef = useRef<boolean>(false);
     const [noResults, setNoResults] = useState<boolean>(false);
@@ -62,6 +63,7 @@ const PobudePage = () => {
     
     useEffect(() => {
         setOffset(0);
+        setCursor(null);
         setPobude([]);
         setHasMore(true);
         setNoResults(false);
@@ -72,6 +74,7 @@ const PobudePage = () => {
     
     useEffect(() => {
         setOffset(0);
+        setCursor(null);
         setPobude([]);
         setHasMore(true);
         setNoResults(false);
@@ -121,35 +124,38 @@ const PobudePage = () => {
             }
             
             
-            if (statusFilter === 'v obravnavi') {
-                const data = await getPobude({ 
+            // Search results are ranked, so only they page by offset; the
+            // newest-first list pages by cursor and stays stable under inserts
+            let data: Pobuda[];
+            let more: boolean;
+            if (searchTerm.trim() !== '') {
+                data = await getPobude({ 
+                    limit: pageSize, 
+                    offset: reset ? 0 : offset, 
                     category: categoryFilter !== 'all' ? categoryFilter : undefined,
-                    status: 'v obravnavi',
-                    search: searchTerm.trim() !== '' ? searchTerm.trim() : undefined
-                    
+                    status: statusFilter !== 'all' ? statusFilter : undefined,
+                    search: searchTerm.trim()
                 });
+                more = data.length === pageSize;
+            } else {
+                const page = await getPobudePage({
+                    limit: pageSize,
+                    after: reset ? undefined : cursor ?? undefined,
+                    category: categoryFilter,
+                    status: statusFilter
+                });
+                data = page.items;
+                more = page.nextCursor !== null;
+                setCursor(page.nextCursor);
+            }
+            if (reset) {
                 setPobude(data);
                 setOffset(data.length);
-                setHasMore(false); 
             } else {
-                
-                const nextOffset = reset ? 0 : offset;
-                const data = await getPobude({ 
-                    limit: pageSize, 
-                    offset: nextOffset, 
-                    category: categoryFilter !== 'all' ? categoryFilter : undefined,
-                    status: statusFilter !== 'all' ? statusFilter : undefined,
-                    search: searchTerm.trim() !== '' ? searchTerm.trim() : undefined
-                });
-                if (reset) {
-                    setPobude(data);
-                    setOffset(data.length);
-                } else {
-                    setPobude(prev => [...prev, ...data]);
-                    setOffset(prev => prev + data.length);
-                }
-                setHasMore(data.length === pageSize);
+                setPobude(prev => [...prev, ...data]);
+                setOffset(prev => prev + data.length);
             }
+            setHasMore(more);
         } catch (err) {
             setError(err instanceof Error ? err.message : 'Failed to fetch pobude');
         } finally {
@@ -158,7 +164,7 @@ const PobudePage = () => {
             setIsSearching(false);
             isFetchingRef.current = false;
         }
-    }, [offset, pageSize, categoryFilter, statusFilter, searchTerm]);
+    }, [offset, cursor, pageSize, categoryFilter, statusFilter, searchTerm]);
 
     const filterAndSortPobude = () => {
         let filtered = [...pobude];
@@ -352,6 +358,10 @@ const PobudePage = () => {
                                     <div>
                                         <h2 className="mb-1 h6">{pobuda.title}</h2>
                                         <small className="text-muted">{pobuda.location}</small>
+                                        {pobuda.snippet && (
+                                            // The API escapes the snippet; only its <mark> tags are markup
+                                            <p className="mb-0 small" dangerouslySetInnerHTML={{ __html: pobuda.snippet }} />
+                                        )}
                                     </div>
                                     <div className="text-end">
                                         <span 
@@ -415,7 +425,7 @@ const PobudePage = () => {
                                     <div className="mb-3">
                                         <h3 className="h6">Slika</h3>
                                         <img
-                                            src={toAssetUrl(selectedPobuda.image_path)}
+                                            src={imageUrl(selectedPobuda, 'medium')}
                                             alt={`Slika za ${selectedPobuda.title}`}
                                             className="img-fluid rounded"
                                         />
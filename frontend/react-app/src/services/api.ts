@@ -1,6 +1,6 @@
 const API_BASE_URL = import.meta.env.VITE_API_URL;
 export const API_ORIGIN = API_BASE_URL.replace(/\/?api\/?$/, '');
-export const toAssetUrl = (path: string): string => `${API_ORIGIN}${path}`;
+export const toAssetUrl = (path: string): string => (/^https?:\/\//.test(path) ? path : `${API_ORIGIN}${path}`);
 
 export interface Pobuda {
   id: number;
@@ -11,13 +11,20 @@ export interface Pobuda {
   longitude: number;
   email: string;
   image_path?: string;
+  image_variants?: Record<string, Record<string, string>>;
   status: string;
   created_at: string;
   category: string;
   response?: string;
   responded_at?: string;
+  // Search results only: HTML-escaped fragment with matches in <mark> tags
+  snippet?: string;
 }
 
+// Resized WebP of the image when the server has made one, else the original
+export const imageUrl = (pobuda: Pick<Pobuda, 'image_path' | 'image_variants'>, size: 'thumb' | 'medium'): string =>
+  toAssetUrl(pobuda.image_variants?.[size]?.webp ?? pobuda.image_path ?? '');
+
 export const createPobuda = async (formData: FormData): Promise<Pobuda> => {
   const response = await fetch(`${API_BASE_URL}/pobude`, {
     method: 'POST',
@@ -48,6 +55,68 @@ export const getPobude = async (params?: { limit?: number; offset?: number; cate
   return response.json();
 };
 
+export const getPobudePage = async (params: { limit?: number; after?: string; category?: string; status?: string }): Promise<{ items: Pobuda[]; nextCursor: string | null }> => {
+  const query = new URLSearchParams();
+  query.set('limit', String(params.limit ?? 20));
+  if (params.after !== undefined) query.set('after', params.after);
+  if (params.category !== undefined && params.category !== 'all') query.set('category', params.category);
+  if (params.status !== undefined && params.status !== 'all') query.set('status', params.status);
+  const response = await fetch(`${API_BASE_URL}/pobude?${query}`);
+
+  if (!response.ok) {
+    throw new Error('Failed to fetch pobude');
+  }
+
+  return { items: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
+};
+
+export interface MapBounds {
+  minLat: number;
+  minLng: number;
+  maxLat: number;
+  maxLng: number;
+}
+
+export interface PobudaCluster {
+  latitude: number;
+  longitude: number;
+  count: number;
+  pending: number;
+  responded: number;
+}
+
+export const getPobudaClusters = async (bounds: MapBounds, zoom: number): Promise<{ zoom: number; clusters: PobudaCluster[]; points: Pobuda[] }> => {
+  const query = new URLSearchParams({
+    minLat: String(bounds.minLat),
+    minLng: String(bounds.minLng),
+    maxLat: String(bounds.maxLat),
+    maxLng: String(bounds.maxLng),
+    zoom: String(zoom),
+  });
+  const response = await fetch(`${API_BASE_URL}/pobude/clusters?${query}`);
+
+  if (!response.ok) {
+    throw new Error('Failed to fetch pobude');
+  }
+
+  return response.json();
+};
+
+export interface NearbyPobuda extends Pobuda {
+  distance: number;
+}
+
+export const getNearbyPobude = async (lat: number, lng: number, radius: number = 150, k: number = 5): Promise<NearbyPobuda[]> => {
+  const query = new URLSearchParams({ lat: String(lat), lng: String(lng), radius: String(radius), k: String(k) });
+  const response = await fetch(`${API_BASE_URL}/pobude/nearby?${query}`);
+
+  if (!response.ok) {
+    throw new Error('Failed to fetch nearby pobude');
+  }
+
+  return response.json();
+};
+
 export const getPobuda = async (id: number): Promise<Pobuda> => {
   const response = await fetch(`${API_BASE_URL}/pobude/${id}`);
 